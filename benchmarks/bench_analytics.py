@@ -0,0 +1,105 @@
+"""
+Benchmark de las estadísticas de conversaciones: en memoria contra una pasada.
+
+Compara el cálculo anterior (juntar todos los mensajes, agruparlos por
+chat, ordenarlos y calcular percentiles exactos) con
+ConversationAggregator, que recorre los mensajes una vez y guarda las
+latencias en histogramas combinables. Informa tiempo, pico de memoria y
+el error de los percentiles. Los mensajes se generan localmente (sin red).
+
+Uso:
+    python benchmarks/bench_analytics.py [cantidad_de_mensajes]
+"""
+
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+from wasapaso.analytics import ConversationAggregator
+from wasapaso.models.records import MessageRecord
+
+ME = "5491199999999@c.us"
+START = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+
+def generate(count, chats=5_000, seed=1):
+    """Mensajes en orden cronológico con conversaciones alternadas."""
+    rng = random.Random(seed)
+    now = START
+    for i in range(count):
+        now += rng.randint(0, 2_000)
+        chat = f"54911{rng.randrange(chats):08d}@c.us"
+        from_me = rng.random() < 0.45
+        yield MessageRecord(
+            f"id_{i}",
+            "64abc123",
+            f"msg_{i}",
+            ME if from_me else chat,
+            chat if from_me else ME,
+            None,
+            "text" if i % 5 else "image",
+            now,
+            from_me,
+        )
+
+
+def in_memory(messages):
+    """Cálculo anterior: todo en memoria y percentiles exactos."""
+    messages = list(messages)
+    by_chat = defaultdict(list)
+    for m in messages:
+        by_chat[m.to if m.from_me else m.from_].append(m)
+    latencies = []
+    for chat_messages in by_chat.values():
+        chat_messages.sort(key=lambda m: m.timestamp)
+        pending = None
+        for m in chat_messages:
+            if not m.from_me and pending is None:
+                pending = m.timestamp
+            elif m.from_me and pending is not None:
+                latencies.append((m.timestamp - pending) / 1000)
+                pending = None
+    Counter(m.type for m in messages)
+    Counter(m.timestamp // 3_600_000 for m in messages)
+    return statistics.quantiles(latencies, n=100)
+
+
+def streaming(messages):
+    """ConversationAggregator en una pasada."""
+    aggregator = ConversationAggregator()
+    aggregator.update(messages)
+    histogram = aggregator.result().response_times
+    return [histogram.quantile(q / 100) for q in range(1, 100)]
+
+
+def measure(func, count):
+    """Devuelve (resultado, segundos, pico de memoria en MB), en corridas separadas."""
+    start = time.perf_counter()
+    result = func(generate(count))
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(generate(count))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    exact, memory_s, memory_mb = measure(in_memory, count)
+    estimated, stream_s, stream_mb = measure(streaming, count)
+    error = max(abs(e - x) / x for e, x in zip(estimated, exact) if x)
+
+    print(f"{count:,} mensajes")
+    print(f"{'método':<24} {'segundos':>10} {'pico (MB)':>12}")
+    print(f"{'en memoria (exacto)':<24} {memory_s:>10.2f} {memory_mb:>12.1f}")
+    print(f"{'ConversationAggregator':<24} {stream_s:>10.2f} {stream_mb:>12.1f}")
+    print(f"p50 {estimated[49]:.1f}s  p90 {estimated[89]:.1f}s  p99 {estimated[98]:.1f}s")
+    print(f"error relativo máximo de los percentiles: {error:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark del archivo local de mensajes.
+
+Mide la inserción masiva (transacciones de batch_size filas contra una
+transacción por fila) y la latencia de las consultas indexadas por chat,
+por from_me y de get(). No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_archive.py [cantidad_de_mensajes]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from wasapaso.archive import MessageArchive
+from wasapaso.models.message import Message
+
+CHATS = 500
+
+
+def make_message(i):
+    """Mensaje tal como lo devuelve la API."""
+    own, chat = "5491100000000@c.us", f"54911{i % CHATS:08d}@c.us"
+    return Message(
+        **{
+            "id": f"65f{i:021x}",
+            "sessionId": "64abc123def456",
+            "messageId": f"true_54911{i % CHATS:08d}@c.us_3EB0{i:016X}",
+            "from": own if i % 2 == 0 else chat,
+            "to": chat if i % 2 == 0 else own,
+            "body": f"Mensaje número {i}",
+            "type": "text",
+            "timestamp": f"2024-01-{1 + i // 86_400 % 28:02d}T00:00:00.000Z",
+            "fromMe": i % 2 == 0,
+        }
+    )
+
+
+def measure(func, repeat=200):
+    """Devuelve los milisegundos por llamada."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    messages = [make_message(i) for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        sample = messages[:2000]
+        with MessageArchive(os.path.join(directory, "rows.db"), batch_size=1) as archive:
+            start = time.perf_counter()
+            archive.add(sample)
+            per_row = len(sample) / (time.perf_counter() - start)
+
+        with MessageArchive(os.path.join(directory, "batch.db")) as archive:
+            start = time.perf_counter()
+            archive.add(messages)
+            batched = count / (time.perf_counter() - start)
+
+            print(f"inserción, una transacción por fila   {per_row:12,.0f} mensajes/s")
+            print(
+                f"inserción, lotes de {archive.batch_size} filas       {batched:12,.0f} mensajes/s"
+            )
+
+            chat = f"54911{7:08d}@c.us"
+            queries = [
+                ("query(chat_id=..., limit=50)", lambda: archive.query("64abc123def456", chat)),
+                (
+                    "query(from_me=False, limit=50)",
+                    lambda: archive.query("64abc123def456", None, False),
+                ),
+                ("get(id)", lambda: archive.get(messages[count // 2].id)),
+                ("get(message_id)", lambda: archive.get(messages[count // 3].message_id)),
+            ]
+            for label, query in queries:
+                print(f"{label:<36} {measure(query):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark del coste de CPU por mensaje en un envío masivo.
+
+Compara el camino de send_text() (TextMessage + model_dump + json.dumps,
+que es lo que hace httpx con ``json=``) con el cuerpo pre-serializado de
+PreparedTextMessage. No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_broadcast.py [cantidad_de_mensajes]
+"""
+
+import json
+import sys
+import time
+
+from wasapaso.broadcast import PreparedTextMessage
+from wasapaso.models.message import TextMessage
+
+SESSION_ID = "64abc123def456"
+MESSAGE = "Hola! Tenemos una promo especial para vos este fin de semana. 🎉"
+
+
+def current_path(recipients):
+    """Cuerpo construido como en send_text()."""
+    for to in recipients:
+        msg = TextMessage(sessionId=SESSION_ID, to=to, message=MESSAGE)
+        payload = msg.model_dump(by_alias=True, exclude_none=True)
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def prepared_path(recipients):
+    """Cuerpo pre-serializado con el destinatario insertado."""
+    prepared = PreparedTextMessage(SESSION_ID, MESSAGE)
+    for to in recipients:
+        prepared.render(to)
+
+
+def measure(func, recipients):
+    """Devuelve los microsegundos por mensaje."""
+    start = time.perf_counter()
+    func(recipients)
+    return (time.perf_counter() - start) / len(recipients) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    recipients = [str(5491100000000 + i) for i in range(count)]
+
+    current = measure(current_path, recipients)
+    prepared = measure(prepared_path, recipients)
+
+    print(f"Mensajes: {count}")
+    print(f"send_text (pydantic + json): {current:8.2f} µs/mensaje")
+    print(f"PreparedTextMessage:         {prepared:8.2f} µs/mensaje")
+    print(f"Aceleración:                 {current / prepared:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark del coste de una página profunda: offset contra cursor.
+
+Simula el servidor con un índice ordenado por (timestamp, id): una
+consulta por offset tiene que recorrer las filas salteadas, mientras que
+una consulta por cursor (before/beforeId, como la que usa
+iter_cursor()) busca la posición en el índice. No realiza peticiones de
+red.
+
+Uso:
+    python benchmarks/bench_cursor.py [cantidad_de_filas]
+"""
+
+import bisect
+import itertools
+import sys
+import time
+
+from wasapaso.pagination import MessageCursor
+
+PAGE = 50
+
+
+def by_offset(rows, offset):
+    """Página por offset: salta las primeras filas una a una."""
+    return list(itertools.islice(iter(rows), offset, offset + PAGE))
+
+
+def by_cursor(keys, rows, cursor):
+    """Página por cursor: busca la posición en el índice."""
+    start = bisect.bisect_right(keys, cursor) if cursor else 0
+    return rows[start : start + PAGE]
+
+
+def measure(func, repeat=20):
+    """Devuelve los microsegundos por consulta."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    # Índice descendente guardado como claves negadas para usar bisect
+    rows = [MessageCursor(1_700_000_000_000 - i * 500, f"id_{i}") for i in range(total)]
+    keys = [(-row.timestamp, row.id) for row in rows]
+
+    print(f"{'offset':>10} {'por offset':>14} {'por cursor':>14}")
+    for offset in (0, total // 10, total // 2, total - PAGE):
+        cursor = rows[offset - 1] if offset else None
+        key = (-cursor.timestamp, cursor.id) if cursor else None
+        assert by_cursor(keys, rows, key) == by_offset(rows, offset)
+        offset_us = measure(lambda: by_offset(rows, offset))
+        cursor_us = measure(lambda: by_cursor(keys, rows, key))
+        print(f"{offset:>10} {offset_us:11.1f} µs {cursor_us:11.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
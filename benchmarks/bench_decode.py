@@ -0,0 +1,122 @@
+"""
+Benchmark del coste de decodificar respuestas de la API.
+
+Para sessions.list, messages.list y messages.get compara el camino
+anterior (json.loads + Modelo(**dict)), la validación directa desde los
+bytes con TypeAdapters cacheados y, como referencia, json.loads +
+model_construct sin validar (con pydantic 2 resulta más lento que la
+validación desde bytes). No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_decode.py [cantidad_de_filas]
+"""
+
+import json
+import sys
+import time
+
+from wasapaso._parsing import parse_data, parse_model
+from wasapaso.models.message import Message, MessageList
+from wasapaso.models.session import Session, SessionList
+
+
+def make_message(i):
+    """Mensaje tal como lo devuelve la API."""
+    return {
+        "id": f"65f{i:021x}",
+        "sessionId": "64abc123def456",
+        "messageId": f"true_54911{i % 50:08d}@c.us_3EB0{i:016X}",
+        "from": "5491100000000@c.us",
+        "to": f"54911{i % 50:08d}@c.us",
+        "body": f"Mensaje número {i}",
+        "type": "text",
+        "timestamp": "2024-01-15T12:34:56.789Z",
+        "fromMe": i % 2 == 0,
+    }
+
+
+def make_session(i):
+    """Sesión tal como la devuelve la API."""
+    return {
+        "id": f"64abc{i:019x}",
+        "name": f"Sesión {i}",
+        "sessionName": f"session_{i}",
+        "status": "WORKING",
+        "messageCount": i,
+        "webhookEvents": ["message", "session.status"],
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "updatedAt": "2024-01-02T00:00:00.000Z",
+    }
+
+
+def measure(func, content, repeat):
+    """Devuelve los microsegundos por decodificación."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(content)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def construct_page(model, item_model):
+    """Construye una respuesta paginada sin validar."""
+
+    def build(content):
+        response = json.loads(content)
+        data = [item_model.model_construct(**item) for item in response["data"]]
+        return model.model_construct(data=data, pagination=response["pagination"])
+
+    return build
+
+
+def report(name, content, legacy, parse, construct, repeat):
+    """Imprime la comparación de los tres caminos para un endpoint."""
+    times = [
+        measure(legacy, content, repeat),
+        measure(parse, content, repeat),
+        measure(construct, content, repeat),
+    ]
+    print(f"{name} ({len(content)} bytes)")
+    for label, value in zip(("dict + Modelo(**)", "validate_json", "model_construct"), times):
+        print(f"  {label:<18} {value:10.1f} µs  {times[0] / value:5.1f}x")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = max(1, 20_000 // rows)
+
+    sessions = json.dumps(
+        {"data": [make_session(i) for i in range(rows)], "pagination": {"total": rows}}
+    ).encode()
+    messages = json.dumps(
+        {"data": [make_message(i) for i in range(rows)], "pagination": {"total": rows}}
+    ).encode()
+    message = json.dumps({"success": True, "data": make_message(1)}).encode()
+
+    report(
+        "sessions.list",
+        sessions,
+        lambda c: SessionList(**json.loads(c)),
+        lambda c: parse_model(c, SessionList),
+        construct_page(SessionList, Session),
+        repeat,
+    )
+    report(
+        "messages.list",
+        messages,
+        lambda c: MessageList(**json.loads(c)),
+        lambda c: parse_model(c, MessageList),
+        construct_page(MessageList, Message),
+        repeat,
+    )
+    report(
+        "messages.get",
+        message,
+        lambda c: Message(**json.loads(c)["data"]),
+        lambda c: parse_data(c, Message),
+        lambda c: Message.model_construct(**json.loads(c)["data"]),
+        repeat * rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark de la exportación de mensajes: filas por segundo y memoria.
+
+Compara el volcado que se hacía para el data warehouse (juntar todos los
+mensajes en una lista y escribir un único JSON) con la exportación en
+streaming de wasapaso.export a NDJSON, NDJSON con gzip y Parquet (si
+pyarrow está instalado). Los mensajes se generan en memoria y no se
+realizan peticiones de red.
+
+Uso:
+    python benchmarks/bench_export.py [cantidad_de_mensajes]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from wasapaso.export import export_messages
+from wasapaso.models import Message
+
+
+def generate(count):
+    """Genera mensajes validados de a uno."""
+    for i in range(count):
+        yield Message.model_validate(
+            {
+                "id": f"65f0a1{i:018d}",
+                "sessionId": "64abc123def456",
+                "messageId": f"false_5491100000000@c.us_3EB0{i:016X}",
+                "from": f"54911{i % 500:08d}@c.us",
+                "to": "5491199999999@c.us",
+                "body": f"Hola, este es el mensaje número {i} de la conversación",
+                "type": "text",
+                "timestamp": f"2024-01-{1 + i % 28:02d}T12:{i % 60:02d}:00.000Z",
+                "fromMe": i % 2 == 0,
+            }
+        )
+
+
+def dump_all(messages, path):
+    """Volcado anterior: toda la historia en memoria y un único JSON."""
+    data = [m.model_dump(mode="json", by_alias=True) for m in messages]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return len(data)
+
+
+def measure(label, func, count, path):
+    """Mide filas por segundo, pico de memoria y tamaño del archivo."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = func(generate(count), path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert rows == count
+    size = os.path.getsize(path) / 1e6
+    print(f"{label:<22} {rows / elapsed:>12,.0f} {peak / 1e6:>12.1f} {size:>10.1f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    try:
+        import pyarrow  # noqa: F401
+
+        parquet = True
+    except ImportError:
+        parquet = False
+
+    print(f"{count:,} mensajes")
+    print(f"{'formato':<22} {'filas/s':>12} {'pico (MB)':>12} {'MB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        measure("JSON en memoria", dump_all, count, os.path.join(directory, "all.json"))
+        measure("NDJSON", export_messages, count, os.path.join(directory, "m.ndjson"))
+        measure("NDJSON gzip", export_messages, count, os.path.join(directory, "m.ndjson.gz"))
+        if parquet:
+            measure("Parquet zstd", export_messages, count, os.path.join(directory, "m.parquet"))
+        else:
+            print("Parquet: pyarrow no está instalado (pip install 'wasapaso[arrow]')")
+
+
+if __name__ == "__main__":
+    main()
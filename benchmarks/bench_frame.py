@@ -0,0 +1,96 @@
+"""
+Benchmark de MessageFrame contra modelos pydantic convertidos fila por fila.
+
+Mide, sobre páginas ya decodificadas de la API (sin red):
+
+- construir un DataFrame validando cada mensaje con pydantic y pasando
+  las filas a pandas, como en los notebooks de análisis;
+- construir un MessageFrame directamente desde las páginas y convertirlo;
+- filtrar por chat, tipo y rango de fechas con listas de Python contra
+  las máscaras vectorizadas del frame.
+
+Requiere numpy y pandas (``pip install "wasapaso[analytics]"``).
+
+Uso:
+    python benchmarks/bench_frame.py [cantidad_de_mensajes]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from wasapaso.archive import chat_of
+from wasapaso.frame import MessageFrame
+from wasapaso.models import Message
+
+ME = "5491199999999@c.us"
+TYPES = ["text"] * 6 + ["image", "audio", "video", "file"]
+
+
+def make_pages(count, page_size=100):
+    """Páginas de mensajes tal como llegan en ``data``."""
+    items = []
+    for i in range(count):
+        chat = f"54911{i % 2000:08d}@c.us"
+        from_me = i % 3 == 0
+        items.append(
+            {
+                "id": f"65f0a1{i:018d}",
+                "sessionId": f"64abc123def{i % 4}",
+                "messageId": f"false_{chat}_3EB0{i:016X}",
+                "from": ME if from_me else chat,
+                "to": chat if from_me else ME,
+                "body": f"Mensaje número {i}",
+                "type": TYPES[i % len(TYPES)],
+                "timestamp": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T12:{i % 60:02d}:00.000Z",
+                "fromMe": from_me,
+            }
+        )
+    return [items[i : i + page_size] for i in range(0, count, page_size)]
+
+
+def timed(func):
+    """Devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pages = make_pages(count)
+    chat = "5491100000006@c.us"
+    since = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    until = datetime(2024, 9, 1, tzinfo=timezone.utc)
+
+    def rows_to_pandas():
+        messages = [Message.model_validate(item) for page in pages for item in page]
+        return messages, pd.DataFrame([m.model_dump() for m in messages])
+
+    (messages, _), rows_s = timed(rows_to_pandas)
+    frame, build_s = timed(lambda: MessageFrame.from_pages(pages))
+    _, convert_s = timed(frame.to_pandas)
+
+    def python_filter():
+        return [
+            m
+            for m in messages
+            if chat_of(m) == chat and m.type in ("text", "image") and since <= m.timestamp < until
+        ]
+
+    selected, python_s = timed(python_filter)
+    subset, frame_s = timed(lambda: frame.filter(chat, ["text", "image"], since, until))
+    assert len(subset) == len(selected)
+
+    print(f"{count:,} mensajes")
+    print(f"pydantic fila por fila -> pandas  {rows_s * 1000:10.0f} ms")
+    print(f"MessageFrame.from_pages           {build_s * 1000:10.0f} ms")
+    print(f"MessageFrame.to_pandas            {convert_s * 1000:10.2f} ms")
+    print(f"filtro en Python                  {python_s * 1000:10.2f} ms")
+    print(f"filtro vectorizado                {frame_s * 1000:10.2f} ms  ({len(subset)} filas)")
+
+
+if __name__ == "__main__":
+    main()
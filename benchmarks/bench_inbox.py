@@ -0,0 +1,105 @@
+"""
+Benchmark de la bandeja de entrada: recalcular en cada render contra Inbox.
+
+Simula un flujo de mensajes entrantes repartidos en muchos chats y un
+render de los primeros 50 chats cada cierta cantidad de mensajes.
+Compara recalcular la bandeja en cada render (último mensaje y no leídos
+por chat, ordenando todos los chats) con Inbox, que mantiene el orden y
+los contadores a medida que llegan los mensajes. Los mensajes se generan
+localmente (sin red).
+
+Uso:
+    python benchmarks/bench_inbox.py [mensajes] [chats]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from wasapaso.archive import chat_of
+from wasapaso.inbox import Inbox
+from wasapaso.models import Message
+from wasapaso.pagination import MessageCursor
+
+ME = "5491199999999@c.us"
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+RENDER_EVERY = 100
+TOP = 50
+
+
+def generate(count, chats, seed=1):
+    """Mensajes en orden cronológico repartidos entre los chats."""
+    rng = random.Random(seed)
+    now = START
+    result = []
+    for i in range(count):
+        now += timedelta(milliseconds=rng.randint(0, 2_000))
+        chat = f"54911{rng.randrange(chats):08d}@c.us"
+        from_me = rng.random() < 0.3
+        result.append(
+            Message(
+                id=f"id_{i}",
+                session_id="64abc123",
+                message_id=f"msg_{i}",
+                from_=ME if from_me else chat,
+                to=chat if from_me else ME,
+                body="hola",
+                type="text",
+                timestamp=now,
+                from_me=from_me,
+            )
+        )
+    return result
+
+
+def recompute(messages):
+    """Recalcula la bandeja completa en cada render."""
+    seen = []
+    for i, message in enumerate(messages, 1):
+        seen.append(message)
+        if i % RENDER_EVERY:
+            continue
+        latest, unread = {}, {}
+        for m in seen:
+            chat = chat_of(m)
+            latest[chat] = m
+            unread[chat] = 0 if m.from_me else unread.get(chat, 0) + 1
+        ranked = sorted(latest.items(), key=lambda item: MessageCursor.of(item[1]), reverse=True)
+        [(chat, m, unread[chat]) for chat, m in ranked[:TOP]]
+
+
+def incremental(messages):
+    """Inbox: actualiza al llegar cada mensaje y sólo lee los primeros al renderizar."""
+    inbox = Inbox()
+    for i, message in enumerate(messages, 1):
+        inbox.add([message])
+        if not i % RENDER_EVERY:
+            inbox.list(limit=TOP)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    chats = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    messages = generate(count, chats)
+
+    print(f"{count:,} mensajes, {chats:,} chats, render cada {RENDER_EVERY} mensajes")
+    print(f"{'método':<24} {'segundos':>10} {'ms por render':>14}")
+    renders = count // RENDER_EVERY
+    for name, func in (("recalcular", recompute), ("Inbox", incremental)):
+        start = time.perf_counter()
+        func(messages)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} {elapsed:>10.2f} {elapsed / renders * 1000:>14.3f}")
+
+    inbox = Inbox()
+    inbox.add(messages)
+    start = time.perf_counter()
+    for _ in range(1_000):
+        inbox.list(limit=TOP)
+    listing = (time.perf_counter() - start) / 1_000
+    print(f"Inbox.list(limit={TOP}) con {len(inbox):,} chats: {listing * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
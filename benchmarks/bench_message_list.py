@@ -0,0 +1,73 @@
+"""
+Benchmark de memoria y velocidad al listar mensajes.
+
+Compara MessageList (un modelo pydantic Message por fila) con el modo
+liviano de messages.list(lite=True) sobre la misma respuesta ya
+decodificada. No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_message_list.py [cantidad_de_mensajes]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from wasapaso.models.message import MessageList
+from wasapaso.models.records import message_record_list
+
+
+def make_response(count):
+    """Respuesta simulada con pocas conversaciones y muchos mensajes."""
+    data = []
+    for i in range(count):
+        contact = f"54911{i % 50:08d}@c.us"
+        from_me = i % 3 == 0
+        data.append(
+            {
+                "id": f"65f{i:021x}",
+                "sessionId": "64abc123def456",
+                "messageId": f"true_{contact}_3EB0{i:016X}",
+                "from": "5491100000000@c.us" if from_me else contact,
+                "to": contact if from_me else "5491100000000@c.us",
+                "body": f"Mensaje número {i}",
+                "type": "text",
+                "timestamp": f"2024-01-{1 + i % 28:02d}T12:{i % 60:02d}:00.000Z",
+                "fromMe": from_me,
+            }
+        )
+    return {"data": data, "pagination": {"total": count, "limit": count, "offset": 0}}
+
+
+def measure(func, response):
+    """Devuelve (segundos, bytes retenidos por el resultado)."""
+    start = time.perf_counter()
+    func(response)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func(response)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    response = make_response(count)
+
+    models_time, models_memory = measure(lambda r: MessageList(**r), response)
+    lite_time, lite_memory = measure(message_record_list, response)
+
+    print(f"Mensajes: {count}")
+    print(f"MessageList:       {models_time:6.3f} s  {models_memory / 2**20:8.1f} MiB")
+    print(f"lite=True:         {lite_time:6.3f} s  {lite_memory / 2**20:8.1f} MiB")
+    print(
+        f"Mejora:            {models_time / lite_time:6.1f}x  "
+        f"{models_memory / lite_memory:8.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
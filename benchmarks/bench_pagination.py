@@ -0,0 +1,95 @@
+"""
+Benchmark del recorrido de un listado completo con iter_pages.
+
+Simula una API con latencia fija por petición y un coste por byte, y un
+consumidor que procesa cada elemento. Compara el bucle manual con
+tamaño fijo (una página después de otra) contra iter_pages con prefetch
+y tamaño de página adaptativo, y la descarga paralela por offsets de
+fetch_history(). No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_pagination.py [cantidad_de_elementos]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from wasapaso.pagination import MAX_PAGE_SIZE, PageSizer, iter_pages, merge_unique, partition
+
+LATENCY = 0.02  # segundos por petición
+PER_ITEM = 0.0001  # segundos de transferencia por elemento
+ITEM_BYTES = 400
+PROCESS = 0.0001  # segundos de procesamiento por elemento
+
+
+def make_fetch(total, counter):
+    """Crea una API simulada con `total` elementos."""
+
+    def fetch(offset, limit):
+        counter.append(limit)
+        items = list(range(offset, min(offset + limit, total)))
+        time.sleep(LATENCY + PER_ITEM * len(items))
+        return items, ITEM_BYTES * len(items)
+
+    return fetch
+
+
+def manual(total, limit=50):
+    """Bucle de paginación manual, sin prefetch."""
+    calls = []
+    fetch = make_fetch(total, calls)
+    offset = 0
+    while True:
+        items, _ = fetch(offset, limit)
+        time.sleep(PROCESS * len(items))
+        offset += len(items)
+        if len(items) < limit:
+            return len(calls)
+
+
+def automatic(total, prefetch):
+    """Recorrido con iter_pages."""
+    calls = []
+    pages = iter_pages(make_fetch(total, calls), PageSizer(initial=50), prefetch=prefetch)
+    for page in pages:
+        time.sleep(PROCESS * len(page))
+    return len(calls)
+
+
+def parallel(total, concurrency):
+    """Descarga por offsets en paralelo, como fetch_history()."""
+    calls = []
+    fetch = make_fetch(total, calls)
+    pages = [fetch(0, MAX_PAGE_SIZE)[0]]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = executor.map(
+            lambda offset: fetch(offset, MAX_PAGE_SIZE)[0],
+            partition(total, MAX_PAGE_SIZE, MAX_PAGE_SIZE),
+        )
+        pages.extend(results)
+    items, _ = merge_unique(pages, key=lambda item: item)
+    assert len(items) == total
+    return len(calls)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    runs = [
+        ("manual (limit=50)", lambda: manual(total)),
+        ("iter_pages sin prefetch", lambda: automatic(total, False)),
+        ("iter_pages con prefetch", lambda: automatic(total, True)),
+        ("paralelo (4 peticiones)", lambda: parallel(total, 4)),
+        ("paralelo (8 peticiones)", lambda: parallel(total, 8)),
+    ]
+    baseline = None
+    for label, run in runs:
+        start = time.perf_counter()
+        calls = run()
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{label:<26} {elapsed:7.3f} s  {calls:4d} peticiones  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark de construcción de payloads de send_text, send_media y send_location.
+
+Compara el camino con modelos pydantic (modelo + model_dump) con los
+builders de wasapaso._payloads. No realiza peticiones de red.
+
+Uso:
+    python benchmarks/bench_payloads.py [cantidad_de_llamadas]
+"""
+
+import sys
+import time
+
+from wasapaso._payloads import location_payload, media_payload, text_payload
+from wasapaso.models.message import (
+    Location,
+    LocationMessage,
+    MediaContent,
+    MediaMessage,
+    MessageType,
+    TextMessage,
+)
+
+SESSION_ID = "64abc123def456"
+TO = "5491100000000"
+
+
+def text_models():
+    """Payload construido con modelos pydantic."""
+    msg = TextMessage(sessionId=SESSION_ID, to=TO, message="Hola!", replyTo=None)
+    return msg.model_dump(by_alias=True, exclude_none=True)
+
+
+def media_models():
+    """Payload construido con modelos pydantic."""
+    media = MediaContent(url="https://example.com/a.jpg", mimetype="image/jpeg")
+    msg = MediaMessage(
+        sessionId=SESSION_ID, to=TO, type=MessageType("image"), media=media, caption="Mira"
+    )
+    return msg.model_dump(by_alias=True, exclude_none=True)
+
+
+def location_models():
+    """Payload construido con modelos pydantic."""
+    location = Location(latitude=40.7128, longitude=-74.006, title="Nueva York")
+    msg = LocationMessage(sessionId=SESSION_ID, to=TO, location=location)
+    return msg.model_dump(by_alias=True, exclude_none=True)
+
+
+def text_fast():
+    """Payload construido con los builders."""
+    return text_payload(SESSION_ID, TO, "Hola!")
+
+
+def media_fast():
+    """Payload construido con los builders."""
+    return media_payload(
+        SESSION_ID, TO, "image", media_url="https://example.com/a.jpg", caption="Mira"
+    )
+
+
+def location_fast():
+    """Payload construido con los builders."""
+    return location_payload(SESSION_ID, TO, 40.7128, -74.006, "Nueva York")
+
+
+def calls_per_second(func, count):
+    """Devuelve las llamadas por segundo."""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Llamadas: {count}")
+    for name, models, fast in (
+        ("send_text", text_models, text_fast),
+        ("send_media", media_models, media_fast),
+        ("send_location", location_models, location_fast),
+    ):
+        before = calls_per_second(models, count)
+        after = calls_per_second(fast, count)
+        print(
+            f"{name:<14} modelos: {before:>10,.0f}/s  builders: {after:>11,.0f}/s  "
+            f"{after / before:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark de la búsqueda de texto completo del archivo local.
+
+Carga N mensajes sintéticos (por defecto 10 millones) en un
+MessageArchive en disco y mide la latencia de search() por palabras,
+prefijo, frase y filtrada por chat, contra el recorrido lineal que
+filtra ``Message.body`` en Python sobre una muestra. La carga inserta
+las filas directamente con SQL (los triggers mantienen el índice igual
+que con add()) para no medir la validación de pydantic. No realiza
+peticiones de red.
+
+Uso:
+    python benchmarks/bench_search.py [cantidad_de_mensajes]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from wasapaso.archive import _UPSERT, MessageArchive
+
+CHATS = 10_000
+COMMON = ["hola", "gracias", "pedido", "envío", "pago", "factura", "consulta", "precio"]
+RARE = ["reembolso", "garantía", "devolución", "cancelación", "transferencia"]
+
+
+def make_vocabulary(rng, size=20_000):
+    """Palabras sintéticas con la distribución habitual: pocas frecuentes y muchas raras."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size)}
+    return sorted(words)
+
+
+def make_rows(count, rng, vocabulary):
+    """Genera las filas de la tabla messages."""
+    for i in range(count):
+        words = rng.choices(vocabulary, k=rng.randint(3, 15))
+        words.insert(rng.randrange(len(words)), rng.choice(COMMON))
+        if i % 1000 == 0:
+            words.append(rng.choice(RARE))
+        body = " ".join(words)
+        chat = f"54911{i % CHATS:08d}@c.us"
+        message_id = f"65f{i:021x}"
+        timestamp = 1_700_000_000_000 + i * 1000
+        data = json.dumps(
+            {
+                "id": message_id,
+                "sessionId": "64abc123def456",
+                "messageId": f"msg_{i}",
+                "from": "5491100000000@c.us",
+                "to": chat,
+                "body": body,
+                "type": "text",
+                "timestamp": timestamp,
+                "fromMe": True,
+            }
+        )
+        yield (message_id, f"msg_{i}", "64abc123def456", chat, 1, timestamp, body, data)
+
+
+def measure(func, repeat=20):
+    """Devuelve los milisegundos por llamada (mediana)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(rng)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with MessageArchive(os.path.join(directory, "search.db")) as archive:
+            start = time.perf_counter()
+            rows = make_rows(count, rng, vocabulary)
+            conn = archive._conn
+            while True:
+                batch = [row for _, row in zip(range(50_000), rows)]
+                if not batch:
+                    break
+                with conn:
+                    conn.executemany(_UPSERT, batch)
+            print(f"{count:,} mensajes cargados en {time.perf_counter() - start:.1f} s")
+
+            word = vocabulary[len(vocabulary) // 2]
+            chat = f"54911{7:08d}@c.us"
+            queries = [
+                ("palabra rara (recent, 50)", lambda: archive.search("reembolso", order="recent")),
+                ("palabra rara (rank, 50)", lambda: archive.search("reembolso")),
+                ("palabra común (recent, 50)", lambda: archive.search("factura", order="recent")),
+                ("palabra sintética", lambda: archive.search(word)),
+                ("prefijo 'reemb'", lambda: archive.search("reemb", mode="prefix")),
+                ("frase", lambda: archive.search(f"pago {word}", mode="phrase")),
+                ("común + chat", lambda: archive.search("factura", chat_id=chat, limit=20)),
+            ]
+            for label, query in queries:
+                print(f"  {label:<28} {measure(query):9.2f} ms")
+
+            sample = archive.query("64abc123def456", limit=100_000)
+            start = time.perf_counter()
+            matches = [m for m in sample if m.body and "reembolso" in m.body]
+            scan = (time.perf_counter() - start) * 1000
+            print(
+                f"  {'filtro en Python (100k)':<28} {scan:9.2f} ms"
+                f"  ({len(matches)} coincidencias, sin contar la descarga)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark de la reconstrucción de hilos: messages.get en cadena contra ThreadIndex.
+
+Simula una API con latencia fija por petición y un archivo que sólo tiene
+el último mensaje de cada hilo. Compara subir por cada cadena con una
+petición tras otra (el enfoque anterior), completar las cadenas con
+ThreadIndex.resolve_missing() (una ronda de peticiones en paralelo por
+nivel) y, ya indexadas, responder ThreadIndex.chain() sin red.
+
+Uso:
+    python benchmarks/bench_threads.py [hilos] [profundidad]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from wasapaso.archive import MessageArchive
+from wasapaso.exceptions import NotFoundError
+from wasapaso.models import Message
+from wasapaso.threads import ThreadIndex
+
+LATENCY = 0.005
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class SimulatedMessages:
+    """messages.get() con latencia de red simulada."""
+
+    def __init__(self, messages):
+        self.messages = {message.id: message for message in messages}
+        self.requests = 0
+
+    def get(self, message_id):
+        self.requests += 1
+        time.sleep(LATENCY)
+        if message_id not in self.messages:
+            raise NotFoundError("Message not found")
+        return self.messages[message_id]
+
+
+class SimulatedClient:
+    """Cliente con sólo el recurso de mensajes simulado."""
+
+    def __init__(self, messages):
+        self.messages = SimulatedMessages(messages)
+
+
+def generate(threads, depth):
+    """Hilos lineales: cada mensaje responde al anterior del mismo hilo."""
+    messages = []
+    for t in range(threads):
+        for d in range(depth):
+            messages.append(
+                Message(
+                    id=f"t{t}_{d}",
+                    session_id="64abc123",
+                    message_id=f"msg_t{t}_{d}",
+                    from_="5491100000001@c.us",
+                    to="5491199999999@c.us",
+                    body=f"Mensaje {d}",
+                    type="text",
+                    timestamp=START + timedelta(seconds=t * depth + d),
+                    from_me=bool(d % 2),
+                    reply_to=f"t{t}_{d - 1}" if d else None,
+                )
+            )
+    return messages
+
+
+def sequential(client, leaves):
+    """Enfoque anterior: messages.get() por cada mensaje de cada cadena."""
+    for leaf in leaves:
+        message = leaf
+        while message.reply_to is not None:
+            message = client.messages.get(message.reply_to)
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    messages = generate(threads, depth)
+    leaves = messages[depth - 1 :: depth]
+
+    print(f"{threads} hilos de {depth} mensajes, {LATENCY * 1000:.0f} ms por petición")
+    print(f"{'método':<32} {'segundos':>10} {'peticiones':>11}")
+
+    client = SimulatedClient(messages)
+    start = time.perf_counter()
+    sequential(client, leaves)
+    elapsed = time.perf_counter() - start
+    print(f"{'messages.get() en cadena':<32} {elapsed:>10.2f} {client.messages.requests:>11}")
+
+    with MessageArchive() as archive:
+        archive.add(leaves)
+        client = SimulatedClient(messages)
+        index = ThreadIndex(archive, client=client, concurrency=8)
+        start = time.perf_counter()
+        index.resolve_missing([leaf.id for leaf in leaves])
+        elapsed = time.perf_counter() - start
+        requests = client.messages.requests
+        print(f"{'resolve_missing() (8 a la vez)':<32} {elapsed:>10.2f} {requests:>11}")
+
+        start = time.perf_counter()
+        for leaf in leaves:
+            assert len(index.chain(leaf.id)) == depth
+        elapsed = time.perf_counter() - start
+        print(f"{'ThreadIndex.chain() (local)':<32} {elapsed:>10.3f} {0:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark de la línea de tiempo unificada: juntar y ordenar contra merge de k vías.
+
+Compara el enfoque anterior (descargar todas las páginas de todas las
+fuentes, juntarlas y ordenarlas) con amerge_pages, que une las fuentes
+con un heap y sólo tiene en memoria la página en curso y la pedida por
+adelantado de cada fuente. Cada página simula la latencia de la API con
+asyncio.sleep. Informa el tiempo hasta el primer mensaje, el total y el
+pico de memoria. Los mensajes se generan localmente (sin red).
+
+Uso:
+    python benchmarks/bench_timeline.py [fuentes] [mensajes_por_fuente]
+"""
+
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+
+from wasapaso.models.records import MessageRecord
+from wasapaso.pagination import amerge_pages
+
+PAGE_SIZE = 100
+LATENCY = 0.005
+START = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+
+def key(record):
+    """Clave de orden de la línea de tiempo."""
+    return (record.timestamp, record.id)
+
+
+async def source(index, count, seed):
+    """Páginas de una sesión, de la más reciente a la más antigua."""
+    rng = random.Random(seed + index)
+    now = START + count * 1_000
+    page = []
+    for i in range(count):
+        now -= rng.randint(1, 2_000)
+        page.append(
+            MessageRecord(
+                f"s{index}_{i}",
+                f"s{index}",
+                f"msg_{i}",
+                "a@c.us",
+                "b@c.us",
+                "x" * 200,
+                "text",
+                now,
+                False,
+            )
+        )
+        if len(page) == PAGE_SIZE:
+            await asyncio.sleep(LATENCY)
+            yield page
+            page = []
+    if page:
+        await asyncio.sleep(LATENCY)
+        yield page
+
+
+async def collect_all(sources, count):
+    """Enfoque anterior: descargar todo en paralelo y ordenar."""
+
+    async def drain(index):
+        return [item async for page in source(index, count, 1) for item in page]
+
+    start = time.perf_counter()
+    chunks = await asyncio.gather(*(drain(i) for i in range(sources)))
+    merged = sorted((item for chunk in chunks for item in chunk), key=key, reverse=True)
+    first = time.perf_counter() - start
+    total = 0
+    for _ in merged:
+        total += 1
+    return total, first, time.perf_counter() - start
+
+
+async def heap_merge(sources, count):
+    """amerge_pages: una página por adelantado por fuente."""
+    start = time.perf_counter()
+    first = None
+    total = 0
+    pages = [source(i, count, 1) for i in range(sources)]
+    async for _ in amerge_pages(pages, key=key, reverse=True):
+        if first is None:
+            first = time.perf_counter() - start
+        total += 1
+    return total, first, time.perf_counter() - start
+
+
+def measure(func, sources, count):
+    """Devuelve (mensajes, primer mensaje, segundos, pico de memoria en MB)."""
+    total, first, elapsed = asyncio.run(func(sources, count))
+    tracemalloc.start()
+    asyncio.run(func(sources, count))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, first, elapsed, peak / 1e6
+
+
+def main():
+    sources = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 4_000
+
+    print(f"{sources} fuentes x {count:,} mensajes, páginas de {PAGE_SIZE}")
+    print(f"{'método':<20} {'primero (s)':>12} {'total (s)':>10} {'pico (MB)':>10}")
+    for name, func in (("juntar y ordenar", collect_all), ("amerge_pages", heap_merge)):
+        total, first, elapsed, peak = measure(func, sources, count)
+        assert total == sources * count
+        print(f"{name:<20} {first:>12.3f} {elapsed:>10.2f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 """Configuración global de pytest y fixtures compartidos."""
 
 import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Callable, Dict, Generator, Optional
 
 import pytest
 from wasapaso import WasapasoClient
@@ -112,6 +113,52 @@ def session_ids_to_cleanup() -> Generator[list[str], None, None]:
             pass
 
 
+@pytest.fixture
+def make_message() -> Callable[..., Dict[str, Any]]:
+    """
+    Fixture con una fábrica de mensajes tal como los devuelve la API.
+
+    ``make_message(index)`` arma el mensaje ``index`` (``id_{index}``,
+    ``msg_{index}``, cuerpo ``Mensaje {index}``) recibido del chat
+    ``5491100000000@c.us`` por ``5491199999999@c.us`` en la sesión
+    ``64abc123`` el 2024-01-01 a las 00:00 UTC. ``chat``, ``from_me``,
+    ``session_id`` y ``me`` cambian los participantes, ``seconds`` se suma
+    a la fecha y ``fields`` reemplaza o agrega campos con su nombre en la
+    API (``body``, ``replyTo``...).
+
+    Uso:
+        def test_example(make_message):
+            item = make_message(1, from_me=True, seconds=60, replyTo="msg_0")
+    """
+
+    def make(
+        index: Any,
+        chat: str = "5491100000000@c.us",
+        from_me: bool = False,
+        seconds: float = 0,
+        *,
+        session_id: str = "64abc123",
+        me: str = "5491199999999@c.us",
+        **fields: Any,
+    ) -> Dict[str, Any]:
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+        item = {
+            "id": f"id_{index}",
+            "sessionId": session_id,
+            "messageId": f"msg_{index}",
+            "from": me if from_me else chat,
+            "to": chat if from_me else me,
+            "body": f"Mensaje {index}",
+            "type": "text",
+            "timestamp": moment.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "fromMe": from_me,
+        }
+        item.update(fields)
+        return item
+
+    return make
+
+
 @pytest.fixture
 def mock_session_response():
     """Fixture con respuesta simulada de sesión para tests unitarios."""
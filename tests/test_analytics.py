@@ -0,0 +1,187 @@
+"""Tests para las estadísticas de conversaciones."""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+from wasapaso.analytics import ConversationAggregator, ConversationStats, LatencyHistogram
+from wasapaso.models import Message
+from wasapaso.models.records import message_records
+
+SESSION = "64abc123"
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def conversation(make_message):
+    """Dos chats intercalados en orden cronológico.
+
+    Chat A: recibidos en 0 y 10, respuestas en 60 y 70, recibido en 100,
+    respuesta en 400 -> latencias 60 y 300.
+    Chat B: recibido en 5, respuesta en 3605, recibido sin responder en 7200
+    -> latencia 3600.
+    """
+    a, b = "5491100000001@c.us", "5491100000002@c.us"
+    events = [
+        (a, False, 0),
+        (b, False, 5),
+        (a, False, 10),
+        (a, True, 60),
+        (a, True, 70),
+        (a, False, 100),
+        (a, True, 400),
+        (b, True, 3605),
+        (b, False, 7200),
+    ]
+    items = [
+        make_message(i, chat, from_me, seconds, type="image" if i == 3 else "text")
+        for i, (chat, from_me, seconds) in enumerate(events)
+    ]
+    return [Message.model_validate(item) for item in items]
+
+
+def test_histogram_quantiles_within_accuracy():
+    """Test de que los cuantiles respetan el error relativo."""
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(3, 1.5) for _ in range(10_000))
+    histogram = LatencyHistogram(relative_accuracy=0.01)
+    for value in values:
+        histogram.record(value)
+
+    for q in (0.0, 0.1, 0.5, 0.9, 0.99, 1.0):
+        exact = values[int(q * (len(values) - 1))]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.01)
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+    assert len(histogram.buckets) < 1_000
+
+
+def test_histogram_merge_and_zero():
+    """Test de que combinar histogramas equivale a registrar todo en uno."""
+    left, right, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in (0.0, 1.5, 3.0):
+        left.record(value)
+        both.record(value)
+    for value in (2.0, 250.0):
+        right.record(value)
+        both.record(value)
+
+    assert left.merge(right) == both
+    assert both.quantile(0) == 0.0
+    assert both.quantile(1) == 250.0
+    assert LatencyHistogram().quantile(0.5) is None
+    with pytest.raises(ValueError):
+        both.merge(LatencyHistogram(relative_accuracy=0.05))
+    with pytest.raises(ValueError):
+        both.quantile(1.5)
+
+
+def test_aggregator_counts(conversation):
+    """Test de las cantidades por chat, tipo, hora y dirección."""
+    aggregator = ConversationAggregator()
+    aggregator.update(conversation)
+    stats = aggregator.result()
+
+    assert stats.total == 9
+    assert (stats.inbound, stats.outbound) == (5, 4)
+    assert stats.outbound_ratio == pytest.approx(4 / 9)
+    assert stats.by_type == {"text": 8, "image": 1}
+    assert stats.by_chat[SESSION]["5491100000001@c.us"].total == 6
+    assert stats.by_chat[SESSION]["5491100000002@c.us"].inbound == 2
+    hour = int(BASE.timestamp() * 1000)
+    assert stats.by_hour == {hour: 7, hour + 3_600_000: 1, hour + 7_200_000: 1}
+    assert stats.hour_of_day[:3] == [7, 1, 1]
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_aggregator_first_response_latency(order, conversation):
+    """Test de la latencia de primera respuesta en ambos órdenes."""
+    messages = conversation
+    if order == "desc":
+        messages.reverse()
+
+    aggregator = ConversationAggregator(order=order)
+    aggregator.update(messages)
+    stats = aggregator.result()
+
+    latencies = stats.by_chat[SESSION]["5491100000001@c.us"].response_times
+    assert latencies.count == 2
+    assert (latencies.min, latencies.max) == (60.0, 300.0)
+    assert stats.response_times.count == 3
+    assert stats.response_times.max == 3600.0
+
+
+def test_aggregator_continues_previous_run(make_message, conversation):
+    """Test de que una ejecución posterior retoma los mensajes sin responder."""
+    messages = conversation
+    b = "5491100000002@c.us"
+    first = ConversationAggregator()
+    first.update(messages)
+    saved = first.result().model_dump_json()
+    assert ConversationStats.model_validate_json(saved).pending == {
+        SESSION: {b: int(BASE.timestamp() * 1000) + 7_200_000}
+    }
+
+    reply = Message.model_validate(make_message(99, b, True, 7260))
+    second = ConversationAggregator(ConversationStats.model_validate_json(saved))
+    second.update([reply])
+    stats = second.result()
+
+    assert stats.total == 10
+    assert stats.pending == {}
+    assert stats.by_chat[SESSION][b].response_times.count == 2
+    assert stats.by_chat[SESSION][b].response_times.min == 60.0
+    with pytest.raises(ValueError):
+        ConversationAggregator(ConversationStats.model_validate_json(saved), order="desc")
+
+
+def test_stats_merge_by_chat_partition(conversation):
+    """Test de que combinar procesos que reparten los chats da el mismo resultado."""
+    messages = conversation
+    whole = ConversationAggregator()
+    whole.update(messages)
+
+    parts = []
+    for chat in ("5491100000001@c.us", "5491100000002@c.us"):
+        part = ConversationAggregator()
+        part.update(m for m in messages if chat in (m.from_, m.to))
+        parts.append(part.result())
+
+    assert parts[0].merge(parts[1]) == whole.result()
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_aggregator_separates_sessions(order, make_message):
+    """Test de que el mismo chat en otra sesión es otra conversación."""
+    chat, other = "5491100000001@c.us", "64def456"
+    messages = [
+        Message.model_validate(make_message(0, chat, False, 0)),
+        Message.model_validate(make_message(1, chat, True, 30, session_id=other)),
+        Message.model_validate(make_message(2, chat, False, 40, session_id=other)),
+        Message.model_validate(make_message(3, chat, True, 100)),
+    ]
+    if order == "desc":
+        messages.reverse()
+
+    aggregator = ConversationAggregator(order=order)
+    aggregator.update(messages)
+    stats = aggregator.result()
+
+    assert stats.by_chat[SESSION][chat].total == 2
+    assert stats.by_chat[other][chat].total == 2
+    assert stats.by_chat[SESSION][chat].response_times.min == 100.0
+    assert stats.by_chat[other][chat].response_times.count == 0
+    assert stats.response_times.count == 1
+    if order == "asc":
+        assert stats.pending == {other: {chat: int(BASE.timestamp() * 1000) + 40_000}}
+
+
+def test_aggregator_accepts_records(conversation):
+    """Test de que acepta registros livianos (list(lite=True))."""
+    messages = conversation
+    records = message_records([m.model_dump(mode="json", by_alias=True) for m in messages])
+
+    from_models, from_records = ConversationAggregator(), ConversationAggregator()
+    from_models.update(messages)
+    from_records.update(records)
+
+    assert from_records.result() == from_models.result()
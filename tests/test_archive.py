@@ -0,0 +1,357 @@
+"""Tests para el archivo local de mensajes y su búsqueda de texto completo."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageArchive, NotFoundError, WasapasoClient
+from wasapaso.archive import chat_of, fts_query
+from wasapaso.models import Message, MessageList
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes de la sesión con el chat indicado; a mayor índice, más reciente."""
+
+    def make(index, chat="5491199999999@c.us", from_me=True, **fields):
+        return make_message(
+            index,
+            chat,
+            from_me,
+            seconds=index,
+            me="5491100000000@c.us",
+            id=f"id_{index:04d}",
+            **fields,
+        )
+
+    return make
+
+
+@pytest.fixture
+def archive():
+    """Archivo en memoria."""
+    with MessageArchive() as archive:
+        yield archive
+
+
+@pytest.fixture
+def archived_client(api_key, archive):
+    """Cliente con archivo local."""
+    return WasapasoClient(api_key=api_key, archive=archive)
+
+
+def test_chat_of(make_message):
+    """Test de que el chat es el otro participante de la conversación."""
+    assert chat_of(Message(**make_message(1, "chat@c.us", from_me=True))) == "chat@c.us"
+    assert chat_of(Message(**make_message(1, "chat@c.us", from_me=False))) == "chat@c.us"
+
+
+def test_add_and_query(archive, make_message):
+    """Test de consultas con filtros, orden y paginación."""
+    archive.batch_size = 7
+    chats = ["a@c.us", "b@c.us"]
+    messages = [Message(**make_message(i, chats[i % 2], from_me=i % 3 == 0)) for i in range(30)]
+
+    assert archive.add(messages) == 30
+    assert len(archive) == 30
+
+    chat_a = archive.query("64abc123", chat_id="a@c.us", limit=None)
+    assert [m.id for m in chat_a] == [f"id_{i:04d}" for i in range(28, -1, -2)]
+    assert chat_a[0] == messages[28]
+
+    received = archive.query("64abc123", from_me=False, limit=3, offset=1)
+    assert [m.id for m in received] == ["id_0028", "id_0026", "id_0025"]
+
+    since = int((BASE + timedelta(seconds=10)).timestamp() * 1000)
+    until = int((BASE + timedelta(seconds=12)).timestamp() * 1000)
+    assert [m.id for m in archive.query("64abc123", since=since, until=until)] == [
+        "id_0011",
+        "id_0010",
+    ]
+    assert archive.query("otra_sesion") == []
+
+
+def test_add_replaces_existing(archive, make_message):
+    """Test de que un mensaje archivado de nuevo se reemplaza."""
+    archive.add([Message(**make_message(1))])
+    archive.add([Message(**make_message(1, body="Editado"))])
+
+    assert len(archive) == 1
+    assert archive.get("id_0001").body == "Editado"
+
+
+def test_get_by_id_or_message_id(archive, make_message):
+    """Test de búsqueda por id y por message_id."""
+    archive.add([Message(**make_message(5))])
+
+    assert archive.get("id_0005").message_id == "msg_5"
+    assert archive.get("msg_5").id == "id_0005"
+    assert archive.get("otro") is None
+
+
+def test_get_many(archive, make_message):
+    """Test de búsqueda de varios mensajes en lote."""
+    archive.add([Message(**make_message(i)) for i in range(1200)])
+
+    found = archive.get_many(
+        ["id_0005", "msg_7", "otro", "id_0005"] + [f"msg_{i}" for i in range(600)]
+    )
+
+    assert found["id_0005"].id == "id_0005"
+    assert found["msg_7"].id == "id_0007"
+    assert "otro" not in found
+    assert len(found) == 601
+
+
+def test_scan_resumes_after_position(archive, make_message):
+    """Test de que scan() recorre en orden de archivo y retoma desde una posición."""
+    archive.batch_size = 2
+    archive.add([Message(**make_message(i)) for i in (3, 1, 2)])
+
+    rows = list(archive.scan())
+    assert [message.id for _, message in rows] == ["id_0003", "id_0001", "id_0002"]
+
+    # Reemplazar un mensaje conserva su posición
+    archive.add([Message(**make_message(1, body="Editado")), Message(**make_message(4))])
+    later = list(archive.scan(rows[-1][0]))
+    assert [message.id for _, message in later] == ["id_0004"]
+
+
+def test_remove_invalidates_pages(make_message):
+    """Test de que remove() quita el mensaje y las páginas que lo incluyen."""
+    with MessageArchive(page_ttl=60) as archive:
+        page = MessageList(data=[Message(**make_message(i)) for i in range(3)], pagination={})
+        other = MessageList(data=[Message(**make_message(10))], pagination={})
+        archive.add_page({"offset": 0}, page)
+        archive.add_page({"offset": 3}, other)
+
+        assert archive.remove("msg_1") is True
+        assert archive.remove("msg_1") is False
+        assert archive.get("id_0001") is None
+        assert len(archive) == 3
+        assert archive.get_page({"offset": 0}) is None
+        assert archive.get_page({"offset": 3}) == other
+
+
+def test_archive_persists(tmp_path, make_message):
+    """Test de que el archivo en disco se conserva entre aperturas."""
+    path = tmp_path / "messages.db"
+    with MessageArchive(path) as archive:
+        archive.add(Message(**make_message(i)) for i in range(5))
+
+    with MessageArchive(path) as reopened:
+        assert len(reopened) == 5
+        assert reopened.query("64abc123", limit=1)[0].id == "id_0004"
+
+
+@respx.mock
+def test_get_served_from_archive(archived_client, archive, make_message):
+    """Test de que get() repetido no vuelve a consultar la API."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages/id_0001").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": make_message(1)})
+    )
+
+    first = archived_client.messages.get("id_0001")
+    second = archived_client.messages.get("id_0001")
+
+    assert first == second
+    assert route.call_count == 1
+    assert archive.get("id_0001") == first
+
+
+@respx.mock
+def test_list_served_from_archive(api_key, make_message):
+    """Test de que con page_ttl una página repetida se sirve desde el archivo."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [make_message(i) for i in range(3)], "pagination": {"total": 3}},
+        )
+    )
+    client = WasapasoClient(api_key=api_key, archive=MessageArchive(page_ttl=60))
+
+    first = client.messages.list("64abc123", limit=3)
+    second = client.messages.list("64abc123", limit=3)
+    client.messages.list("64abc123", limit=3, offset=3)
+
+    assert second == first
+    assert route.call_count == 2
+    assert len(client.archive) == 3
+
+
+@respx.mock
+def test_list_pages_not_cached_by_default(archived_client, archive, make_message):
+    """Test de que sin page_ttl list() siempre consulta la API, pero archiva los mensajes."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, json={"data": [make_message(1)], "pagination": {}})
+    )
+
+    archived_client.messages.list("64abc123")
+    archived_client.messages.list("64abc123")
+
+    assert route.call_count == 2
+    assert len(archive) == 1
+
+
+@respx.mock
+def test_delete_removes_from_archive(archived_client, archive, make_message):
+    """Test de que un mensaje eliminado ya no se sirve desde el archivo."""
+    archive.add([Message(**make_message(1))])
+    respx.delete("https://api.wasapaso.com/api/v1/messages/id_0001").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+    route = respx.get("https://api.wasapaso.com/api/v1/messages/id_0001").mock(
+        return_value=httpx.Response(404, json={"message": "Message not found"})
+    )
+
+    archived_client.messages.delete("id_0001", delete_for_everyone=True)
+
+    assert archive.get("id_0001") is None
+    with pytest.raises(NotFoundError):
+        archived_client.messages.get("id_0001")
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_delete_async_failure_keeps_archive(archived_client, archive, make_message):
+    """Test de que si la API no elimina el mensaje, sigue archivado."""
+    archive.add([Message(**make_message(1))])
+    respx.delete("https://api.wasapaso.com/api/v1/messages/id_0001").mock(
+        return_value=httpx.Response(404, json={"message": "Message not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        await archived_client.messages.delete_async("id_0001")
+
+    assert archive.get("id_0001") is not None
+
+
+@respx.mock
+def test_raw_view_bypasses_archive(archived_client, archive, make_message):
+    """Test de que la vista raw no usa el archivo."""
+    archive.add([Message(**make_message(1))])
+    route = respx.get("https://api.wasapaso.com/api/v1/messages/id_0001").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": make_message(1)})
+    )
+
+    raw = archived_client.with_raw_response.messages.get("id_0001")
+
+    assert raw.status_code == 200
+    assert route.call_count == 1
+
+
+def test_client_accepts_archive_path(api_key, tmp_path):
+    """Test de que el cliente abre el archivo a partir de una ruta."""
+    client = WasapasoClient(api_key=api_key, archive=tmp_path / "messages.db")
+
+    assert isinstance(client.archive, MessageArchive)
+    assert client.messages.archive is client.archive
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_async_served_from_archive(archived_client, make_message):
+    """Test asíncrono de get() servido desde el archivo."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages/id_0002").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": make_message(2)})
+    )
+
+    await archived_client.messages.get_async("id_0002")
+    message = await archived_client.messages.get_async("id_0002")
+
+    assert message.id == "id_0002"
+    assert route.call_count == 1
+
+
+@pytest.fixture
+def make_text_message(make_message):
+    """Fábrica de mensajes con un texto dado."""
+
+    def make(index, body, chat="a@c.us"):
+        return Message(**make_message(index, chat, body=body))
+
+    return make
+
+
+@pytest.fixture
+def searchable(archive, make_text_message):
+    """Archivo con mensajes de soporte."""
+    archive.add(
+        [
+            make_text_message(1, "Hola, necesito la factura de marzo"),
+            make_text_message(2, "La factura vencida ya fue pagada", chat="b@c.us"),
+            make_text_message(3, "¿Cuándo llega mi pedido?"),
+            make_text_message(4, "Factura enviada por correo", chat="b@c.us"),
+            make_text_message(5, "Gracias por la canción"),
+            make_text_message(6, None),
+        ]
+    )
+    return archive
+
+
+def test_fts_query_modes():
+    """Test de las expresiones MATCH de cada modo."""
+    assert fts_query("factura marzo") == '"factura" "marzo"'
+    assert fts_query("fact mar", "prefix") == '"fact"* "mar"*'
+    assert fts_query("factura vencida", "phrase") == '"factura vencida"'
+    assert fts_query('di "hola"') == '"di" """hola"""'
+    assert fts_query("factura OR pedido", "raw") == "factura OR pedido"
+    with pytest.raises(ValueError):
+        fts_query("   ")
+
+
+def test_search_words(searchable):
+    """Test de búsqueda por palabras, sin distinguir mayúsculas ni acentos."""
+    found = searchable.search("factura", order="recent")
+
+    assert [m.id for m in found] == ["id_0004", "id_0002", "id_0001"]
+    assert [m.id for m in searchable.search("CANCION")] == ["id_0005"]
+    assert [m.id for m in searchable.search("cuando pedido")] == ["id_0003"]
+
+
+def test_search_prefix_and_phrase(searchable):
+    """Test de búsqueda por prefijo y por frase exacta."""
+    assert {m.id for m in searchable.search("fact", mode="prefix")} == {
+        "id_0001",
+        "id_0002",
+        "id_0004",
+    }
+    assert searchable.search("fact") == []
+    assert [m.id for m in searchable.search("factura vencida", mode="phrase")] == ["id_0002"]
+    assert searchable.search("vencida factura", mode="phrase") == []
+
+
+def test_search_filters(searchable):
+    """Test de búsqueda filtrada por sesión, chat y dirección."""
+    by_chat = searchable.search("factura", chat_id="b@c.us", order="recent")
+
+    assert [m.id for m in by_chat] == ["id_0004", "id_0002"]
+    assert searchable.search("factura", session_id="otra") == []
+    assert searchable.search("factura", from_me=False) == []
+    assert len(searchable.search("factura", limit=1, offset=1)) == 1
+
+
+def test_search_index_follows_updates(searchable, make_text_message):
+    """Test de que el índice se actualiza al reemplazar un mensaje."""
+    searchable.add([make_text_message(3, "Pedido cancelado")])
+
+    assert [m.id for m in searchable.search("cancelado")] == ["id_0003"]
+    assert searchable.search("llega") == []
+    assert len(searchable) == 6
+
+
+def test_search_invalid_query(searchable):
+    """Test de que una expresión raw inválida se informa como ValueError."""
+    with pytest.raises(ValueError):
+        searchable.search('"sin cerrar', mode="raw")
+
+
+def test_search_disabled(make_text_message):
+    """Test de que sin índice de texto completo la búsqueda no está disponible."""
+    with MessageArchive(full_text=False) as archive:
+        archive.add([make_text_message(1, "factura")])
+        with pytest.raises(RuntimeError):
+            archive.search("factura")
@@ -0,0 +1,105 @@
+"""Tests para los envíos masivos con cuerpos pre-serializados."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from wasapaso import DuplicateMessageError, SuppressionList, WasapasoClient, WasapasoError
+from wasapaso.broadcast import BroadcastResult, PreparedTextMessage
+from wasapaso.dedup import RecipientDeduplicator
+from wasapaso.models.message import TextMessage
+
+
+@pytest.mark.parametrize(
+    "to,message,reply_to",
+    [
+        ("1234567890", "Hola!", None),
+        ("1234567890@c.us", 'Comillas " y barra \\ y\nsalto', "msg_1"),
+        ('raro"ñ', "Emoji 🎉 y acentos áéí", None),
+    ],
+)
+def test_prepared_text_matches_model_dump(to, message, reply_to):
+    """Test de que el cuerpo pre-serializado equivale al de TextMessage."""
+    prepared = PreparedTextMessage("64abc123", message, reply_to)
+    expected = TextMessage(
+        sessionId="64abc123", to=to, message=message, replyTo=reply_to
+    ).model_dump(by_alias=True, exclude_none=True)
+
+    assert json.loads(prepared.render(to)) == expected
+
+
+def test_prepared_text_validates_once():
+    """Test de que el cuerpo se valida al prepararlo."""
+    with pytest.raises(Exception):
+        PreparedTextMessage("64abc123", ["no es texto"])  # type: ignore[arg-type]
+
+
+@respx.mock
+def test_broadcast_text(client):
+    """Test de envío masivo con omisiones y errores por destinatario."""
+
+    def respond(request):
+        body = json.loads(request.content)
+        if body["to"] == "5550000000":
+            return httpx.Response(400, json={"message": "Invalid number"})
+        return httpx.Response(200, json={"success": True, "data": {"messageId": body["to"]}})
+
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(side_effect=respond)
+
+    result = client.messages.broadcast_text(
+        session_id="64abc123",
+        recipients=["111", "222", "111", "5550000000"],
+        message="Promo",
+        deduplicator=RecipientDeduplicator(expected_recipients=100),
+    )
+
+    assert route.call_count == 3
+    assert result.sent == 2
+    assert result.failed == 1
+    assert result.skipped == 1
+    assert result.message_ids == [("111", "111"), ("222", "222")]
+    assert "Invalid number" in dict(result.errors)["5550000000"]
+    assert result.skipped_recipients == [("111", "duplicate")]
+    assert result.skipped_reasons == {"duplicate": 1}
+    sent = json.loads(route.calls[0].request.content)
+    assert sent == {"sessionId": "64abc123", "to": "111", "message": "Promo", "type": "text"}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_broadcast_text_async_respects_suppression(tmp_path):
+    """Test asíncrono de que el envío masivo respeta la lista de supresión."""
+    path = tmp_path / "suppression.bin"
+    SuppressionList.build(["222"], path)
+    client = WasapasoClient(api_key="wsk_test_key_1234567890abcdef", suppression_list=path)
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": {"messageId": "m"}})
+    )
+
+    result = await client.messages.broadcast_text_async(
+        session_id="64abc123",
+        recipients=(str(n) for n in range(200, 240)),
+        message="Hola",
+        concurrency=4,
+    )
+
+    assert route.call_count == 39
+    assert result.sent == 39
+    assert result.skipped_recipients == [("222", "suppressed")]
+
+
+def test_broadcast_result_keeps_bounded_samples():
+    """Test de que el resultado cuenta todo pero sólo guarda una muestra acotada."""
+    result = BroadcastResult(max_samples=3)
+    for n in range(10):
+        result.add_response("111", {"data": {"messageId": f"m{n}"}})
+        result.add_skipped("222", "duplicate")
+        result.add_error("333", DuplicateMessageError())
+        result.add_error("444", WasapasoError("Invalid number"))
+
+    assert (result.sent, result.failed, result.skipped) == (10, 10, 20)
+    assert result.skipped_reasons == {"duplicate": 20}
+    assert result.message_ids == [("111", "m0"), ("111", "m1"), ("111", "m2")]
+    assert [to for to, _ in result.skipped_recipients] == ["222", "333", "222"]
+    assert len(result.errors) == 3
@@ -0,0 +1,150 @@
+"""Tests para la paginación por cursor de mensajes."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageCursor
+from wasapaso.models import Message
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def initial_messages(make_message):
+    """Fábrica de los mensajes iniciales; dos mensajes comparten cada segundo."""
+
+    def initial(total):
+        return [make_message(i, seconds=-(i // 2)) for i in range(total)]
+
+    return initial
+
+
+@pytest.fixture
+def server_order(initial_messages):
+    """IDs de los mensajes iniciales en el orden de la API."""
+
+    def order(total):
+        messages = [Message(**item) for item in initial_messages(total)]
+        return [msg.id for msg in sorted(messages, key=MessageCursor.of, reverse=True)]
+
+    return order
+
+
+@pytest.fixture
+def message_api(make_message, initial_messages):
+    """
+    Fábrica de handlers de messages.list, del más reciente al más antiguo.
+
+    Con ``honor_cursor`` respetan before/beforeId; si no, sólo paginan por
+    offset. Después de la primera petición llegan ``arriving`` mensajes
+    nuevos al principio del listado.
+    """
+
+    def api(total, honor_cursor, arriving=0):
+        items = initial_messages(total)
+        state = {"calls": 0}
+
+        def key(item):
+            return MessageCursor.of(Message(**item))
+
+        def handler(request):
+            params = request.url.params
+            if state["calls"] == 1 and arriving:
+                items[:0] = [make_message(f"new_{i}", seconds=60 + i) for i in range(arriving)]
+            state["calls"] += 1
+            rows = sorted(items, key=key, reverse=True)
+            if honor_cursor and "before" in params:
+                assert params["offset"] == "0"
+                stamp = datetime.fromisoformat(params["before"].replace("Z", "+00:00"))
+                cursor = MessageCursor.of(Message(**{**items[0], "timestamp": stamp}))
+                cursor = cursor._replace(id=params["beforeId"])
+                rows = [row for row in rows if key(row) < cursor]
+            offset = int(params["offset"])
+            limit = int(params["limit"])
+            return httpx.Response(
+                200, json={"data": rows[offset : offset + limit], "pagination": {}}
+            )
+
+        return handler
+
+    return api
+
+
+def test_cursor_encode_decode():
+    """Test de que el cursor se guarda y se recupera como texto."""
+    cursor = MessageCursor(1705322096789, "65f0a1:b")
+
+    assert MessageCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(ValueError):
+        MessageCursor.decode("1705322096789")
+
+
+def test_cursor_of_message_and_params(make_message):
+    """Test de la posición de un mensaje y sus parámetros de query string."""
+    message = Message(**make_message(1, seconds=0.789))
+
+    cursor = MessageCursor.of(message)
+
+    assert cursor == MessageCursor(int(BASE.timestamp()) * 1000 + 789, "id_1")
+    assert cursor.params() == {"before": "2024-01-01T00:00:00.789Z", "beforeId": "id_1"}
+    assert cursor.precedes(Message(**make_message(0, seconds=0.789)))
+    assert not cursor.precedes(Message(**make_message(2, seconds=0.789)))
+    assert not cursor.precedes(message)
+
+
+@respx.mock
+def test_iter_cursor_uses_server_cursor(client, message_api, server_order):
+    """Test de que todas las páginas se piden con offset 0 y el cursor."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_api(45, honor_cursor=True, arriving=3)
+    )
+
+    ids = [msg.id for msg in client.messages.iter_cursor("64abc123", page_size=10)]
+
+    assert ids == server_order(45)
+    assert route.call_count == 5
+    assert all(call.request.url.params["offset"] == "0" for call in route.calls)
+    assert "before" in route.calls[1].request.url.params
+
+
+@respx.mock
+def test_iter_cursor_local_fallback(client, message_api, server_order):
+    """Test de que sin soporte del servidor se filtran los mensajes desplazados."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_api(45, honor_cursor=False, arriving=3)
+    )
+
+    ids = [msg.id for msg in client.messages.iter_cursor("64abc123", page_size=10)]
+
+    assert ids == server_order(45)
+    assert "before" in route.calls[1].request.url.params
+    assert "before" not in route.calls[2].request.url.params
+
+
+@respx.mock
+def test_iter_cursor_resume(client, message_api, server_order):
+    """Test de que se retoma el recorrido desde un cursor guardado."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_api(30, honor_cursor=True)
+    )
+    first = list(client.messages.iter_cursor("64abc123", page_size=10))
+    saved = MessageCursor.of(first[11]).encode()
+
+    resumed = [msg.id for msg in client.messages.iter_cursor("64abc123", cursor=saved)]
+
+    assert resumed == server_order(30)[12:]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_cursor_async_fallback(client, message_api, server_order):
+    """Test asíncrono del recorrido por cursor con filtrado local."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_api(25, honor_cursor=False, arriving=2)
+    )
+
+    ids = [msg.id async for msg in client.messages.iter_cursor_async("64abc123", page_size=10)]
+
+    assert ids == server_order(25)
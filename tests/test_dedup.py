@@ -0,0 +1,95 @@
+"""Tests para la de-duplicación de destinatarios."""
+
+import pytest
+from wasapaso.dedup import BloomFilter, RecipientDeduplicator
+
+
+def test_bloom_filter_sizing():
+    """Test del dimensionamiento del filtro para 10M destinatarios."""
+    bloom = BloomFilter(capacity=10_000_000, error_rate=0.001)
+
+    assert bloom.num_hashes == 10
+    assert 15_000_000 < bloom.size_in_bytes < 20_000_000
+
+
+def test_bloom_filter_add_and_contains():
+    """Test de inserción y consulta en el filtro."""
+    bloom = BloomFilter(capacity=1000)
+
+    assert bloom.add("1234567890") is False
+    assert bloom.add("1234567890") is True
+    assert "1234567890" in bloom
+    assert "0987654321" not in bloom
+    assert len(bloom) == 1
+
+
+def test_bloom_filter_false_positive_rate():
+    """Test de que la tasa de falsos positivos respeta lo configurado."""
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"549110000{i:05d}")
+
+    false_positives = sum(f"549220000{i:05d}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_invalid_arguments():
+    """Test de validación de argumentos del filtro."""
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, error_rate=1.5)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_deduplicator_filters_normalized_duplicates(exact):
+    """Test de que números equivalentes se detectan como duplicados."""
+    dedup = RecipientDeduplicator(expected_recipients=100, exact=exact)
+    numbers = ["1234567890", "+1 234 567 890", "1234567890@c.us", "5550000000"]
+
+    unique = list(dedup.filter(numbers))
+
+    assert unique == ["1234567890", "5550000000"]
+    stats = dedup.stats
+    assert stats.seen == 4
+    assert stats.unique == 2
+    assert stats.duplicates == 2
+    assert stats.exact is exact
+    assert stats.duplicate_samples == ["+1 234 567 890", "1234567890@c.us"]
+
+
+def test_deduplicator_filter_records_with_key():
+    """Test de de-duplicación de registros de campaña."""
+    reported = []
+    dedup = RecipientDeduplicator(expected_recipients=100, on_duplicate=reported.append)
+    rows = [
+        {"phone": "111", "name": "Ana"},
+        {"phone": "222", "name": "Luis"},
+        {"phone": "111", "name": "Ana (copia)"},
+    ]
+
+    unique = list(dedup.filter(rows, key=lambda row: row["phone"]))
+
+    assert [row["name"] for row in unique] == ["Ana", "Luis"]
+    assert reported == ["111"]
+
+
+def test_deduplicator_keeps_group_ids():
+    """Test de que los IDs de grupo no se reducen a dígitos."""
+    dedup = RecipientDeduplicator(expected_recipients=100, exact=True)
+
+    assert dedup.is_duplicate("12036304@g.us") is False
+    assert dedup.is_duplicate("12036304") is False
+    assert dedup.is_duplicate("12036304@G.US") is True
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_deduplicator_keeps_inputs_without_digits_apart(exact):
+    """Test de que los valores sin dígitos no colisionan en una clave vacía."""
+    dedup = RecipientDeduplicator(expected_recipients=100, exact=exact)
+
+    assert dedup.is_duplicate("abc") is False
+    assert dedup.is_duplicate("xyz") is False
+    assert dedup.is_duplicate("  ABC ") is True
+    assert dedup.is_duplicate("") is False
+    assert dedup.is_duplicate("-") is False
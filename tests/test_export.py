@@ -0,0 +1,151 @@
+"""Tests para la exportación de mensajes a Parquet y NDJSON."""
+
+import gzip
+import json
+import sys
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+from wasapaso.export import (
+    export_messages,
+    export_ndjson,
+    iter_batches,
+    message_columns,
+)
+from wasapaso.models import Message
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes con cuerpos vacíos y milisegundos en el timestamp."""
+
+    def make(index):
+        return make_message(
+            index,
+            from_me=index % 2 == 0,
+            seconds=index % 60 + 0.123,
+            body=None if index % 3 == 0 else f"Mensaje {index}",
+        )
+
+    return make
+
+
+@pytest.fixture
+def messages(make_message):
+    """Fábrica de mensajes validados."""
+
+    def generate(count):
+        return (Message.model_validate(make_message(i)) for i in range(count))
+
+    return generate
+
+
+def test_message_columns_follow_model():
+    """Test de que las columnas salen de los campos del modelo."""
+    columns = {column.name: column for column in message_columns()}
+
+    assert list(columns) == [
+        "id",
+        "sessionId",
+        "messageId",
+        "from",
+        "to",
+        "body",
+        "type",
+        "timestamp",
+        "fromMe",
+        "replyTo",
+    ]
+    assert columns["from"].attribute == "from_"
+    assert columns["body"].type is str and columns["body"].nullable
+    assert columns["timestamp"].type is datetime and not columns["timestamp"].nullable
+    assert columns["fromMe"].type is bool
+
+
+def test_iter_batches():
+    """Test de que los lotes respetan el tamaño y no pierden elementos."""
+    batches = list(iter_batches(iter(range(25)), 10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert list(iter_batches(iter([]), 10)) == []
+
+
+def test_export_ndjson_gzip(tmp_path, messages):
+    """Test de que NDJSON comprimido conserva los nombres de la API."""
+    path = tmp_path / "mensajes.ndjson.gz"
+
+    rows = export_messages(messages(25), path, batch_size=10)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert rows == 25
+    assert [line["messageId"] for line in lines] == [f"msg_{i}" for i in range(25)]
+    assert lines[0]["fromMe"] is True and lines[0]["body"] is None
+    assert Message.model_validate(lines[1]).timestamp == datetime(
+        2024, 1, 1, 0, 0, 1, 123000, tzinfo=timezone.utc
+    )
+
+
+def test_export_ndjson_plain(tmp_path, messages):
+    """Test de que sin .gz se escribe sin comprimir."""
+    path = tmp_path / "mensajes.jsonl"
+
+    assert export_ndjson(messages(3), path) == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_export_invalid_format(tmp_path, messages):
+    """Test de que se rechazan formatos desconocidos."""
+    with pytest.raises(ValueError):
+        export_messages(messages(1), tmp_path / "mensajes.csv")
+    with pytest.raises(ValueError):
+        export_messages(messages(1), tmp_path / "mensajes.out", format="csv")  # type: ignore[arg-type]
+
+
+def test_export_parquet_without_pyarrow(tmp_path, monkeypatch, messages):
+    """Test de que sin pyarrow el error indica cómo instalarlo."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match=r"wasapaso\[arrow\]"):
+        export_messages(messages(1), tmp_path / "mensajes.parquet")
+
+
+def test_export_parquet(tmp_path, messages):
+    """Test de que Parquet tiene el esquema del modelo y un row group por lote."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "mensajes.parquet"
+
+    rows = export_messages(messages(25), path, batch_size=10)
+
+    parquet = pq.ParquetFile(path)
+    table = parquet.read()
+    assert rows == 25
+    assert parquet.num_row_groups == 3
+    assert table.schema.field("timestamp").type == pa.timestamp("ms", tz="UTC")
+    assert table.schema.field("fromMe").type == pa.bool_()
+    assert table.column("messageId").to_pylist() == [f"msg_{i}" for i in range(25)]
+    assert table.column("body").null_count == 9
+
+
+@respx.mock
+def test_messages_export(client, tmp_path, make_message):
+    """Test de que el recurso exporta todas las páginas."""
+    items = [make_message(i) for i in range(130)]
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        page = items[offset : offset + limit]
+        return httpx.Response(200, json={"data": page, "pagination": {"total": len(items)}})
+
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=handler)
+    path = tmp_path / "mensajes.ndjson"
+
+    rows = client.messages.export("64abc123", path, chat_id="5491100000000@c.us")
+
+    assert rows == 130
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 130
+    assert route.calls[0].request.url.params["chatId"] == "5491100000000@c.us"
@@ -0,0 +1,195 @@
+"""Tests para MessageFrame."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+
+np = pytest.importorskip("numpy")
+
+from wasapaso.frame import MessageFrame  # noqa: E402
+from wasapaso.models import Message  # noqa: E402
+from wasapaso.models.records import message_records  # noqa: E402
+
+SESSION = "64abc123"
+ME = "5491199999999@c.us"
+CHATS = ["5491100000001@c.us", "5491100000002@c.us", "5491100000003@c.us"]
+TYPES = ["text", "text", "image", "audio"]
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes repartidos entre CHATS y TYPES, uno por segundo."""
+
+    def make(index):
+        item = make_message(
+            index,
+            CHATS[index % len(CHATS)],
+            from_me=index % 2 == 0,
+            seconds=index,
+            session_id=SESSION,
+            me=ME,
+            body=None if index % 5 == 0 else f"Mensaje {index}",
+            type=TYPES[index % len(TYPES)],
+        )
+        if index % 7 == 3:
+            item["replyTo"] = f"msg_{index - 1}"
+        return item
+
+    return make
+
+
+def ms(minute, second=0):
+    """Milisegundos desde epoch de 2024-01-01 00:minute:second UTC."""
+    return int(datetime(2024, 1, 1, 0, minute, second, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+@pytest.fixture
+def items(make_message):
+    return [make_message(i) for i in range(120)]
+
+
+@pytest.fixture
+def frame(items):
+    return MessageFrame.from_pages([items[:50], items[50:100], items[100:]])
+
+
+def test_frame_columns(frame, items):
+    """Test de los tipos y la codificación de las columnas."""
+    assert len(frame) == 120
+    assert frame.column("timestamp").dtype == np.int64
+    assert frame.column("timestamp")[61] == ms(1, 1)
+    assert frame.column("from_me").dtype == np.bool_
+    assert frame.codes("type").dtype == np.int32
+    assert frame.categories("type").tolist() == ["text", "image", "audio"]
+    assert frame.column("type").tolist() == [item["type"] for item in items]
+    assert frame.column("body")[0] is None
+    assert frame.column("reply_to")[3] == "msg_2"
+    assert frame.column("reply_to")[4] is None
+    with pytest.raises(KeyError):
+        frame.codes("body")
+
+
+def test_frame_matches_records(frame, items):
+    """Test de que recorrer el frame da los mismos registros que lite=True."""
+    assert list(frame) == message_records(items)
+    models = [Message.model_validate(item) for item in items]
+    assert list(MessageFrame.from_records(models)) == list(frame)
+
+
+def test_frame_filter(frame, items):
+    """Test de los filtros vectorizados por chat, tipo y fecha."""
+    chat = CHATS[1]
+
+    by_chat = frame.filter(chat_id=chat)
+    assert by_chat.column("id").tolist() == [
+        item["id"] for item in items if chat in (item["from"], item["to"])
+    ]
+
+    subset = frame.filter(
+        chat_id=chat,
+        type=["text", "audio"],
+        since=datetime(2024, 1, 1, 0, 0, 30, tzinfo=timezone.utc),
+        until=ms(1, 30),
+    )
+    expected = [
+        item["id"]
+        for item in items
+        if chat in (item["from"], item["to"])
+        and item["type"] in ("text", "audio")
+        and 30 <= items.index(item) < 90
+    ]
+    assert subset.column("id").tolist() == expected
+    assert frame.filter(from_me=False).column("from_me").sum() == 0
+    assert len(frame.filter(type="video")) == 0
+    assert len(frame.filter(chat_id="desconocido@c.us")) == 0
+
+
+def test_frame_value_counts(frame):
+    """Test de los conteos por valor codificado."""
+    assert frame.value_counts("type") == {"text": 60, "image": 30, "audio": 30}
+    assert frame.filter(type="image").value_counts("type") == {"image": 30}
+
+
+def test_frame_to_pandas(frame):
+    """Test de la conversión a pandas sin copiar las columnas numéricas."""
+    pd = pytest.importorskip("pandas")
+
+    df = frame.to_pandas()
+
+    assert list(df.columns) == [
+        "id",
+        "session_id",
+        "message_id",
+        "from_",
+        "to",
+        "body",
+        "type",
+        "timestamp",
+        "from_me",
+        "reply_to",
+    ]
+    assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+    assert df["type"].tolist() == frame.column("type").tolist()
+    assert df["timestamp"].iloc[61] == pd.Timestamp("2024-01-01T00:01:01")
+    assert np.shares_memory(df["timestamp"].to_numpy(), frame.column("timestamp"))
+    assert np.shares_memory(df["from_me"].to_numpy(), frame.column("from_me"))
+    assert np.shares_memory(df["body"].to_numpy(), frame.column("body"))
+
+    local = frame.to_pandas(tz="America/Argentina/Buenos_Aires")
+    assert local["timestamp"].iloc[61] == pd.Timestamp("2024-01-01T00:01:01Z")
+
+
+def test_frame_to_arrow(frame):
+    """Test de la conversión a Arrow con columnas de diccionario."""
+    pa = pytest.importorskip("pyarrow")
+
+    table = frame.to_arrow()
+
+    assert table.num_rows == 120
+    assert pa.types.is_dictionary(table.schema.field("to").type)
+    assert table.schema.field("timestamp").type == pa.timestamp("ms", tz="UTC")
+    assert table.column("type").to_pylist() == frame.column("type").tolist()
+
+
+def test_frame_invalid_columns():
+    """Test de que se rechazan columnas incompletas."""
+    with pytest.raises(ValueError):
+        MessageFrame({"id": np.array([])}, {})
+
+
+@respx.mock
+def test_messages_fetch_frame(client, items):
+    """Test de que el recurso llena el frame con todas las páginas."""
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        page = items[offset : offset + limit]
+        return httpx.Response(200, json={"data": page, "pagination": {"total": len(items)}})
+
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=handler)
+
+    frame = client.messages.fetch_frame(SESSION, page_size=50)
+
+    assert frame.column("id").tolist() == [item["id"] for item in items]
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_messages_fetch_frame_async(client, items):
+    """Test de la versión asíncrona."""
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        page = items[offset : offset + limit]
+        return httpx.Response(200, json={"data": page, "pagination": {"total": len(items)}})
+
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=handler)
+
+    frame = await client.messages.fetch_frame_async(SESSION, page_size=50, prefetch=False)
+
+    assert len(frame) == 120
+    assert frame.value_counts("type") == {"text": 60, "image": 30, "audio": 30}
@@ -0,0 +1,290 @@
+"""Tests para las protecciones locales de envío."""
+
+import httpx
+import pytest
+import respx
+from wasapaso import (
+    DuplicateGuard,
+    DuplicateMessageError,
+    FrequencyCap,
+    FrequencyCapExceededError,
+    RateLimitError,
+    WasapasoClient,
+    WasapasoError,
+)
+
+
+class FakeClock:
+    """Reloj controlado manualmente para los tests."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_duplicate_guard_suppresses_within_window():
+    """Test de supresión de envíos idénticos dentro de la ventana."""
+    clock = FakeClock()
+    guard = DuplicateGuard(window=1.0, clock=clock)
+    key = guard.fingerprint("messages/text", {"sessionId": "s1", "to": "1", "message": "Hola"})
+
+    assert guard.check(key) is False
+    clock.now += 0.5
+    assert guard.check(key) is True
+    clock.now += 2.0
+    assert guard.check(key) is False
+
+    stats = guard.stats
+    assert stats.checked == 3
+    assert stats.suppressed == 1
+
+
+def test_duplicate_guard_window_is_exact():
+    """Test de que el intervalo más viejo no extiende la ventana."""
+    clock = FakeClock()
+    guard = DuplicateGuard(window=1.0, buckets=4, clock=clock)
+
+    assert guard.check(1) is False
+    clock.now += 0.99
+    assert guard.check(1) is True
+    # Mismo intervalo más viejo (epoch - buckets), pero ya fuera de la ventana
+    clock.now += 0.12
+    assert guard.check(1) is False
+    assert guard.check(1) is True
+
+
+def test_duplicate_guard_fingerprint_depends_on_payload():
+    """Test de que el hash distingue destinatario, contenido y endpoint."""
+    payload = {"sessionId": "s1", "to": "1", "message": "Hola"}
+    base = DuplicateGuard.fingerprint("messages/text", payload)
+
+    assert base == DuplicateGuard.fingerprint("messages/text", dict(reversed(payload.items())))
+    assert base != DuplicateGuard.fingerprint("messages/text", {**payload, "to": "2"})
+    assert base != DuplicateGuard.fingerprint("messages/text", {**payload, "message": "Chau"})
+    assert base != DuplicateGuard.fingerprint("messages/send", payload)
+
+
+def test_duplicate_guard_memory_is_bounded():
+    """Test de que cada intervalo guarda como máximo la cantidad configurada."""
+    clock = FakeClock()
+    guard = DuplicateGuard(window=1.0, buckets=2, max_entries_per_bucket=10, clock=clock)
+
+    for key in range(100):
+        assert guard.check(key) is False
+
+    stats = guard.stats
+    assert stats.tracked == 10
+    assert stats.overflowed == 90
+
+
+@respx.mock
+def test_client_suppresses_duplicate_send_text():
+    """Test de que sin raise_on_duplicate el envío repetido devuelve una respuesta local."""
+    guard = DuplicateGuard(window=60.0, raise_on_duplicate=False)
+    client = WasapasoClient(api_key="wsk_test_key_1234567890abcdef", duplicate_guard=guard)
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    first = client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+    second = client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+    other = client.messages.send_text(session_id="s1", to="1234567890", message="Otro")
+
+    assert route.call_count == 2
+    assert first["success"] is True
+    assert second["suppressed"] is True
+    assert other["success"] is True
+    assert guard.stats.suppressed == 1
+
+
+@respx.mock
+def test_client_allows_retry_after_failed_send():
+    """Test de que un envío fallido no bloquea su reintento."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef", duplicate_guard=DuplicateGuard(window=60.0)
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        side_effect=[
+            httpx.Response(500, json={"message": "boom"}),
+            httpx.Response(200, json={"success": True}),
+        ]
+    )
+
+    with pytest.raises(Exception):
+        client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+    result = client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+
+    assert route.call_count == 2
+    assert result["success"] is True
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_raises_on_duplicate_async():
+    """Test asíncrono de que por defecto el envío repetido lanza DuplicateMessageError."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        duplicate_guard=DuplicateGuard(window=60.0),
+    )
+    respx.post("https://api.wasapaso.com/api/v1/messages/media").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+    kwargs = dict(session_id="s1", to="1234567890", media_type="image", media_url="https://x/y.jpg")
+
+    await client.messages.send_media_async(**kwargs)
+    with pytest.raises(DuplicateMessageError):
+        await client.messages.send_media_async(**kwargs)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_frequency_cap_sliding_window(exact):
+    """Test del límite por destinatario en la ventana deslizante."""
+    clock = FakeClock()
+    cap = FrequencyCap(limit=2, window=60.0, buckets=6, exact=exact, width=1024, clock=clock)
+
+    assert cap.reserve("1234567890") == 0.0
+    clock.now += 5
+    assert cap.reserve("+1 234 567 890") == 0.0
+    delay = cap.reserve("1234567890@c.us")
+    assert 0 < delay <= 70
+    assert cap.count("1234567890") == 2
+    assert cap.reserve("5550000000") == 0.0
+
+    clock.now += delay
+    assert cap.reserve("1234567890") == 0.0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"window": 0},
+        {"window": -1.0},
+        {"buckets": 0},
+        {"buckets": -2},
+        {"width": 0},
+        {"depth": 0},
+        {"expected_recipients": 0},
+    ],
+)
+def test_frequency_cap_rejects_invalid_parameters(kwargs):
+    """Test de que los parámetros inválidos se rechazan al crear el límite."""
+    with pytest.raises(ValueError):
+        FrequencyCap(limit=3, **kwargs)
+
+
+def test_frequency_cap_sketch_memory_is_fixed():
+    """Test de que el modo aproximado no crece con los destinatarios."""
+    clock = FakeClock()
+    cap = FrequencyCap(limit=1, window=3600.0, width=4096, depth=4, clock=clock)
+    before = cap.memory_bytes
+
+    rejected = sum(cap.reserve(str(5491100000000 + i)) > 0 for i in range(2000))
+
+    assert cap.memory_bytes == before == 7 * 4 * 4096 * 2
+    assert rejected < 20
+
+
+def test_frequency_cap_sized_from_expected_recipients():
+    """Test de que el sketch se dimensiona a partir de los destinatarios esperados."""
+    assert FrequencyCap(limit=1).memory_bytes == 7 * 4 * 20_000 * 2
+    cap = FrequencyCap(limit=1, buckets=2, expected_recipients=500, depth=3)
+    assert cap.width == 1000
+    assert cap.memory_bytes == 3 * 3 * 1000 * 2
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_frequency_cap_release(exact):
+    """Test de que release() devuelve el cupo del envío registrado."""
+    clock = FakeClock()
+    cap = FrequencyCap(limit=1, window=60.0, exact=exact, width=1024, clock=clock)
+
+    reserved_at = cap.acquire("1234567890")
+    clock.now += 15
+    assert cap.release("+1 234 567 890", reserved_at) is True
+    assert cap.count("1234567890") == 0
+    assert cap.release("1234567890", reserved_at) is False
+    assert cap.reserve("1234567890") == 0.0
+    assert cap.release("1234567890") is True
+    assert cap.release("5550000000") is False
+
+
+@respx.mock
+def test_client_releases_cap_after_failed_send():
+    """Test de que un envío fallido no consume el cupo del destinatario."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        frequency_cap=FrequencyCap(limit=1, window=3600.0, width=1024),
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        side_effect=[
+            httpx.Response(500, json={"message": "Internal error"}),
+            httpx.Response(200, json={"success": True}),
+        ]
+    )
+
+    with pytest.raises(WasapasoError):
+        client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+    client.messages.send_text(session_id="s1", to="1234567890", message="Hola")
+
+    assert route.call_count == 2
+    assert client.messages.frequency_cap.count("1234567890") == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_releases_cap_after_failed_send_async():
+    """Test asíncrono de que un envío fallido no consume el cupo."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        frequency_cap=FrequencyCap(limit=1, window=3600.0, exact=True),
+    )
+    respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(400, json={"message": "Invalid number"})
+    )
+
+    for _ in range(2):
+        with pytest.raises(WasapasoError) as exc_info:
+            await client.messages.send_text_async(session_id="s1", to="1234567890", message="Hola")
+        assert not isinstance(exc_info.value, FrequencyCapExceededError)
+
+    assert client.messages.frequency_cap.count("1234567890") == 0
+
+
+@respx.mock
+def test_client_rejects_over_cap_sends():
+    """Test de que el cliente rechaza envíos por encima del límite."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        frequency_cap=FrequencyCap(limit=1, window=3600.0, width=1024),
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    client.messages.send_text(session_id="s1", to="1234567890", message="Uno")
+    with pytest.raises(FrequencyCapExceededError) as exc_info:
+        client.messages.send_text(session_id="s2", to="1234567890", message="Dos")
+
+    assert route.call_count == 1
+    assert exc_info.value.retry_after > 0
+    assert isinstance(exc_info.value, RateLimitError)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_delays_over_cap_sends_async():
+    """Test asíncrono del modo que espera cupo."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        frequency_cap=FrequencyCap(limit=1, window=0.2, buckets=2, exact=True, mode="delay"),
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    await client.messages.send_text_async(session_id="s1", to="1234567890", message="Uno")
+    await client.messages.send_text_async(session_id="s1", to="1234567890", message="Dos")
+
+    assert route.call_count == 2
@@ -0,0 +1,128 @@
+"""Tests para la descarga paralela del historial de mensajes."""
+
+import httpx
+import pytest
+import respx
+from wasapaso.models import MessageHistory
+from wasapaso.pagination import merge_unique, partition
+
+
+@pytest.fixture
+def history_api(make_message):
+    """
+    Fábrica de handlers que paginan mensajes por limit/offset.
+
+    Después de la primera petición llegan ``arriving`` mensajes nuevos al
+    principio de la lista, desplazando los existentes.
+    """
+
+    def api(total, with_total=True, arriving=0):
+        items = [make_message(i) for i in range(total)]
+        state = {"calls": 0}
+
+        def handler(request):
+            limit = int(request.url.params["limit"])
+            offset = int(request.url.params["offset"])
+            if state["calls"] == 1 and arriving:
+                items[:0] = [make_message(f"new_{i}") for i in range(arriving)]
+            state["calls"] += 1
+            pagination = {"total": total} if with_total else {}
+            return httpx.Response(
+                200, json={"data": items[offset : offset + limit], "pagination": pagination}
+            )
+
+        return handler
+
+    return api
+
+
+def offsets(route):
+    """Offsets pedidos, ordenados."""
+    return sorted(int(call.request.url.params["offset"]) for call in route.calls)
+
+
+def test_partition():
+    """Test de la división de offsets en páginas."""
+    assert partition(250, 100) == [0, 100, 200]
+    assert partition(250, 100, start=100) == [100, 200]
+    assert partition(0, 100) == []
+
+
+def test_merge_unique():
+    """Test de que se conserva la primera aparición de cada elemento."""
+    items, duplicates = merge_unique([[1, 2, 3], [3, 4], [4, 5]], key=lambda x: x)
+
+    assert items == [1, 2, 3, 4, 5]
+    assert duplicates == 2
+
+
+@respx.mock
+def test_fetch_history(client, history_api):
+    """Test de descarga paralela en orden."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=history_api(250))
+
+    history = client.messages.fetch_history("64abc123", page_size=100, concurrency=3)
+
+    assert isinstance(history, MessageHistory)
+    assert [msg.id for msg in history.data] == [f"id_{i}" for i in range(250)]
+    assert offsets(route) == [0, 100, 200]
+    assert history.total == 250
+    assert history.pages == 3
+    assert history.duplicates == 0
+    assert history.pages_per_second > 0
+
+
+@respx.mock
+def test_fetch_history_deduplicates_shifted_rows(client, history_api):
+    """Test de que los mensajes desplazados por mensajes nuevos no se repiten."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=history_api(250, arriving=2)
+    )
+
+    history = client.messages.fetch_history("64abc123", page_size=100)
+
+    assert [msg.id for msg in history.data] == [f"id_{i}" for i in range(250)]
+    assert history.duplicates == 2
+
+
+@respx.mock
+def test_fetch_history_continues_past_total(client, history_api):
+    """Test de que se sigue pidiendo mientras la última página esté completa."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=history_api(200, arriving=50)
+    )
+
+    history = client.messages.fetch_history("64abc123", page_size=100)
+
+    assert offsets(route) == [0, 100, 200]
+    assert len(history.data) == 200
+    assert history.duplicates == 50
+
+
+@respx.mock
+def test_fetch_history_without_total(client, history_api):
+    """Test de descarga secuencial cuando la API no informa el total."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=history_api(120, with_total=False)
+    )
+
+    history = client.messages.fetch_history("64abc123", page_size=50)
+
+    assert offsets(route) == [0, 50, 100]
+    assert len(history.data) == 120
+    assert history.total is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_history_async(client, history_api):
+    """Test asíncrono de descarga paralela."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=history_api(250, arriving=1)
+    )
+
+    history = await client.messages.fetch_history_async("64abc123", page_size=100, concurrency=2)
+
+    assert [msg.id for msg in history.data] == [f"id_{i}" for i in range(250)]
+    assert offsets(route) == [0, 100, 200]
+    assert history.duplicates == 1
@@ -0,0 +1,187 @@
+"""Tests para la bandeja de entrada materializada."""
+
+import random
+import threading
+
+import httpx
+import pydantic
+import pytest
+import respx
+from wasapaso import Inbox, MessageCursor, NotFoundError, WasapasoClient
+from wasapaso.models import Message
+
+SESSION = "64abc123"
+A, B, C = "5491100000001@c.us", "5491100000002@c.us", "5491100000003@c.us"
+
+
+@pytest.fixture
+def messages(make_message):
+    """Fábrica de modelos a partir de tuplas (index, chat, from_me, seconds)."""
+
+    def build(*specs):
+        return [Message.model_validate(make_message(*spec)) for spec in specs]
+
+    return build
+
+
+def test_inbox_orders_by_recency_and_counts_unread(messages):
+    """Test de que se guarda el último mensaje y los no leídos por chat."""
+    inbox = Inbox()
+    inbox.add(messages((1, A, False, 10), (2, B, False, 20), (3, A, False, 30)))
+    inbox.add(messages((4, C, False, 5), (5, B, False, 15)))
+
+    entries = inbox.list()
+    assert [(e.chat_id, e.last_message.id, e.unread) for e in entries] == [
+        (A, "id_3", 2),
+        (B, "id_2", 2),
+        (C, "id_4", 1),
+    ]
+    assert len(inbox) == 3
+    assert inbox.unread == 5
+    assert [e.chat_id for e in inbox.list(limit=2)] == [A, B]
+    assert inbox.get(SESSION, C).unread == 1
+    assert inbox.get(SESSION, "otro@c.us") is None
+
+
+def test_inbox_heap_order_matches_full_sort(messages):
+    """Test de que el heap con entradas viejas lista igual que ordenar todo."""
+    rng = random.Random(3)
+    inbox = Inbox()
+    chats = [f"54911{i:08d}@c.us" for i in range(50)]
+    for index in range(2_000):
+        chat = rng.choice(chats)
+        inbox.add(messages((index, chat, rng.random() < 0.3, rng.randint(0, 5_000))))
+        if index % 100 == 0:
+            assert inbox.list(limit=5) == inbox.list()[:5]
+
+    everything = inbox.list()
+    assert everything == sorted(everything, key=lambda e: MessageCursor.of(e.last_message))[::-1]
+    assert inbox.list(limit=10) == everything[:10]
+    unread = [e for e in everything if e.unread]
+    assert inbox.list(unread_only=True, limit=7) == unread[:7]
+    # Las entradas viejas se descartan: el heap no crece con los mensajes
+    assert len(inbox._heap) <= 2 * len(inbox) + 64
+
+
+def test_inbox_ignores_duplicates(messages):
+    """Test de que recibir los mismos mensajes otra vez no cambia nada."""
+    inbox = Inbox()
+    batch = messages((1, A, False, 10), (2, A, False, 20), (3, B, True, 30))
+    inbox.add(batch)
+    before = inbox.list()
+    inbox.add(reversed(batch))
+
+    assert inbox.list() == before
+    assert inbox.unread == 2
+
+
+def test_inbox_mark_read(messages):
+    """Test de que marcar un mensaje como leído descuenta también los anteriores."""
+    inbox = Inbox()
+    inbox.add(messages((1, A, False, 10), (2, A, False, 20), (3, A, False, 30), (4, B, False, 40)))
+
+    assert inbox.mark_read("msg_2") is True
+    assert inbox.get(SESSION, A).unread == 1
+    assert inbox.mark_read("id_1") is False
+    assert inbox.mark_read("desconocido") is False
+
+    # Un mensaje anterior a la marca de lectura que llega tarde no cuenta
+    inbox.add(messages((5, A, False, 15)))
+    assert inbox.get(SESSION, A).unread == 1
+
+    assert inbox.mark_chat_read(SESSION, B) == 1
+    assert inbox.mark_chat_read(SESSION, "otro@c.us") == 0
+    assert [e.chat_id for e in inbox.list(unread_only=True)] == [A]
+    assert inbox.unread == 1
+
+
+def test_inbox_outbound_message_reads_chat(messages):
+    """Test de que responder desde la sesión marca como leídos los anteriores."""
+    inbox = Inbox()
+    inbox.add(messages((1, A, False, 10), (2, A, False, 20), (3, A, True, 25), (4, A, False, 30)))
+
+    entry = inbox.get(SESSION, A)
+    assert entry.last_message.id == "id_4"
+    assert entry.unread == 1
+
+
+def test_inbox_filters_by_session(make_message, messages):
+    """Test de que el mismo chat en dos sesiones son entradas distintas."""
+    inbox = Inbox()
+    inbox.add([Message.model_validate(make_message(1, A, False, 10, session_id="s2"))])
+    inbox.add(messages((2, A, False, 5)))
+
+    assert [(e.session_id, e.chat_id) for e in inbox.list()] == [("s2", A), (SESSION, A)]
+    assert [e.session_id for e in inbox.list(session_id=SESSION)] == [SESSION]
+
+
+def test_inbox_apply_event(make_message):
+    """Test de los eventos de webhook."""
+    inbox = Inbox()
+
+    assert inbox.apply_event({"event": "message", "data": make_message(1, A, False, 10)})
+    assert inbox.apply_event({"event": "message.any", "payload": make_message(2, B, False, 20)})
+    assert not inbox.apply_event({"event": "message.ack", "data": {"id": "id_1"}})
+    with pytest.raises(pydantic.ValidationError):
+        inbox.apply_event({"event": "message", "data": {"id": "roto"}})
+
+    assert [e.chat_id for e in inbox.list()] == [B, A]
+
+
+def test_inbox_concurrent_sinks(messages):
+    """Test de que varios hilos pueden alimentar la bandeja a la vez."""
+    inbox = Inbox()
+    chats = [f"54911{i:08d}@c.us" for i in range(20)]
+
+    def feed(offset):
+        inbox.add(
+            messages(
+                *[
+                    (offset * 1000 + i, chat, False, offset * 100 + i)
+                    for i, chat in enumerate(chats)
+                ]
+            )
+        )
+
+    threads = [threading.Thread(target=feed, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(inbox) == 20
+    assert inbox.unread == 160
+    assert inbox.list()[0].last_message.id == "id_7019"
+
+
+@respx.mock
+def test_client_mark_as_read_updates_inbox(api_key, messages):
+    """Test de que messages.mark_as_read() actualiza la bandeja del cliente."""
+    inbox = Inbox()
+    client = WasapasoClient(api_key=api_key, inbox=inbox)
+    inbox.add(messages((1, A, False, 10), (2, A, False, 20)))
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/id_2/read").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    client.messages.mark_as_read("id_2")
+
+    assert route.called
+    assert client.inbox is inbox
+    assert inbox.get(SESSION, A).unread == 0
+
+
+@respx.mock
+async def test_client_mark_as_read_async_failure_keeps_unread(api_key, messages):
+    """Test de que si la API falla el mensaje sigue sin leer."""
+    inbox = Inbox()
+    client = WasapasoClient(api_key=api_key, inbox=inbox)
+    inbox.add(messages((1, A, False, 10)))
+    respx.post("https://api.wasapaso.com/api/v1/messages/id_1/read").mock(
+        return_value=httpx.Response(404, json={"message": "Message not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        await client.messages.mark_as_read_async("id_1")
+
+    assert inbox.unread == 1
@@ -0,0 +1,110 @@
+"""Tests para las listas validadas bajo demanda."""
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+from wasapaso.models import LazyList, LazyMessageList, LazySessionList, Message, MessageList
+
+
+def make_session(index):
+    """Sesión tal como la devuelve la API."""
+    return {
+        "id": f"session_{index}",
+        "name": f"Sesión {index}",
+        "sessionName": f"session_{index}",
+        "status": "WORKING",
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "updatedAt": "2024-01-01T00:00:00.000Z",
+    }
+
+
+def test_lazy_list_validates_on_access(make_message):
+    """Test de que cada elemento se valida al accederlo y queda cacheado."""
+    items = LazyList(Message, [make_message(i) for i in range(5)])
+
+    assert len(items) == 5
+    assert items.validated == 0
+
+    first = items[0]
+    assert isinstance(first, Message)
+    assert items[0] is first
+    assert items[-1].message_id == "msg_4"
+    assert items.validated == 2
+
+
+def test_lazy_list_slicing_and_iteration(make_message):
+    """Test de slicing e iteración con el mismo resultado que una lista validada."""
+    raw = [make_message(i) for i in range(6)]
+    items = LazyList(Message, raw)
+    expected = MessageList(data=raw, pagination={}).data
+
+    assert items[1:4] == expected[1:4]
+    assert items[::2] == expected[::2]
+    assert items == expected
+    assert [msg.id for msg in items] == [msg.id for msg in expected]
+    with pytest.raises(IndexError):
+        items[6]
+
+
+def test_lazy_list_invalid_item_raises_on_access(make_message):
+    """Test de que un elemento inválido solo falla al accederlo."""
+    raw = [make_message(0), {"id": "roto"}]
+    items = LazyList(Message, raw)
+
+    assert items[0].id == "id_0"
+    with pytest.raises(ValidationError):
+        items[1]
+
+
+def test_lazy_message_list_to_model(make_message):
+    """Test de conversión a MessageList."""
+    page = LazyMessageList({"data": [make_message(1)], "pagination": {"total": 1}})
+
+    model = page.to_model()
+
+    assert isinstance(model, MessageList)
+    assert model.data[0].id == "id_1"
+    assert model.pagination == {"total": 1}
+
+
+@respx.mock
+def test_messages_list_lazy(client, make_message):
+    """Test de listado de mensajes con validación perezosa."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [make_message(i) for i in range(3)], "pagination": {"total": 3}},
+        )
+    )
+
+    result = client.messages.list(session_id="64abc123", lazy=True)
+
+    assert isinstance(result, LazyMessageList)
+    assert result.pagination == {"total": 3}
+    assert result.data.validated == 0
+    assert result.data[1].body == "Mensaje 1"
+
+
+def test_messages_list_lite_and_lazy_are_exclusive(client):
+    """Test de que lite y lazy no se pueden combinar."""
+    with pytest.raises(ValueError):
+        client.messages.list(session_id="64abc123", lite=True, lazy=True)  # type: ignore
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_sessions_list_lazy_async(client):
+    """Test asíncrono de listado de sesiones con validación perezosa."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [make_session(i) for i in range(2)], "pagination": {"page": 1}},
+        )
+    )
+
+    result = await client.sessions.list_async(lazy=True)
+
+    assert isinstance(result, LazySessionList)
+    assert len(result.data) == 2
+    assert result.data[1].session_name == "session_1"
@@ -0,0 +1,176 @@
+"""Tests para la paginación automática."""
+
+import httpx
+import pytest
+import respx
+from wasapaso import NotFoundError
+from wasapaso.pagination import PageSizer
+
+
+def make_session(index):
+    """Sesión tal como la devuelve la API."""
+    return {
+        "id": f"session_{index}",
+        "name": f"Sesión {index}",
+        "sessionName": f"session_{index}",
+        "status": "WORKING",
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "updatedAt": "2024-01-01T00:00:00.000Z",
+    }
+
+
+@pytest.fixture
+def message_pages(make_message):
+    """Fábrica de handlers que paginan mensajes por limit/offset."""
+
+    def pages(total):
+        items = [make_message(i) for i in range(total)]
+
+        def handler(request):
+            limit = int(request.url.params["limit"])
+            offset = int(request.url.params["offset"])
+            page = items[offset : offset + limit]
+            return httpx.Response(200, json={"data": page, "pagination": {"total": total}})
+
+        return handler
+
+    return pages
+
+
+def session_pages(total):
+    """Handler que pagina sesiones por page/limit."""
+    items = [make_session(i) for i in range(total)]
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        start = (int(request.url.params["page"]) - 1) * limit
+        page = items[start : start + limit]
+        return httpx.Response(200, json={"data": page, "pagination": {"total": total}})
+
+    return handler
+
+
+def requested(route, *names):
+    """Parámetros de cada petición registrada."""
+    return [tuple(int(call.request.url.params[n]) for n in names) for call in route.calls]
+
+
+def test_page_sizer_grows_and_shrinks():
+    """Test de que el tamaño se duplica con páginas rápidas y se reduce con lentas."""
+    sizer = PageSizer(initial=20, minimum=10, maximum=60)
+
+    sizer.observe(limit=20, count=20, elapsed=0.01, size=1000)
+    assert sizer.size == 40
+    sizer.observe(limit=40, count=40, elapsed=0.01, size=1000)
+    assert sizer.size == 60
+    sizer.observe(limit=60, count=60, elapsed=5.0, size=1000)
+    assert sizer.size == 30
+    sizer.observe(limit=30, count=30, elapsed=0.01, size=10 * 2**20)
+    assert sizer.size == 15
+    sizer.observe(limit=15, count=15, elapsed=5.0, size=0)
+    assert sizer.size == 10
+
+
+def test_page_sizer_ignores_short_pages():
+    """Test de que una página incompleta no hace crecer el tamaño."""
+    sizer = PageSizer(initial=20)
+
+    sizer.observe(limit=20, count=5, elapsed=0.01, size=100)
+
+    assert sizer.size == 20
+
+
+def test_page_sizer_aligned_limit():
+    """Test de que el limit alineado divide al offset."""
+    sizer = PageSizer(initial=40)
+
+    assert sizer.next_limit(0, aligned=True) == 40
+    assert sizer.next_limit(60, aligned=True) == 30
+    assert sizer.next_limit(60) == 40
+
+
+def test_page_sizer_invalid_limits():
+    """Test de límites incoherentes."""
+    with pytest.raises(ValueError):
+        PageSizer(minimum=50, maximum=10)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@respx.mock
+def test_messages_iter_all(client, message_pages, prefetch):
+    """Test de que se recorren todas las páginas con tamaño creciente."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_pages(95)
+    )
+
+    messages = list(
+        client.messages.iter_all("64abc123", page_size=10, max_page_size=40, prefetch=prefetch)
+    )
+
+    assert [msg.message_id for msg in messages] == [f"msg_{i}" for i in range(95)]
+    assert requested(route, "offset", "limit") == [(0, 10), (10, 20), (30, 40), (70, 40)]
+    assert route.calls[0].request.url.params["sessionId"] == "64abc123"
+
+
+@respx.mock
+def test_messages_iter_all_prefetch_is_bounded(client, message_pages):
+    """Test de que al cortar la iteración se pide como mucho una página de más."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_pages(1000)
+    )
+
+    for index, _ in enumerate(client.messages.iter_all("64abc123", page_size=10)):
+        if index == 5:
+            break
+
+    assert route.call_count <= 2
+
+
+@respx.mock
+def test_messages_iter_all_errors(client):
+    """Test de que los errores de una página se propagan."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(404, json={"message": "Session not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        list(client.messages.iter_all("64abc123"))
+
+
+@respx.mock
+def test_sessions_iter_all_aligned_pages(client):
+    """Test de que las páginas de sesiones caen en el offset correcto."""
+    route = respx.get("https://api.wasapaso.com/api/v1/sessions").mock(
+        side_effect=session_pages(75)
+    )
+
+    sessions = list(client.sessions.iter_all(status="WORKING", page_size=10, max_page_size=40))
+
+    assert [s.id for s in sessions] == [f"session_{i}" for i in range(75)]
+    assert requested(route, "page", "limit") == [(1, 10), (2, 10), (2, 20), (2, 40)]
+    assert route.calls[0].request.url.params["status"] == "WORKING"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_messages_aiter_all(client, message_pages):
+    """Test asíncrono de paginación de mensajes."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=message_pages(25)
+    )
+
+    messages = [msg async for msg in client.messages.aiter_all("64abc123", page_size=10)]
+
+    assert [msg.message_id for msg in messages] == [f"msg_{i}" for i in range(25)]
+    assert requested(route, "offset", "limit") == [(0, 10), (10, 20)]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_sessions_aiter_all(client):
+    """Test asíncrono de paginación de sesiones."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions").mock(side_effect=session_pages(30))
+
+    sessions = [s async for s in client.sessions.aiter_all(page_size=10, prefetch=False)]
+
+    assert len(sessions) == 30
@@ -0,0 +1,87 @@
+"""Tests para la decodificación de respuestas desde bytes."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from wasapaso import NotFoundError
+from wasapaso._parsing import envelope_adapter, parse_data, parse_model
+from wasapaso.models import Message, MessageList, Session, SessionList
+
+SESSION = {
+    "id": "64abc123",
+    "name": "Mi Sesión",
+    "sessionName": "session_64abc123",
+    "status": "WORKING",
+    "webhookEvents": ["message"],
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "updatedAt": "2024-01-02T00:00:00.000Z",
+}
+
+MESSAGE = {
+    "id": "id_1",
+    "sessionId": "64abc123",
+    "messageId": "msg_1",
+    "from": "5491100000000@c.us",
+    "to": "5491199999999@c.us",
+    "body": "Hola",
+    "type": "text",
+    "timestamp": "2024-01-01T00:00:00.000Z",
+    "fromMe": True,
+}
+
+
+def test_parse_data_matches_model():
+    """Test de que el envoltorio validado equivale al camino con diccionarios."""
+    content = json.dumps({"success": True, "data": SESSION}).encode()
+
+    assert parse_data(content, Session) == Session(**SESSION)
+    assert envelope_adapter(Session) is envelope_adapter(Session)
+
+
+def test_parse_model_matches_model():
+    """Test de que una respuesta paginada validada equivale a MessageList(**response)."""
+    response = {"data": [MESSAGE, MESSAGE], "pagination": {"total": 2}}
+    content = json.dumps(response).encode()
+
+    assert parse_model(content, MessageList) == MessageList(**response)
+
+
+@respx.mock
+def test_resources_parse_from_bytes(client):
+    """Test de que los recursos devuelven los mismos modelos que antes."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions/64abc123").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": SESSION})
+    )
+    respx.get("https://api.wasapaso.com/api/v1/messages/msg_1").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": MESSAGE})
+    )
+
+    assert client.sessions.get("64abc123") == Session(**SESSION)
+    assert client.messages.get("msg_1") == Message(**MESSAGE)
+
+
+@respx.mock
+def test_list_parses_from_bytes(client):
+    """Test de listado de sesiones validado desde los bytes."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions").mock(
+        return_value=httpx.Response(200, json={"data": [SESSION], "pagination": {"page": 1}})
+    )
+
+    result = client.sessions.list()
+
+    assert isinstance(result, SessionList)
+    assert result.data[0].session_name == "session_64abc123"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_errors_are_mapped_async(client):
+    """Test asíncrono de que los errores se siguen mapeando a excepciones."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Session not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        await client.sessions.get_async("missing")
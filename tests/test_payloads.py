@@ -0,0 +1,133 @@
+"""Tests de paridad de los builders rápidos de payloads con los modelos."""
+
+import itertools
+import json
+
+import pytest
+from pydantic import ValidationError
+from wasapaso import _payloads
+from wasapaso._payloads import location_payload, media_payload, text_payload
+from wasapaso.models.message import (
+    Location,
+    LocationMessage,
+    MediaContent,
+    MediaMessage,
+    MessageType,
+    TextMessage,
+)
+
+
+def wire(payload):
+    """Bytes que se envían a la API para un payload."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def model_payload(model):
+    """Payload construido como lo hacían los métodos send_*."""
+    return model.model_dump(by_alias=True, exclude_none=True)
+
+
+@pytest.mark.parametrize(
+    "to,message,reply_to",
+    [
+        ("1234567890", "Hola!", None),
+        ("1234567890@c.us", 'Comillas " y\nsalto 🎉', "msg_1"),
+        ("1234567890", "", ""),
+    ],
+)
+def test_text_payload_parity(to, message, reply_to):
+    """Test de paridad de send_text()."""
+    expected = model_payload(
+        TextMessage(sessionId="64abc123", to=to, message=message, replyTo=reply_to)
+    )
+    payload = text_payload("64abc123", to, message, reply_to)
+
+    assert payload == expected
+    assert wire(payload) == wire(expected)
+
+
+MEDIA_CASES = list(
+    itertools.product(
+        ["image", "video", "audio", "file"],
+        [None, "https://example.com/a.jpg"],
+        [None, "aGVsbG8="],
+        [None, "Mira esto"],
+        [None, "a.jpg"],
+        [None, "msg_1"],
+    )
+)
+
+
+@pytest.mark.parametrize("media_type,media_url,media_data,caption,filename,reply_to", MEDIA_CASES)
+def test_media_payload_parity(media_type, media_url, media_data, caption, filename, reply_to):
+    """Test de paridad de send_media() en todas las combinaciones de campos opcionales."""
+    expected = model_payload(
+        MediaMessage(
+            sessionId="64abc123",
+            to="1234567890",
+            type=MessageType(media_type),
+            media=MediaContent(
+                url=media_url, data=media_data, mimetype="image/png", filename=filename
+            ),
+            caption=caption,
+            replyTo=reply_to,
+        )
+    )
+    payload = media_payload(
+        "64abc123",
+        "1234567890",
+        media_type,
+        media_url=media_url,
+        media_data=media_data,
+        mimetype="image/png",
+        caption=caption,
+        filename=filename,
+        reply_to=reply_to,
+    )
+
+    assert payload == expected
+    assert wire(payload) == wire(expected)
+
+
+@pytest.mark.parametrize(
+    "latitude,longitude,title,reply_to",
+    [
+        (40.7128, -74.006, None, None),
+        (40, -74, "Nueva York", "msg_1"),
+        (-90.0, 180.0, "", None),
+    ],
+)
+def test_location_payload_parity(latitude, longitude, title, reply_to):
+    """Test de paridad de send_location(), incluida la conversión de enteros a float."""
+    expected = model_payload(
+        LocationMessage(
+            sessionId="64abc123",
+            to="1234567890",
+            location=Location(latitude=latitude, longitude=longitude, title=title),
+            replyTo=reply_to,
+        )
+    )
+    payload = location_payload("64abc123", "1234567890", latitude, longitude, title, reply_to)
+
+    assert payload == expected
+    assert wire(payload) == wire(expected)
+
+
+def test_invalid_media_type_raises():
+    """Test de que un tipo de media inválido falla igual que con MessageType."""
+    with pytest.raises(ValueError, match="is not a valid MessageType"):
+        media_payload("64abc123", "1234567890", "sticker", media_url="https://x")
+
+
+def test_debug_mode_validates(monkeypatch):
+    """Test de que en modo debug los payloads se validan con los modelos."""
+    monkeypatch.setattr(_payloads, "DEBUG", True)
+
+    assert text_payload("64abc123", "1234567890", "Hola") == {
+        "sessionId": "64abc123",
+        "to": "1234567890",
+        "message": "Hola",
+        "type": "text",
+    }
+    with pytest.raises(ValidationError):
+        text_payload("64abc123", "1234567890", ["no es texto"])  # type: ignore[arg-type]
@@ -0,0 +1,88 @@
+"""Tests para el modo raw sin decodificación."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from wasapaso import (
+    NotFoundError,
+    RawResponse,
+    SuppressedRecipientError,
+    SuppressionList,
+    WasapasoClient,
+)
+
+BODY = b'{"success":true,"data":{"id":"64abc123","status":"WORKING"}}'
+
+
+@respx.mock
+def test_raw_response_is_not_decoded(client):
+    """Test de que la vista raw devuelve status, headers y body sin tocar."""
+    respx.get("https://api.wasapaso.com/api/v1/sessions/64abc123").mock(
+        return_value=httpx.Response(
+            200, content=BODY, headers={"content-type": "application/json", "x-request-id": "r1"}
+        )
+    )
+
+    raw = client.with_raw_response.sessions.get("64abc123")
+
+    assert isinstance(raw, RawResponse)
+    assert raw.status_code == 200
+    assert raw.content == BODY
+    assert raw.headers["x-request-id"] == "r1"
+    assert bytes(raw.view) == BODY
+    assert raw.json()["data"]["status"] == "WORKING"
+    assert client.with_raw_response is client.with_raw_response
+
+
+@respx.mock
+def test_raw_errors_are_mapped(client):
+    """Test de que los errores se siguen lanzando como excepciones."""
+    respx.delete("https://api.wasapaso.com/api/v1/sessions/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Session not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        client.with_raw_response.sessions.delete("missing")
+
+
+@respx.mock
+def test_raw_send_preserialized_body(client):
+    """Test de envío de un cuerpo ya serializado, reenviado tal cual."""
+    body = b'{"sessionId":"64abc123","to":"1234567890","message":"Hola","type":"text"}'
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/send").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    raw = client.with_raw_response.messages.send(body)
+
+    assert route.calls[0].request.content == body
+    assert raw.content == b'{"success":true}'
+    # El cliente original no cambia de modo
+    assert client.messages.send(body) == {"success": True}
+
+
+def test_preserialized_body_respects_suppression(tmp_path):
+    """Test de que los cuerpos ya serializados pasan por la lista de supresión."""
+    path = tmp_path / "suppression.bin"
+    SuppressionList.build(["1234567890"], path)
+    client = WasapasoClient(api_key="wsk_test_key_1234567890abcdef", suppression_list=path)
+    body = json.dumps({"sessionId": "64abc123", "to": "1234567890", "message": "Hola"}).encode()
+
+    with pytest.raises(SuppressedRecipientError):
+        client.with_raw_response.messages.send(body)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_raw_list_async_ignores_lite(client):
+    """Test asíncrono de que los listados raw devuelven el body sin convertir."""
+    content = b'{"data":[],"pagination":{"total":0}}'
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, content=content)
+    )
+
+    raw = await client.with_raw_response.messages.list_async("64abc123", lite=True)
+
+    assert raw.content == content
@@ -0,0 +1,97 @@
+"""Tests para los registros livianos de mensajes."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+from wasapaso.models import MessageList, MessageRecord, MessageRecordList
+from wasapaso.models.records import message_records, timestamp_to_ms
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes de ambos sentidos; los impares responden al anterior."""
+
+    def make(index):
+        item = make_message(index, from_me=index % 2 == 0)
+        if index % 2:
+            item["replyTo"] = f"msg_{index - 1}"
+        return item
+
+    return make
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2024-01-01T00:00:00.000Z", 1704067200000),
+        ("2024-01-01T00:00:00.123Z", 1704067200123),
+        ("2024-01-01T03:00:00+03:00", 1704067200000),
+        ("2024-01-01T00:00:00", 1704067200000),
+        (1704067200, 1704067200000),
+        (1704067200123, 1704067200123),
+        (datetime(2024, 1, 1, tzinfo=timezone.utc), 1704067200000),
+    ],
+)
+def test_timestamp_to_ms(value, expected):
+    """Test de conversión de timestamps a milisegundos desde epoch."""
+    assert timestamp_to_ms(value) == expected
+
+
+def test_records_match_models(make_message):
+    """Test de que los registros tienen los mismos datos que los modelos."""
+    items = [make_message(i) for i in range(3)]
+    models = MessageList(data=items, pagination={}).data
+    records = message_records(items)
+
+    for model, record in zip(models, records):
+        assert record.id == model.id
+        assert record.from_ == model.from_
+        assert record.from_me == model.from_me
+        assert record.reply_to == model.reply_to
+        assert record.timestamp == int(model.timestamp.timestamp() * 1000)
+
+
+def test_records_intern_repeated_strings(make_message):
+    """Test de que los strings repetidos comparten la misma instancia."""
+    items = [make_message(i) for i in range(2)]
+    # Strings iguales pero distintos objetos, como los produce el decodificador JSON
+    items[1]["sessionId"] = "".join(["64abc", "123"])
+
+    first, second = message_records(items)
+
+    assert first.session_id is second.session_id
+
+
+@respx.mock
+def test_list_lite(client, make_message):
+    """Test de listado en modo liviano."""
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [make_message(i) for i in range(3)], "pagination": {"total": 3}},
+        )
+    )
+
+    result = client.messages.list(session_id="64abc123", lite=True)
+
+    assert route.called
+    assert isinstance(result, MessageRecordList)
+    assert isinstance(result.data[0], MessageRecord)
+    assert result.data[2].body == "Mensaje 2"
+    assert result.data[0].timestamp == 1704067200000
+    assert result.pagination == {"total": 3}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_list_lite_async(client, make_message):
+    """Test asíncrono de listado en modo liviano."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, json={"data": [make_message(1)], "pagination": {}})
+    )
+
+    result = await client.messages.list_async(session_id="64abc123", lite=True)
+
+    assert result.data[0].message_id == "msg_1"
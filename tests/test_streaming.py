@@ -0,0 +1,129 @@
+"""Tests para la decodificación incremental de listados."""
+
+import json
+import random
+
+import httpx
+import pytest
+import respx
+from wasapaso import AuthenticationError, ResponseTooLargeError
+from wasapaso._streaming import ArrayItemSplitter
+from wasapaso.models import Message
+
+# Cuerpo con caracteres que el separador tiene que saltear dentro de strings
+TRICKY_BODY = 'Texto con "comillas", llaves {} y corchetes [] \\ ñ'
+
+
+@pytest.fixture
+def make_body(make_message):
+    """Fábrica de respuestas de messages.list serializadas."""
+
+    def make(count):
+        response = {
+            "success": True,
+            "message": "data",
+            "data": [make_message(i, body=TRICKY_BODY if i % 2 else "Hola") for i in range(count)],
+            "pagination": {"total": count, "data": [1, 2]},
+        }
+        return json.dumps(response, ensure_ascii=False).encode()
+
+    return make
+
+
+def chunked(content, size):
+    """Divide el contenido en partes de tamaño fijo."""
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+def test_splitter_with_random_chunks(make_body):
+    """Test de que los elementos se separan igual sin importar el tamaño de las partes."""
+    content = make_body(30)
+    expected = json.loads(content)
+    rng = random.Random(7)
+
+    for _ in range(50):
+        splitter = ArrayItemSplitter("data")
+        items = []
+        pos = 0
+        while pos < len(content):
+            step = rng.randint(1, 64)
+            items.extend(splitter.feed(content[pos : pos + step]))
+            pos += step
+
+        assert [json.loads(item) for item in items] == expected["data"]
+        assert splitter.metadata() == {**expected, "data": []}
+
+
+def test_splitter_nested_items():
+    """Test de elementos con objetos y arrays anidados."""
+    splitter = ArrayItemSplitter("data")
+
+    items = splitter.feed(b'{"data": [{"a": {"b": [1, {"c": "]"}]}}, [1, 2]], "x": 1}')
+
+    assert items == [b'{"a": {"b": [1, {"c": "]"}]}}', b"[1, 2]"]
+    assert splitter.metadata() == {"data": [], "x": 1}
+
+
+def test_splitter_incomplete_document():
+    """Test de que un documento cortado se detecta al final."""
+    splitter = ArrayItemSplitter("data")
+    splitter.feed(b'{"data": [{"id": 1}')
+
+    with pytest.raises(ValueError):
+        splitter.metadata()
+
+
+@respx.mock
+def test_iter_messages(client, make_message, make_body):
+    """Test de iteración de mensajes a medida que llegan."""
+    content = make_body(5)
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, content=iter(chunked(content, 100)))
+    )
+
+    messages = list(client.messages.iter_messages("64abc123", limit=5))
+
+    assert route.calls[0].request.url.params["limit"] == "5"
+    assert [msg.message_id for msg in messages] == [f"msg_{i}" for i in range(5)]
+    assert messages[1] == Message(**make_message(1, body=TRICKY_BODY))
+
+
+@respx.mock
+def test_iter_messages_max_size_aborts(client, make_body):
+    """Test de que la lectura se aborta al superar el tamaño máximo."""
+    content = make_body(50)
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, content=iter(chunked(content, 512)))
+    )
+    received = []
+
+    with pytest.raises(ResponseTooLargeError) as exc_info:
+        for msg in client.messages.iter_messages("64abc123", max_response_size=2048):
+            received.append(msg)
+
+    assert 0 < len(received) < 50
+    assert exc_info.value.response_data["maxSize"] == 2048
+
+
+@respx.mock
+def test_iter_messages_content_length_aborts_early(client, make_body):
+    """Test de que un Content-Length mayor al máximo aborta antes de leer."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(200, content=make_body(50))
+    )
+
+    with pytest.raises(ResponseTooLargeError):
+        next(client.messages.iter_messages("64abc123", max_response_size=1024))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_messages_async_errors(client):
+    """Test asíncrono de que los errores HTTP se mapean a excepciones."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(401, json={"message": "Invalid API key"})
+    )
+
+    with pytest.raises(AuthenticationError):
+        async for _ in client.messages.iter_messages_async("64abc123"):
+            pass
@@ -0,0 +1,178 @@
+"""Tests para la lista de supresión."""
+
+import os
+
+import httpx
+import pytest
+import respx
+from wasapaso import SuppressedRecipientError, SuppressionList, WasapasoClient
+from wasapaso._utils import hash_number
+from wasapaso.suppression import MAGIC
+
+
+@pytest.fixture
+def suppression_path(tmp_path):
+    """Fixture con un archivo de supresión de ejemplo."""
+    path = tmp_path / "suppression.bin"
+    SuppressionList.build(["1234567890", "+54 9 11 5555-0000", "5550001111@c.us"], path)
+    return path
+
+
+def test_build_and_lookup(suppression_path):
+    """Test de generación y consulta de la lista."""
+    suppression = SuppressionList(suppression_path)
+
+    assert len(suppression) == 3
+    assert "1234567890" in suppression
+    assert "1234567890@c.us" in suppression
+    assert "5491155550000" in suppression
+    assert "5550001111" in suppression
+    assert "9999999999" not in suppression
+
+
+def test_build_deduplicates_entries(tmp_path):
+    """Test de que los números equivalentes se guardan una sola vez."""
+    path = tmp_path / "suppression.bin"
+
+    count = SuppressionList.build(["111", "+111", "111@c.us"], path)
+
+    assert count == 1
+    assert os.path.getsize(path) == 16
+
+
+def test_empty_list(tmp_path):
+    """Test de una lista sin entradas."""
+    path = tmp_path / "suppression.bin"
+    SuppressionList.build([], path)
+
+    suppression = SuppressionList(path)
+
+    assert len(suppression) == 0
+    assert "1234567890" not in suppression
+
+
+def test_invalid_file(tmp_path):
+    """Test de que un archivo con otro formato se rechaza."""
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"1234567890\n")
+
+    with pytest.raises(ValueError):
+        SuppressionList(path)
+
+
+def test_reload_when_file_changes(suppression_path):
+    """Test de recarga atómica al reemplazar el archivo."""
+    suppression = SuppressionList(suppression_path, check_interval=0)
+    assert "7770000000" not in suppression
+
+    SuppressionList.build(["7770000000"], suppression_path)
+
+    assert "7770000000" in suppression
+    assert "1234567890" not in suppression
+    assert suppression.reload_if_changed() is False
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"WSPSUP", b"WSPSUP01\x01\x02\x03", b"otro formato de archivo"]
+)
+def test_reload_keeps_previous_list_on_bad_file(suppression_path, content):
+    """Test de que un archivo nuevo incompleto o inválido no rompe las consultas."""
+    suppression = SuppressionList(suppression_path, check_interval=0)
+    partial = suppression_path.with_name("partial.bin")
+    partial.write_bytes(content)
+    os.replace(partial, suppression_path)
+
+    assert "1234567890" in suppression
+    assert suppression.reload_if_changed() is False
+
+    SuppressionList.build(["7770000000"], suppression_path)
+    assert "7770000000" in suppression
+    assert "1234567890" not in suppression
+
+
+def test_reload_closes_previous_mapping(suppression_path):
+    """Test de que al recargar se cierra el mapeo anterior."""
+    suppression = SuppressionList(suppression_path, check_interval=0)
+    old_mapped = suppression._state[1]
+
+    SuppressionList.build(["7770000000"], suppression_path)
+
+    assert suppression.reload_if_changed() is True
+    assert old_mapped.closed
+
+
+def test_non_string_numbers(suppression_path):
+    """Test de que los números no textuales se consultan como texto."""
+    suppression = SuppressionList(suppression_path)
+
+    assert 1234567890 in suppression
+    assert 5491155550000 in suppression
+    assert 9999999999 not in suppression
+    assert None not in suppression
+
+
+def test_file_is_little_endian(tmp_path):
+    """Test de que los hashes se escriben en little-endian sin importar la plataforma."""
+    path = tmp_path / "suppression.bin"
+    SuppressionList.build(["1234567890"], path)
+
+    content = path.read_bytes()
+    assert content[:8] == MAGIC
+    assert int.from_bytes(content[8:], "little") == hash_number("1234567890")
+
+
+@respx.mock
+def test_client_blocks_non_string_recipient(suppression_path):
+    """Test de que un destinatario numérico no esquiva la lista de supresión."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef", suppression_list=suppression_path
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/send").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    with pytest.raises(SuppressedRecipientError):
+        client.messages.send({"sessionId": "64abc123", "to": 1234567890, "type": "text"})
+
+    assert not route.called
+
+
+@respx.mock
+def test_client_blocks_suppressed_recipient(suppression_path):
+    """Test de que el cliente no envía mensajes a números suprimidos."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef", suppression_list=str(suppression_path)
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    with pytest.raises(SuppressedRecipientError) as exc_info:
+        client.messages.send_text(session_id="64abc123", to="1234567890", message="Hola")
+
+    assert not route.called
+    assert exc_info.value.response_data == {"to": "1234567890"}
+
+    result = client.messages.send_text(session_id="64abc123", to="9999999999", message="Hola")
+    assert route.called
+    assert result["success"] is True
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_blocks_suppressed_recipient_async(suppression_path):
+    """Test asíncrono del bloqueo de números suprimidos."""
+    client = WasapasoClient(
+        api_key="wsk_test_key_1234567890abcdef",
+        suppression_list=SuppressionList(suppression_path),
+    )
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/send").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    with pytest.raises(SuppressedRecipientError):
+        await client.messages.send_location_async(
+            session_id="64abc123", to="5550001111", latitude=1.0, longitude=2.0
+        )
+
+    assert not route.called
@@ -0,0 +1,220 @@
+"""Tests para la sincronización incremental de mensajes."""
+
+import json
+import os
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageCursor, MessageSync, WatermarkStore
+from wasapaso.models import Message
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes enviados por la sesión; a mayor índice, más reciente."""
+
+    def make(index, chat="5491199999999@c.us"):
+        return make_message(
+            index,
+            chat,
+            from_me=True,
+            seconds=index,
+            me="5491100000000@c.us",
+            id=f"id_{index:04d}",
+        )
+
+    return make
+
+
+class FakeApi:
+    """messages.list del más reciente al más antiguo, con soporte de cursor."""
+
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __call__(self, request):
+        params = request.url.params
+        rows = [Message(**item) for item in self.items]
+        if "chatId" in params:
+            rows = [row for row in rows if row.to == params["chatId"]]
+        rows.sort(key=MessageCursor.of, reverse=True)
+        if "beforeId" in params:
+            by_id = {row.id: row for row in rows}
+            cursor = MessageCursor.of(by_id[params["beforeId"]])
+            rows = [row for row in rows if cursor.precedes(row)]
+        offset = int(params["offset"])
+        page = rows[offset : offset + int(params["limit"])]
+        data = [row.model_dump(mode="json", by_alias=True) for row in page]
+        return httpx.Response(200, json={"data": data, "pagination": {}})
+
+
+def test_watermark_store_persists(tmp_path):
+    """Test de que las marcas de agua se guardan en disco de forma atómica."""
+    path = tmp_path / "watermarks.json"
+    store = WatermarkStore(path)
+    store.set("s1", "chat_a", MessageCursor(1000, "id_1"))
+    store.set("s1", None, MessageCursor(2000, "id_2"))
+    store.flush()
+
+    reopened = WatermarkStore(path)
+
+    assert reopened.get("s1", "chat_a") == MessageCursor(1000, "id_1")
+    assert reopened.get("s1") == MessageCursor(2000, "id_2")
+    assert reopened.get("s1", "chat_b") is None
+    assert os.listdir(tmp_path) == ["watermarks.json"]
+
+
+def test_watermark_store_flush_policy(tmp_path):
+    """Test de que se escribe cada flush_every cambios o tras flush_interval segundos."""
+    now = [0.0]
+    path = tmp_path / "watermarks.json"
+    store = WatermarkStore(path, flush_every=3, flush_interval=10.0, clock=lambda: now[0])
+
+    store.set("s1", "a", MessageCursor(1, "id_1"))
+    store.set("s1", "b", MessageCursor(2, "id_2"))
+    assert not path.exists()
+    store.set("s1", "c", MessageCursor(3, "id_3"))
+    assert WatermarkStore(path).get("s1", "c") == MessageCursor(3, "id_3")
+
+    store.set("s1", "d", MessageCursor(4, "id_4"))
+    assert WatermarkStore(path).get("s1", "d") is None
+    now[0] = 10.0
+    store.set("s1", "e", MessageCursor(5, "id_5"))
+    assert WatermarkStore(path).get("s1", "d") == MessageCursor(4, "id_4")
+
+    with pytest.raises(ValueError):
+        WatermarkStore(path, flush_every=0)
+
+
+def test_watermark_store_fsyncs_before_replace(tmp_path, monkeypatch):
+    """Test de que el temporal se sincroniza a disco antes de renombrarlo."""
+    calls = []
+    fsync, replace = os.fsync, os.replace
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync") or fsync(fd))
+    monkeypatch.setattr(os, "replace", lambda *a: calls.append("replace") or replace(*a))
+    store = WatermarkStore(tmp_path / "watermarks.json")
+
+    store.set("s1", "a", MessageCursor(1, "id_1"))
+    store.flush()
+    store.flush()
+
+    assert calls[:2] == ["fsync", "replace"]
+    assert calls.count("replace") == 1
+
+
+def test_watermark_store_invalid_file(tmp_path):
+    """Test de que un archivo con otro formato se rechaza."""
+    path = tmp_path / "watermarks.json"
+    path.write_text(json.dumps([1, 2]))
+
+    with pytest.raises(ValueError):
+        WatermarkStore(path)
+
+
+@respx.mock
+def test_sync_only_new_messages(client, tmp_path, make_message):
+    """Test de que cada ejecución entrega sólo los mensajes nuevos, en orden."""
+    api = FakeApi(make_message(i) for i in range(25))
+    route = respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=api)
+    sync = MessageSync(client, WatermarkStore(tmp_path / "wm.json"), page_size=10)
+    batches = []
+
+    assert sync.sync("64abc123", None, batches.append) == 25
+    assert [msg.id for msg in batches[0]] == [f"id_{i:04d}" for i in range(25)]
+
+    api.items.extend(make_message(i) for i in range(25, 28))
+    route.reset()
+
+    assert (
+        MessageSync(client, WatermarkStore(tmp_path / "wm.json")).sync(
+            "64abc123", None, batches.append
+        )
+        == 3
+    )
+    assert [msg.id for msg in batches[1]] == ["id_0025", "id_0026", "id_0027"]
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_sync_failed_sink_keeps_watermark(client, tmp_path, make_message):
+    """Test de que si el sink falla la marca de agua no avanza."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=FakeApi(make_message(i) for i in range(5))
+    )
+    store = WatermarkStore(tmp_path / "wm.json")
+    sync = MessageSync(client, store)
+
+    def failing_sink(messages):
+        raise RuntimeError("warehouse unavailable")
+
+    with pytest.raises(RuntimeError):
+        sync.sync("64abc123", None, failing_sink)
+
+    assert store.get("64abc123") is None
+    assert sync.sync("64abc123", None, lambda messages: None) == 5
+
+
+@respx.mock
+def test_sync_many(client, tmp_path, make_message):
+    """Test de sincronización de varios chats en paralelo."""
+    chats = [f"54911000000{n}@c.us" for n in range(4)]
+    items = [make_message(i, chats[i % 4]) for i in range(40)]
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=FakeApi(items))
+    store = WatermarkStore(tmp_path / "wm.json")
+    received = {}
+
+    def sink(messages):
+        if messages[0].to == chats[3]:
+            raise RuntimeError("rejected")
+        received[messages[0].to] = len(messages)
+
+    result = MessageSync(client, store, concurrency=3).sync_many("64abc123", chats, sink)
+
+    assert result.synced == {chats[0]: 10, chats[1]: 10, chats[2]: 10}
+    assert result.errors == {chats[3]: "rejected"}
+    assert result.total == 30
+    assert received == {chats[0]: 10, chats[1]: 10, chats[2]: 10}
+    assert store.get("64abc123", chats[0]).id == "id_0036"
+    assert store.get("64abc123", chats[3]) is None
+
+
+@respx.mock
+def test_sync_many_writes_watermarks_once(client, tmp_path, make_message, monkeypatch):
+    """Test de que sync_many guarda las marcas de agua una vez y no por chat."""
+    chats = [f"54911000000{n}@c.us" for n in range(6)]
+    items = [make_message(i, chats[i % 6]) for i in range(30)]
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=FakeApi(items))
+    path = tmp_path / "wm.json"
+    store = WatermarkStore(path)
+    writes = []
+    write = store._write
+    monkeypatch.setattr(store, "_write", lambda marks: writes.append(len(marks)) or write(marks))
+
+    result = MessageSync(client, store, concurrency=3).sync_many("64abc123", chats, list)
+
+    assert result.total == 30
+    assert writes == [6]
+    assert WatermarkStore(path).get("64abc123", chats[5]).id == "id_0029"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_sync_many_async(client, tmp_path, make_message):
+    """Test asíncrono con un sink que es una corrutina."""
+    chats = ["chat_a@c.us", "chat_b@c.us"]
+    api = FakeApi(make_message(i, chats[i % 2]) for i in range(10))
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(side_effect=api)
+    sync = MessageSync(client, WatermarkStore(tmp_path / "wm.json"))
+    received = []
+
+    async def sink(messages):
+        received.extend(msg.id for msg in messages)
+
+    first = await sync.sync_many_async("64abc123", chats, sink)
+    api.items.append(make_message(10, chats[0]))
+    second = await sync.sync_many_async("64abc123", chats, sink)
+
+    assert first.synced == {chats[0]: 5, chats[1]: 5}
+    assert second.synced == {chats[0]: 1, chats[1]: 0}
+    assert sorted(received) == [f"id_{i:04d}" for i in range(11)]
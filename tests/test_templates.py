@@ -0,0 +1,196 @@
+"""Tests para las plantillas de mensajes."""
+
+import json
+from datetime import date
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageTemplate, TemplateError
+from wasapaso.dedup import RecipientDeduplicator
+
+
+def test_template_fields_and_render():
+    """Test de compilación y renderizado de un registro."""
+    template = MessageTemplate(
+        "Hola {nombre}! Pedido #{pedido:05d} llega el {fecha:%d/%m}. {nombre}"
+    )
+
+    assert template.fields == ["nombre", "pedido", "fecha"]
+    text = template.render({"nombre": "Ana", "pedido": 42, "fecha": date(2024, 3, 9)})
+    assert text == "Hola Ana! Pedido #00042 llega el 09/03. Ana"
+
+
+@pytest.mark.parametrize(
+    "source", ["Hola {}", "Hola {0}", "Hola {cliente.nombre}", "Hola {", "{a:{b}}"]
+)
+def test_template_rejects_unsupported_syntax(source):
+    """Test de que se rechazan placeholders no soportados."""
+    with pytest.raises(TemplateError):
+        MessageTemplate(source)
+
+
+def test_template_validate_schema():
+    """Test de validación de placeholders contra el esquema."""
+    template = MessageTemplate("Hola {nombre}, tu saldo es {saldo}")
+
+    template.validate(["to", "nombre", "saldo"])
+    with pytest.raises(TemplateError) as exc_info:
+        template.validate(["to", "nombre"])
+
+    assert exc_info.value.response_data == {"missing": ["saldo"]}
+
+
+def test_render_columns_reports_errors_per_record():
+    """Test de renderizado columnar con errores por registro."""
+    template = MessageTemplate("Hola {nombre}, debés ${saldo:.2f}")
+
+    batch = template.render_columns(
+        {"nombre": ["Ana", "Luis", None, "Eva"], "saldo": [10, 2.5, 3, "mucho"]}
+    )
+
+    assert batch.texts == ["Hola Ana, debés $10.00", "Hola Luis, debés $2.50", None, None]
+    assert set(batch.errors) == {2, 3}
+    assert batch.errors[2].startswith("nombre")
+
+
+def test_render_columns_static_template():
+    """Test de una plantilla sin placeholders."""
+    batch = MessageTemplate("Hola!").render_columns({}, size=2)
+
+    assert batch.texts == ["Hola!", "Hola!"]
+
+
+def test_render_columns_length_mismatch():
+    """Test de columnas de distinto largo."""
+    with pytest.raises(TemplateError):
+        MessageTemplate("{a} {b}").render_columns({"a": [1, 2], "b": [1]})
+
+
+@respx.mock
+def test_broadcast_template(client):
+    """Test de envío masivo personalizado por lotes columnares."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": {"messageId": "m"}})
+    )
+    batches = [
+        {"phone": ["111", "222"], "nombre": ["Ana", "Luis"]},
+        {"phone": ["333"], "nombre": [None]},
+    ]
+
+    result = client.messages.broadcast_template(
+        session_id="64abc123",
+        template="Hola {nombre} 👋",
+        batches=batches,
+        recipient_field="phone",
+    )
+
+    assert result.sent == 2
+    assert result.failed == 1
+    assert "nombre" in dict(result.errors)["333"]
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    assert bodies[1] == {
+        "sessionId": "64abc123",
+        "to": "222",
+        "message": "Hola Luis 👋",
+        "type": "text",
+    }
+
+
+@respx.mock
+def test_broadcast_template_int_recipients(client):
+    """Test de que los destinatarios numéricos se envían como texto."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": {"messageId": "m"}})
+    )
+
+    result = client.messages.broadcast_template(
+        "64abc123",
+        "Hola {n}",
+        {"to": [5491100000001, "5491100000002", 5491100000002], "n": ["a", "b", "c"]},
+        deduplicator=RecipientDeduplicator(expected_recipients=100),
+    )
+
+    assert result.sent == 2
+    assert result.skipped_recipients == [("5491100000002", "duplicate")]
+    assert result.message_ids == [("5491100000001", "m"), ("5491100000002", "m")]
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    assert [body["to"] for body in bodies] == ["5491100000001", "5491100000002"]
+
+
+@respx.mock
+def test_broadcast_template_missing_recipients(client):
+    """Test de que los destinatarios vacíos se reportan por fila sin cortar el envío."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+    batches = [{"to": ["111", None], "n": ["a", "b"]}, {"to": ["", "222"], "n": ["c", "d"]}]
+
+    result = client.messages.broadcast_template("64abc123", "Hola {n}", batches)
+
+    assert result.sent == 2
+    assert result.failed == 2
+    errors = dict(result.errors)
+    assert set(errors) == {"#1", "#2"}
+    assert "missing recipient" in errors["#1"]
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_broadcast_template_validates_before_sending(client):
+    """Test asíncrono de que el esquema se valida antes del primer envío."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    with pytest.raises(TemplateError):
+        await client.messages.broadcast_template_async(
+            session_id="64abc123",
+            template="Hola {nombre}",
+            batches={"to": ["111"], "name": ["Ana"]},
+        )
+
+    assert not route.called
+
+
+@respx.mock
+def test_broadcast_template_later_batch_mismatch(client):
+    """Test de que un lote posterior sin las columnas se registra sin perder lo enviado."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": {"messageId": "m"}})
+    )
+    batches = [
+        {"to": ["1", "2"], "nombre": ["Ana", "Luis"]},
+        {"to": ["3"]},
+        {"to": ["4", "5"], "nombre": ["Eva"]},
+        {"to": ["6"], "nombre": ["Sol"]},
+    ]
+
+    result = client.messages.broadcast_template("64abc123", "Hola {nombre}", batches)
+
+    assert result.sent == 3
+    assert result.failed == 3
+    errors = dict(result.errors)
+    assert "nombre" in errors["lote 1"]
+    assert "same length" in errors["lote 2"]
+    assert [json.loads(call.request.content)["to"] for call in route.calls] == ["1", "2", "6"]
+
+
+@respx.mock
+def test_broadcast_template_validates_columns_argument(client):
+    """Test de que el esquema explícito se valida antes de leer los lotes."""
+    route = respx.post("https://api.wasapaso.com/api/v1/messages/text").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+
+    def batches():
+        raise AssertionError("batches should not be read")
+        yield {}
+
+    with pytest.raises(TemplateError):
+        client.messages.broadcast_template(
+            "64abc123", "Hola {nombre}", batches(), columns=["to", "name"]
+        )
+
+    assert not route.called
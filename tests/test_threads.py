@@ -0,0 +1,165 @@
+"""Tests para el índice de hilos de respuesta."""
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageArchive, ThreadIndex, WasapasoClient
+from wasapaso.models import Message
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes de un mismo chat; a mayor índice, más reciente."""
+
+    def make(index, reply_to=None):
+        item = make_message(index, "5491100000001@c.us", seconds=index)
+        if reply_to is not None:
+            item["replyTo"] = reply_to
+        return item
+
+    return make
+
+
+@pytest.fixture
+def messages(make_message):
+    """Fábrica de modelos a partir de tuplas (index, reply_to)."""
+
+    def build(*specs):
+        return [Message.model_validate(make_message(*spec)) for spec in specs]
+
+    return build
+
+
+@pytest.fixture
+def archive():
+    """Archivo en memoria."""
+    with MessageArchive() as archive:
+        yield archive
+
+
+def test_message_reply_to(make_message):
+    """Test de que el modelo expone replyTo."""
+    message = Message.model_validate(make_message(2, "msg_1"))
+
+    assert message.reply_to == "msg_1"
+    assert Message.model_validate(make_message(1)).reply_to is None
+    assert message.model_dump(by_alias=True)["replyTo"] == "msg_1"
+
+
+def test_thread_index_from_archive(archive, messages):
+    """Test de cadenas, hilos, padres e hijos con referencias por id o message_id."""
+    # 1 <- 2 <- 3 <- 5 y 1 <- 4; 6 no pertenece al hilo
+    archive.add(messages((5, "id_3"), (3, "msg_2"), (1,), (4, "id_1"), (2, "id_1"), (6,)))
+    index = ThreadIndex(archive)
+
+    assert len(index) == 6
+    assert "msg_3" in index and "id_9" not in index
+    assert [m.id for m in index.chain("id_5")] == ["id_1", "id_2", "id_3", "id_5"]
+    assert [m.id for m in index.thread("msg_3")] == ["id_1", "id_2", "id_3", "id_4", "id_5"]
+    assert [m.id for m in index.thread("id_6")] == ["id_6"]
+    assert index.children("id_1") == ["id_2", "id_4"]
+    assert index.children("id_2") == ["id_3"]
+    assert index.parent("id_3") == "id_2"
+    assert index.parent("id_1") is None
+    assert index.chain("id_9") == [] and index.thread("id_9") == []
+    assert index.missing() == set()
+
+
+def test_thread_index_is_incremental(archive, messages):
+    """Test de que refresh() sólo lee los mensajes archivados desde la última vez."""
+    archive.add(messages((1,), (2, "id_1")))
+    index = ThreadIndex(archive)
+
+    archive.add(messages((3, "id_2")))
+    assert [m.id for m in index.chain("id_3")] == []
+    assert index.refresh() == 1
+    assert index.refresh() == 0
+    assert [m.id for m in index.chain("id_3")] == ["id_1", "id_2", "id_3"]
+
+    # Un hijo archivado antes que su padre se conecta al llegar el padre
+    assert index.add(messages((5, "id_4"))) == 1
+    assert index.missing() == {"id_4"}
+    index.add(messages((4, "id_2")))
+    assert [m.id for m in index.thread("id_1")] == ["id_1", "id_2", "id_3", "id_4", "id_5"]
+
+
+def test_thread_index_replaces_updated_messages(archive, messages):
+    """Test de que add() reindexa un mensaje ya indexado que cambió su reply_to."""
+    archive.add(messages((1,), (2,), (3, "id_1")))
+    index = ThreadIndex(archive)
+
+    assert index.add(messages((3, "msg_2"))) == 0
+    assert index.parent("id_3") == "id_2"
+    assert index.children("id_1") == []
+    assert index.children("id_2") == ["id_3"]
+    assert [m.id for m in index.chain("id_3")] == ["id_2", "id_3"]
+
+
+def test_thread_index_cycle(archive, messages):
+    """Test de que una referencia circular no deja el recorrido en un bucle."""
+    archive.add(messages((1, "id_2"), (2, "id_1")))
+    index = ThreadIndex(archive)
+
+    assert [m.id for m in index.chain("id_2")] == ["id_1", "id_2"]
+    assert [m.id for m in index.thread("id_1")] == ["id_1", "id_2"]
+
+
+def thread_api(known, requests):
+    """Handler de messages.get que registra las peticiones."""
+
+    def handler(request):
+        message_id = request.url.path.rsplit("/", 1)[-1]
+        requests.append(message_id)
+        if message_id not in known:
+            return httpx.Response(404, json={"message": "Message not found"})
+        return httpx.Response(200, json={"data": known[message_id]})
+
+    return handler
+
+
+@respx.mock
+def test_resolve_missing_in_rounds(api_key, archive, make_message, messages):
+    """Test de que los ancestros faltantes se piden por niveles, a la vez."""
+    known = {"id_7": make_message(7), "id_8": make_message(8, "id_7")}
+    requests = []
+    respx.get(url__regex=r"https://api.wasapaso.com/api/v1/messages/\w+$").mock(
+        side_effect=thread_api(known, requests)
+    )
+    archive.add(messages((9, "id_8"), (10, "id_8"), (11, "borrado"), (12,)))
+    index = ThreadIndex(archive, client=WasapasoClient(api_key=api_key))
+
+    assert index.missing(["id_9", "id_12"]) == {"id_8"}
+    assert index.resolve_missing() == 2
+
+    # Ronda 1: id_8 y borrado; ronda 2: id_7
+    assert sorted(requests[:2]) == ["borrado", "id_8"] and requests[2:] == ["id_7"]
+    assert [m.id for m in index.chain("id_10")] == ["id_7", "id_8", "id_10"]
+    assert [m.id for m in index.thread("id_9")] == ["id_7", "id_8", "id_9", "id_10"]
+    assert archive.get("id_7") is not None
+    # Lo que la API no encontró no se vuelve a pedir
+    assert index.missing() == set()
+    assert index.resolve_missing() == 0
+    assert len(requests) == 3
+
+
+@respx.mock
+async def test_resolve_missing_async(api_key, archive, make_message, messages):
+    """Test de la versión asíncrona, limitada a las cadenas pedidas."""
+    known = {"id_1": make_message(1), "id_2": make_message(2, "id_1")}
+    requests = []
+    respx.get(url__regex=r"https://api.wasapaso.com/api/v1/messages/\w+$").mock(
+        side_effect=thread_api(known, requests)
+    )
+    archive.add(messages((3, "id_2"), (5, "id_4")))
+    index = ThreadIndex(archive, client=WasapasoClient(api_key=api_key), concurrency=2)
+
+    assert await index.resolve_missing_async(["id_3"]) == 2
+    assert requests == ["id_2", "id_1"]
+    assert [m.id for m in index.chain("id_3")] == ["id_1", "id_2", "id_3"]
+    assert index.missing() == {"id_4"}
+
+
+def test_resolve_missing_requires_client(archive):
+    """Test de que sin cliente no se puede pedir a la API."""
+    with pytest.raises(ValueError):
+        ThreadIndex(archive).resolve_missing()
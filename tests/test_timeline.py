@@ -0,0 +1,170 @@
+"""Tests para la línea de tiempo unificada de varias sesiones y chats."""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+import respx
+from wasapaso import MessageCursor, NotFoundError
+from wasapaso.models import Message
+from wasapaso.pagination import amerge_pages
+
+
+@pytest.fixture
+def make_message(make_message):
+    """Mensajes recibidos de un chat de una sesión, con ids únicos entre sesiones."""
+
+    def make(session_id, chat_id, index, seconds):
+        return make_message(
+            index,
+            chat_id,
+            seconds=seconds,
+            session_id=session_id,
+            id=f"{session_id}_{chat_id}_{index}",
+        )
+
+    return make
+
+
+def timeline_api(conversations, requests):
+    """
+    Handler de messages.list que respeta before/beforeId.
+
+    ``conversations`` mapea (session_id, chat_id) a sus mensajes; sin
+    chatId se listan todos los chats de la sesión. Cada petición se
+    registra en ``requests``.
+    """
+
+    def key(item):
+        return MessageCursor.of(Message(**item))
+
+    def handler(request):
+        params = request.url.params
+        requests.append((params["sessionId"], params.get("chatId"), params.get("beforeId")))
+        rows = [
+            item
+            for (session_id, chat_id), items in conversations.items()
+            if session_id == params["sessionId"] and params.get("chatId") in (None, chat_id)
+            for item in items
+        ]
+        rows.sort(key=key, reverse=True)
+        if "before" in params:
+            stamp = datetime.fromisoformat(params["before"].replace("Z", "+00:00"))
+            cursor = MessageCursor.of(Message(**{**rows[0], "timestamp": stamp}))
+            cursor = cursor._replace(id=params["beforeId"])
+            rows = [row for row in rows if key(row) < cursor]
+        limit = int(params["limit"])
+        return httpx.Response(200, json={"data": rows[:limit], "pagination": {}})
+
+    return handler
+
+
+async def pages_of(values, size, log, name):
+    """Fuente de páginas de enteros que registra cada página pedida."""
+    for start in range(0, len(values), size):
+        log.append(name)
+        await asyncio.sleep(0)
+        yield values[start : start + size]
+
+
+async def test_amerge_pages_orders_and_buffers_one_page():
+    """Test de que el merge ordena y sólo pide una página por adelantado por fuente."""
+    log = []
+    sources = [
+        pages_of([9, 7, 5, 3, 1], 2, log, "a"),
+        pages_of([8, 6, 4, 2, 0], 2, log, "b"),
+        pages_of([], 2, log, "c"),
+    ]
+
+    merged = []
+    async for value in amerge_pages(sources, key=lambda v: v, reverse=True):
+        merged.append(value)
+        # Páginas de "a" empezadas: la en curso y las anteriores
+        started = max(1, (sum(1 for v in merged if v % 2) + 1) // 2)
+        # Como mucho se pidió una página más que las empezadas
+        assert log.count("a") <= started + 1
+
+    assert merged == list(range(9, -1, -1))
+
+
+async def test_amerge_pages_ascending_ties_by_source():
+    """Test de que los empates se resuelven por el orden de las fuentes."""
+    log = []
+    sources = [
+        pages_of([(1, "a"), (3, "a")], 1, log, "a"),
+        pages_of([(1, "b"), (2, "b")], 1, log, "b"),
+    ]
+
+    merged = [item async for item in amerge_pages(sources, key=lambda item: item[0])]
+
+    assert merged == [(1, "a"), (1, "b"), (2, "b"), (3, "a")]
+
+
+async def test_amerge_pages_closes_sources_on_break():
+    """Test de que al cortar el recorrido se cierran las fuentes y el prefetch."""
+    closed = []
+
+    async def endless(name):
+        try:
+            value = 0
+            while True:
+                yield [value]
+                value += 1
+        finally:
+            closed.append(name)
+
+    merged = amerge_pages([endless("a"), endless("b")], key=lambda v: v)
+    async for value in merged:
+        if value == 3:
+            break
+    await merged.aclose()
+
+    assert sorted(closed) == ["a", "b"]
+
+
+@respx.mock
+async def test_messages_iter_timeline_async(client, make_message):
+    """Test de que se unen sesiones y chats del más reciente al más antiguo."""
+    conversations = {
+        ("s1", "a@c.us"): [make_message("s1", "a@c.us", i, -3 * i) for i in range(12)],
+        ("s1", "b@c.us"): [make_message("s1", "b@c.us", i, -3 * i - 1) for i in range(7)],
+        ("s2", "c@c.us"): [make_message("s2", "c@c.us", i, -5 * i - 2) for i in range(9)],
+        ("s3", "d@c.us"): [],
+    }
+    requests = []
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        side_effect=timeline_api(conversations, requests)
+    )
+
+    sources = ["s1", ("s2", "c@c.us"), ("s3", None), "s1"]
+    messages = [
+        msg
+        async for msg in client.messages.iter_timeline_async(sources, page_size=4, concurrency=2)
+    ]
+
+    expected = sorted(
+        (Message(**item) for items in conversations.values() for item in items),
+        key=MessageCursor.of,
+        reverse=True,
+    )
+    assert [msg.id for msg in messages] == [msg.id for msg in expected]
+    # Cada fuente se pagina por cursor; "s1" repetida se recorre una sola vez
+    assert {(session, chat) for session, chat, _ in requests} == {
+        ("s1", None),
+        ("s2", "c@c.us"),
+        ("s3", None),
+    }
+    assert sum(1 for session, _, _ in requests if session == "s1") == 5
+
+
+@respx.mock
+async def test_messages_iter_timeline_async_errors(client):
+    """Test de que un error de una fuente llega al consumidor."""
+    respx.get("https://api.wasapaso.com/api/v1/messages").mock(
+        return_value=httpx.Response(404, json={"message": "Session not found"})
+    )
+
+    with pytest.raises(NotFoundError):
+        async for _ in client.messages.iter_timeline_async(["s1", "s2"]):
+            pass
@@ -0,0 +1,97 @@
+"""Tests para la validación dry-run de campañas."""
+
+import pytest
+from wasapaso.validation import CampaignRow, dry_run
+
+
+def make_rows():
+    """Filas de ejemplo con errores conocidos."""
+    return [
+        {"session_id": "s1", "to": "5491155550000", "message": "Hola"},
+        {"sessionId": "s1", "to": "123", "message": "Número corto"},
+        {
+            "session_id": "s1",
+            "to": "5491155550001",
+            "type": "image",
+            "media_url": "https://x/a.jpg",
+        },
+        {
+            "session_id": "s1",
+            "to": "5491155550002",
+            "type": "video",
+            "media_url": "https://x/a.mp4",
+            "mimetype": "image/png",
+        },
+        {
+            "session_id": "s1",
+            "to": "5491155550003",
+            "type": "location",
+            "latitude": "95",
+            "longitude": "10",
+        },
+        {
+            "session_id": "s1",
+            "to": "120363@g.us",
+            "type": "audio",
+            "media_data": "AAA",
+            "mimetype": "audio/ogg",
+        },
+        {"session_id": "s1", "to": "5491155550004", "type": "sticker", "message": "x"},
+        {"session_id": "s1", "to": "5491155550005", "message": "", "latitude": ""},
+    ]
+
+
+def test_campaign_row_accepts_csv_strings():
+    """Test de que los valores de CSV se convierten como corresponde."""
+    row = CampaignRow.model_validate(
+        {
+            "session_id": "s1",
+            "to": "+54 9 11 5555-0000",
+            "type": "location",
+            "latitude": "-34.6",
+            "longitude": "-58.4",
+            "title": "",
+        }
+    )
+
+    assert row.latitude == -34.6
+    assert row.title is None
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_dry_run_report(processes):
+    """Test del reporte de errores por fila."""
+    rows = make_rows() * 3
+
+    report = dry_run(rows, chunk_size=5, processes=processes)
+
+    assert report.total == 24
+    assert report.invalid == 15
+    assert report.valid == 9
+    assert sorted(report.errors)[:5] == [1, 3, 4, 6, 7]
+    assert report.errors[1] == ["to: recipient must have between 7 and 15 digits"]
+    assert "does not match media type 'video'" in report.errors[3][0]
+    assert report.errors[4][0].startswith("latitude:")
+    assert report.errors[6][0].startswith("type:")
+    assert report.error_counts["to"] == 3
+    assert report.rows_per_second > 0
+    assert report.truncated is False
+
+
+def test_dry_run_truncates_errors():
+    """Test de que el reporte se mantiene compacto."""
+    rows = [{"session_id": "s1", "to": "1", "message": "x"}] * 50
+
+    report = dry_run(rows, max_errors=10)
+
+    assert report.invalid == 50
+    assert len(report.errors) == 10
+    assert report.truncated is True
+
+
+def test_campaign_row_rejects_unsupported_types():
+    """Test de que los tipos sin soporte en campañas se rechazan."""
+    report = dry_run([{"session_id": "s1", "to": "5491155550000", "type": "poll"}])
+
+    assert report.invalid == 1
+    assert "not supported in campaigns" in report.errors[0][0]
@@ -12,6 +12,8 @@ Example:
     >>> print(session.id)
 """
 
+from wasapaso.analytics import ConversationAggregator, ConversationStats, LatencyHistogram
+from wasapaso.archive import MessageArchive
 from wasapaso.client import WasapasoClient
 from wasapaso.exceptions import (
     WasapasoError,
@@ -20,7 +22,20 @@ from wasapaso.exceptions import (
     RateLimitError,
     NotFoundError,
     PermissionError as WasapasoPermissionError,
+    SuppressedRecipientError,
+    DuplicateMessageError,
+    FrequencyCapExceededError,
+    TemplateError,
+    ResponseTooLargeError,
 )
+from wasapaso.guards import DuplicateGuard, FrequencyCap
+from wasapaso.inbox import Inbox, InboxEntry
+from wasapaso.pagination import MessageCursor
+from wasapaso.raw import RawResponse
+from wasapaso.suppression import SuppressionList
+from wasapaso.sync import MessageSync, SyncResult, WatermarkStore
+from wasapaso.templates import MessageTemplate
+from wasapaso.threads import ThreadIndex
 
 __version__ = "0.1.0"
 __all__ = [
@@ -31,4 +46,25 @@ __all__ = [
     "RateLimitError",
     "NotFoundError",
     "WasapasoPermissionError",
+    "SuppressedRecipientError",
+    "SuppressionList",
+    "DuplicateMessageError",
+    "DuplicateGuard",
+    "FrequencyCapExceededError",
+    "FrequencyCap",
+    "TemplateError",
+    "MessageTemplate",
+    "RawResponse",
+    "ResponseTooLargeError",
+    "MessageCursor",
+    "MessageSync",
+    "SyncResult",
+    "WatermarkStore",
+    "MessageArchive",
+    "ConversationAggregator",
+    "ConversationStats",
+    "LatencyHistogram",
+    "Inbox",
+    "InboxEntry",
+    "ThreadIndex",
 ]
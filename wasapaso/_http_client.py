@@ -1,16 +1,18 @@
 """Cliente HTTP base para comunicación con la API de Wasapaso."""
 
 import json
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
 
 import httpx
 
 from wasapaso.exceptions import (
     ConnectionError,
+    ResponseTooLargeError,
     TimeoutError,
     WasapasoError,
     handle_error_response,
 )
+from wasapaso.raw import RawResponse
 
 
 class HTTPClient:
@@ -46,29 +48,94 @@ class HTTPClient:
         """Construye la URL completa."""
         return f"{self.base_url}/api/v1/{path.lstrip('/')}"
 
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+    def _check_response(self, response: httpx.Response) -> httpx.Response:
         """
-        Procesa la respuesta HTTP y maneja errores.
+        Comprueba el status de la respuesta HTTP.
 
         Args:
             response: Respuesta HTTP de httpx
 
         Returns:
-            Datos de la respuesta como diccionario
+            La misma respuesta, si no es un error
 
         Raises:
             WasapasoError: Si hay un error en la respuesta
         """
+        if response.status_code >= 400:
+            raise handle_error_response(response.status_code, self._decode(response))
+        return response
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Dict[str, Any]:
+        """Decodifica el body JSON de la respuesta."""
         try:
-            data = response.json()
+            return response.json()
         except json.JSONDecodeError:
-            data = {"error": "Invalid JSON response", "raw": response.text}
+            return {"error": "Invalid JSON response", "raw": response.text}
 
-        # Si el status code indica error
-        if response.status_code >= 400:
-            raise handle_error_response(response.status_code, data)
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        content: Optional[bytes],
+    ) -> httpx.Response:
+        """Envía una petición síncrona y devuelve la respuesta ya comprobada."""
+        url = self._get_url(path)
+        timeout_value = timeout or self.timeout
 
-        return data
+        try:
+            with httpx.Client(timeout=timeout_value) as client:
+                response = client.request(
+                    method=method,
+                    url=url,
+                    headers=self._headers,
+                    params=params,
+                    json=json_data if content is None else None,
+                    content=content,
+                )
+                return self._check_response(response)
+
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request timed out after {timeout_value}s") from e
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Failed to connect to {url}") from e
+        except httpx.HTTPError as e:
+            raise WasapasoError(f"HTTP error occurred: {str(e)}") from e
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        content: Optional[bytes],
+    ) -> httpx.Response:
+        """Envía una petición asíncrona y devuelve la respuesta ya comprobada."""
+        url = self._get_url(path)
+        timeout_value = timeout or self.timeout
+
+        try:
+            async with httpx.AsyncClient(timeout=timeout_value) as client:
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=self._headers,
+                    params=params,
+                    json=json_data if content is None else None,
+                    content=content,
+                )
+                return self._check_response(response)
+
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request timed out after {timeout_value}s") from e
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Failed to connect to {url}") from e
+        except httpx.HTTPError as e:
+            raise WasapasoError(f"HTTP error occurred: {str(e)}") from e
 
     def request(
         self,
@@ -77,6 +144,7 @@ class HTTPClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """
         Realiza una petición HTTP síncrona.
@@ -87,6 +155,7 @@ class HTTPClient:
             params: Parámetros de query string
             json_data: Datos JSON para el body
             timeout: Timeout específico para esta petición
+            content: Body JSON ya serializado (tiene prioridad sobre json_data)
 
         Returns:
             Datos de la respuesta
@@ -94,26 +163,8 @@ class HTTPClient:
         Raises:
             WasapasoError: Si hay un error en la petición
         """
-        url = self._get_url(path)
-        timeout_value = timeout or self.timeout
-
-        try:
-            with httpx.Client(timeout=timeout_value) as client:
-                response = client.request(
-                    method=method,
-                    url=url,
-                    headers=self._headers,
-                    params=params,
-                    json=json_data,
-                )
-                return self._handle_response(response)
-
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"Request timed out after {timeout_value}s") from e
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"Failed to connect to {url}") from e
-        except httpx.HTTPError as e:
-            raise WasapasoError(f"HTTP error occurred: {str(e)}") from e
+        response = self._send(method, path, params, json_data, timeout, content)
+        return self._decode(response)
 
     async def request_async(
         self,
@@ -122,6 +173,7 @@ class HTTPClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """
         Realiza una petición HTTP asíncrona.
@@ -132,6 +184,7 @@ class HTTPClient:
             params: Parámetros de query string
             json_data: Datos JSON para el body
             timeout: Timeout específico para esta petición
+            content: Body JSON ya serializado (tiene prioridad sobre json_data)
 
         Returns:
             Datos de la respuesta
@@ -139,19 +192,182 @@ class HTTPClient:
         Raises:
             WasapasoError: Si hay un error en la petición
         """
+        response = await self._send_async(method, path, params, json_data, timeout, content)
+        return self._decode(response)
+
+    def request_bytes(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Realiza una petición HTTP síncrona y devuelve el body sin decodificar.
+
+        Los errores se procesan igual que en request().
+
+        Args:
+            method: Método HTTP (GET, POST, PUT, DELETE, etc.)
+            path: Path del endpoint (relativo a /api/v1/)
+            params: Parámetros de query string
+            json_data: Datos JSON para el body
+            timeout: Timeout específico para esta petición
+            content: Body JSON ya serializado (tiene prioridad sobre json_data)
+
+        Returns:
+            Body JSON de la respuesta
+
+        Raises:
+            WasapasoError: Si hay un error en la petición
+        """
+        return self._send(method, path, params, json_data, timeout, content).content
+
+    async def request_bytes_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """Versión asíncrona de request_bytes()."""
+        response = await self._send_async(method, path, params, json_data, timeout, content)
+        return response.content
+
+    def request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
+    ) -> RawResponse:
+        """
+        Realiza una petición HTTP síncrona y devuelve la respuesta sin decodificar.
+
+        Los errores se procesan igual que en request().
+
+        Args:
+            method: Método HTTP (GET, POST, PUT, DELETE, etc.)
+            path: Path del endpoint (relativo a /api/v1/)
+            params: Parámetros de query string
+            json_data: Datos JSON para el body
+            timeout: Timeout específico para esta petición
+            content: Body JSON ya serializado (tiene prioridad sobre json_data)
+
+        Returns:
+            Status, headers y body de la respuesta
+
+        Raises:
+            WasapasoError: Si hay un error en la petición
+        """
+        response = self._send(method, path, params, json_data, timeout, content)
+        return RawResponse.from_httpx(response)
+
+    async def request_raw_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
+    ) -> RawResponse:
+        """Versión asíncrona de request_raw()."""
+        response = await self._send_async(method, path, params, json_data, timeout, content)
+        return RawResponse.from_httpx(response)
+
+    @staticmethod
+    def _check_size(received: int, max_size: Optional[int]) -> None:
+        """Aborta la lectura si la respuesta supera el tamaño máximo."""
+        if max_size is not None and received > max_size:
+            raise ResponseTooLargeError(
+                f"Response exceeded the maximum allowed size of {max_size} bytes",
+                response_data={"maxSize": max_size, "received": received},
+            )
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Realiza una petición HTTP síncrona y devuelve el body por partes.
+
+        El body no se guarda completo en memoria: cada parte se entrega en
+        cuanto llega. Los errores se procesan igual que en request().
+
+        Args:
+            method: Método HTTP
+            path: Path del endpoint (relativo a /api/v1/)
+            params: Parámetros de query string
+            timeout: Timeout específico para esta petición
+            max_size: Tamaño máximo de la respuesta en bytes (opcional)
+
+        Yields:
+            Partes del body
+
+        Raises:
+            ResponseTooLargeError: Si la respuesta supera max_size
+            WasapasoError: Si hay un error en la petición
+        """
+        url = self._get_url(path)
+        timeout_value = timeout or self.timeout
+
+        try:
+            with httpx.Client(timeout=timeout_value) as client:
+                with client.stream(method, url, headers=self._headers, params=params) as response:
+                    if response.status_code >= 400:
+                        response.read()
+                        self._check_response(response)
+                    self._check_size(int(response.headers.get("content-length", 0)), max_size)
+                    received = 0
+                    for chunk in response.iter_bytes():
+                        received += len(chunk)
+                        self._check_size(received, max_size)
+                        yield chunk
+
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request timed out after {timeout_value}s") from e
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Failed to connect to {url}") from e
+        except httpx.HTTPError as e:
+            raise WasapasoError(f"HTTP error occurred: {str(e)}") from e
+
+    async def stream_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Versión asíncrona de stream()."""
         url = self._get_url(path)
         timeout_value = timeout or self.timeout
 
         try:
             async with httpx.AsyncClient(timeout=timeout_value) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self._headers,
-                    params=params,
-                    json=json_data,
-                )
-                return self._handle_response(response)
+                async with client.stream(
+                    method, url, headers=self._headers, params=params
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._check_response(response)
+                    self._check_size(int(response.headers.get("content-length", 0)), max_size)
+                    received = 0
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        self._check_size(received, max_size)
+                        yield chunk
 
         except httpx.TimeoutException as e:
             raise TimeoutError(f"Request timed out after {timeout_value}s") from e
@@ -184,18 +400,22 @@ class HTTPClient:
         path: str,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """Realiza una petición POST síncrona."""
-        return self.request("POST", path, json_data=json_data, timeout=timeout)
+        return self.request("POST", path, json_data=json_data, timeout=timeout, content=content)
 
     async def post_async(
         self,
         path: str,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """Realiza una petición POST asíncrona."""
-        return await self.request_async("POST", path, json_data=json_data, timeout=timeout)
+        return await self.request_async(
+            "POST", path, json_data=json_data, timeout=timeout, content=content
+        )
 
     def put(
         self,
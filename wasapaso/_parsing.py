@@ -0,0 +1,57 @@
+"""Decodificación de respuestas de la API directamente desde bytes."""
+
+from functools import lru_cache
+from typing import Any, Generic, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class DataEnvelope(BaseModel, Generic[M]):
+    """Envoltorio ``{"success": ..., "data": ...}`` de las respuestas de la API."""
+
+    data: M
+
+
+@lru_cache(maxsize=None)
+def envelope_adapter(model: Type[BaseModel]) -> "TypeAdapter[Any]":
+    """
+    Devuelve el ``TypeAdapter`` (cacheado) del envoltorio de un modelo.
+
+    Args:
+        model: Modelo del campo ``data``
+
+    Returns:
+        Adapter para ``DataEnvelope[model]``
+    """
+    return TypeAdapter(DataEnvelope[model])  # type: ignore[valid-type]
+
+
+def parse_data(content: Union[bytes, str], model: Type[M]) -> M:
+    """
+    Valida el campo ``data`` de una respuesta JSON en una sola pasada.
+
+    Args:
+        content: Body JSON de la respuesta
+        model: Modelo del campo ``data``
+
+    Returns:
+        La instancia del modelo
+    """
+    envelope: DataEnvelope[M] = envelope_adapter(model).validate_json(content)
+    return envelope.data
+
+
+def parse_model(content: Union[bytes, str], model: Type[M]) -> M:
+    """
+    Valida una respuesta JSON completa (por ejemplo, un ``MessageList``).
+
+    Args:
+        content: Body JSON de la respuesta
+        model: Modelo de la respuesta
+
+    Returns:
+        La instancia del modelo
+    """
+    return model.model_validate_json(content)
@@ -0,0 +1,159 @@
+"""
+Construcción rápida de los payloads de envío.
+
+Los builders arman directamente el diccionario que se envía a la API, con
+las mismas claves y en el mismo orden que ``model_dump(by_alias=True,
+exclude_none=True)`` de los modelos de ``wasapaso.models.message``, pero
+sin instanciar modelos pydantic. Con la variable de entorno
+``WASAPASO_DEBUG`` activada (o ``DEBUG = True``) usan los modelos, que
+validan los tipos de cada campo.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from wasapaso.models.message import (
+    Location,
+    LocationMessage,
+    MediaContent,
+    MediaMessage,
+    MessageType,
+    TextMessage,
+)
+
+DEBUG = os.environ.get("WASAPASO_DEBUG", "").lower() in ("1", "true", "yes")
+
+_MESSAGE_TYPES = frozenset(member.value for member in MessageType)
+
+
+def _dump(model: Any) -> Dict[str, Any]:
+    """Serializa un modelo como lo hacían los métodos send_*."""
+    payload: Dict[str, Any] = model.model_dump(by_alias=True, exclude_none=True)
+    return payload
+
+
+def text_payload(
+    session_id: str, to: str, message: str, reply_to: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Arma el payload de send_text().
+
+    Args:
+        session_id: ID de la sesión
+        to: Número de teléfono del destinatario
+        message: Texto del mensaje
+        reply_to: ID del mensaje al que se responde (opcional)
+
+    Returns:
+        Payload listo para enviar
+    """
+    if DEBUG:
+        return _dump(TextMessage(sessionId=session_id, to=to, message=message, replyTo=reply_to))
+    payload: Dict[str, Any] = {"sessionId": session_id, "to": to}
+    if reply_to is not None:
+        payload["replyTo"] = reply_to
+    payload["message"] = message
+    payload["type"] = "text"
+    return payload
+
+
+def media_payload(
+    session_id: str,
+    to: str,
+    media_type: str,
+    media_url: Optional[str] = None,
+    media_data: Optional[str] = None,
+    mimetype: str = "image/jpeg",
+    caption: Optional[str] = None,
+    filename: Optional[str] = None,
+    reply_to: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Arma el payload de send_media().
+
+    Args:
+        session_id: ID de la sesión
+        to: Número de teléfono del destinatario
+        media_type: Tipo de media (image, video, audio, file)
+        media_url: URL del archivo multimedia (opcional)
+        media_data: Datos en base64 del archivo (opcional)
+        mimetype: Tipo MIME del archivo
+        caption: Texto de caption (opcional)
+        filename: Nombre del archivo (opcional)
+        reply_to: ID del mensaje al que se responde (opcional)
+
+    Returns:
+        Payload listo para enviar
+
+    Raises:
+        ValueError: Si el tipo de media no es un MessageType válido
+    """
+    if DEBUG:
+        media = MediaContent(url=media_url, data=media_data, mimetype=mimetype, filename=filename)
+        return _dump(
+            MediaMessage(
+                sessionId=session_id,
+                to=to,
+                type=MessageType(media_type),
+                media=media,
+                caption=caption,
+                replyTo=reply_to,
+            )
+        )
+    if media_type not in _MESSAGE_TYPES:
+        # Mismo error que MessageType(media_type)
+        raise ValueError(f"{media_type!r} is not a valid MessageType")
+    content: Dict[str, Any] = {}
+    if media_url is not None:
+        content["url"] = media_url
+    if media_data is not None:
+        content["data"] = media_data
+    content["mimetype"] = mimetype
+    if filename is not None:
+        content["filename"] = filename
+    payload: Dict[str, Any] = {"sessionId": session_id, "to": to}
+    if reply_to is not None:
+        payload["replyTo"] = reply_to
+    payload["type"] = media_type
+    payload["media"] = content
+    if caption is not None:
+        payload["caption"] = caption
+    return payload
+
+
+def location_payload(
+    session_id: str,
+    to: str,
+    latitude: float,
+    longitude: float,
+    title: Optional[str] = None,
+    reply_to: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Arma el payload de send_location().
+
+    Args:
+        session_id: ID de la sesión
+        to: Número de teléfono del destinatario
+        latitude: Latitud
+        longitude: Longitud
+        title: Título de la ubicación (opcional)
+        reply_to: ID del mensaje al que se responde (opcional)
+
+    Returns:
+        Payload listo para enviar
+    """
+    if DEBUG:
+        location = Location(latitude=latitude, longitude=longitude, title=title)
+        return _dump(
+            LocationMessage(sessionId=session_id, to=to, location=location, replyTo=reply_to)
+        )
+    point: Dict[str, Any] = {"latitude": float(latitude), "longitude": float(longitude)}
+    if title is not None:
+        point["title"] = title
+    payload: Dict[str, Any] = {"sessionId": session_id, "to": to}
+    if reply_to is not None:
+        payload["replyTo"] = reply_to
+    payload["type"] = "location"
+    payload["location"] = point
+    return payload
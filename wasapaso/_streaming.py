@@ -0,0 +1,136 @@
+"""Decodificación incremental de respuestas JSON con listas grandes."""
+
+import re
+from typing import Any, List, Optional
+
+from pydantic_core import from_json
+
+# Un string JSON completo (o su comienzo, si el grupo 1 queda vacío) o un corchete/llave
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*("?)|[\[\]{}]')
+
+# Un objeto completo sin anidar (el caso de los mensajes), reconocido de una sola vez
+_FLAT_OBJECT = re.compile(rb'\{[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*\}')
+
+_OPEN_OBJECT, _OPEN_ARRAY, _CLOSE_OBJECT, _CLOSE_ARRAY = b"{[}]"
+
+
+class ArrayItemSplitter:
+    """
+    Separa los elementos de un array del objeto raíz a medida que llegan los bytes.
+
+    Recibe la respuesta por partes con :meth:`feed` y devuelve el JSON de
+    cada elemento del array ``field`` (por ejemplo ``data``) en cuanto se
+    completa, sin esperar al resto del documento. Sólo conserva en memoria
+    el elemento en curso y el resto del documento (sin los elementos), que
+    se obtiene al final con :meth:`metadata`.
+
+    Example:
+        >>> splitter = ArrayItemSplitter("data")
+        >>> splitter.feed(b'{"data": [{"id": 1}, {"id"')
+        [b'{"id": 1}']
+        >>> splitter.feed(b': 2}], "pagination": {}}')
+        [b'{"id": 2}']
+        >>> splitter.metadata()
+        {'data': [], 'pagination': {}}
+    """
+
+    def __init__(self, field: str = "data") -> None:
+        """
+        Crea el separador.
+
+        Args:
+            field: Nombre del array del objeto raíz cuyos elementos se separan
+        """
+        self._field = field.encode("utf-8")
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._last_key: Optional[bytes] = None
+        self._in_array = False
+        self._item_start: Optional[int] = None
+        self._meta = bytearray()
+        self._meta_from: Optional[int] = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Procesa una parte de la respuesta.
+
+        Args:
+            chunk: Bytes recibidos
+
+        Returns:
+            JSON de los elementos completados en esta parte
+        """
+        buffer = self._buffer
+        buffer += chunk
+        items: List[bytes] = []
+        pos = self._pos
+        depth = self._depth
+        search = _TOKEN.search
+
+        while True:
+            match = search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            start = match.start()
+            char = buffer[start]
+            if char == 0x22:  # "
+                if not match.group(1):
+                    # String incompleto: esperar más datos
+                    pos = start
+                    break
+                if depth == 1:
+                    self._last_key = bytes(buffer[start + 1 : match.end() - 1])
+                pos = match.end()
+                continue
+
+            if char == _OPEN_OBJECT and self._in_array and depth == 2:
+                flat = _FLAT_OBJECT.match(buffer, start)
+                if flat is not None:
+                    items.append(flat.group())
+                    pos = flat.end()
+                    continue
+
+            if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+                depth += 1
+                if self._in_array:
+                    if depth == 3:
+                        self._item_start = start
+                elif depth == 2 and char == _OPEN_ARRAY and self._last_key == self._field:
+                    self._in_array = True
+                    self._meta += buffer[self._meta_from : start + 1]
+                    self._meta_from = None
+            else:
+                depth -= 1
+                if self._in_array:
+                    if depth == 2 and self._item_start is not None:
+                        items.append(bytes(buffer[self._item_start : start + 1]))
+                        self._item_start = None
+                    elif depth == 1:
+                        self._in_array = False
+                        self._meta_from = start
+            pos = start + 1
+
+        self._depth = depth
+        # Descartar lo ya procesado, conservando el elemento en curso
+        keep = pos if self._item_start is None else min(pos, self._item_start)
+        if self._meta_from is not None:
+            self._meta += buffer[self._meta_from : keep]
+            self._meta_from = 0
+        del buffer[:keep]
+        self._pos = pos - keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        return items
+
+    def metadata(self) -> Any:
+        """
+        Devuelve el resto del documento, con el array vacío.
+
+        Raises:
+            ValueError: Si el documento está incompleto
+        """
+        if self._depth != 0 or self._buffer.strip():
+            raise ValueError("Incomplete JSON document")
+        return from_json(bytes(self._meta))
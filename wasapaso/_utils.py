@@ -0,0 +1,57 @@
+"""Utilidades internas compartidas por los módulos del SDK."""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+# Dominios de WhatsApp que identifican a un usuario individual
+_USER_DOMAINS = ("c.us", "s.whatsapp.net")
+
+
+def normalize_number(number: str) -> str:
+    """
+    Normaliza un número de teléfono o ID de WhatsApp.
+
+    Los números individuales se reducen a sus dígitos, de modo que
+    ``"+1 (234) 567-890"``, ``"1234567890"`` y ``"1234567890@c.us"``
+    producen el mismo resultado. Los IDs de otros dominios (grupos,
+    canales) se conservan completos en minúsculas, igual que las entradas
+    sin ningún dígito, para que dos valores mal formados distintos no
+    terminen en la misma clave vacía.
+
+    Args:
+        number: Número de teléfono o ID de WhatsApp
+
+    Returns:
+        El número normalizado
+    """
+    number = number.strip()
+    local, sep, domain = number.partition("@")
+    if sep and domain.lower() not in _USER_DOMAINS:
+        return number.lower()
+    if local.isdigit():
+        return local
+    digits = "".join(ch for ch in local if ch.isdigit())
+    return digits or number.lower()
+
+
+def hash_number(number: str, normalize: bool = True) -> int:
+    """
+    Calcula un hash estable de 64 bits para un número.
+
+    Args:
+        number: Número de teléfono o ID de WhatsApp
+        normalize: Si es True, normaliza el número antes de calcular el hash
+
+    Returns:
+        Hash como entero sin signo de 64 bits
+    """
+    if normalize:
+        number = normalize_number(number)
+    digest = hashlib.blake2b(number.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def dump_json(payload: Dict[str, Any]) -> bytes:
+    """Serializa un payload en JSON compacto UTF-8."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
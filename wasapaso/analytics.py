@@ -0,0 +1,437 @@
+"""
+Estadísticas de conversaciones calculadas en una sola pasada.
+
+:class:`ConversationAggregator` recorre un iterador de mensajes (por
+ejemplo ``messages.iter_all()`` o el sink de :class:`~wasapaso.sync.MessageSync`)
+sin guardarlos, y acumula cantidades por sesión y chat, tipo y hora, la relación
+entre mensajes recibidos y enviados y la latencia de primera respuesta.
+Las latencias se guardan en :class:`LatencyHistogram`, un histograma de
+buckets logarítmicos (al estilo de HdrHistogram/DDSketch) con error
+relativo acotado que se puede combinar con otros, así que los resultados
+de varios procesos o ejecuciones se unen con :meth:`ConversationStats.merge`.
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, field_validator
+
+from wasapaso.models.message import Message
+from wasapaso.models.records import MessageRecord, timestamp_to_ms
+
+_HOUR_MS = 3_600_000
+
+MessageLike = Union[Message, MessageRecord]
+
+# (session_id, chat_id)
+ChatKey = Tuple[str, str]
+
+
+@lru_cache(maxsize=None)
+def _log_gamma(relative_accuracy: float) -> float:
+    """Logaritmo de la razón entre buckets consecutivos para una precisión."""
+    return math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+
+
+class LatencyHistogram(BaseModel):
+    """
+    Distribución de latencias en buckets logarítmicos, combinable.
+
+    Cada valor positivo ``v`` cae en el bucket ``ceil(log(v) / log(gamma))``
+    con ``gamma = (1 + a) / (1 - a)``, así que los cuantiles tienen un error
+    relativo de como mucho ``a`` (``relative_accuracy``) sin importar la
+    cantidad de valores ni su rango, y dos histogramas con la misma
+    precisión se combinan sumando sus buckets.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for seconds in (12.0, 30.5, 95.0):
+        ...     histogram.record(seconds)
+        >>> round(histogram.quantile(0.5), 1)  # 30.5 con error relativo <= 1%
+        30.3
+    """
+
+    relative_accuracy: float = 0.01
+    buckets: Dict[int, int] = Field(default_factory=dict)
+    zero_count: int = 0  # Valores <= 0
+    count: int = 0
+    total: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    @field_validator("relative_accuracy")
+    @classmethod
+    def _check_accuracy(cls, value: float) -> float:
+        """Valida que la precisión esté entre 0 y 1."""
+        if not 0 < value < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        return value
+
+    def record(self, value: float, count: int = 1) -> None:
+        """
+        Registra un valor.
+
+        Args:
+            value: Latencia (por ejemplo, en segundos)
+            count: Cantidad de veces que se observó
+        """
+        # Es la operación más frecuente: se escribe en __dict__ para evitar el
+        # __setattr__ de pydantic (los valores ya son del tipo correcto)
+        fields = self.__dict__
+        if value > 0:
+            index = math.ceil(math.log(value) / _log_gamma(self.relative_accuracy))
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        else:
+            fields["zero_count"] += count
+        fields["count"] += count
+        fields["total"] += value * count
+        if self.min is None or value < self.min:
+            fields["min"] = value
+        if self.max is None or value > self.max:
+            fields["max"] = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Suma otro histograma a este.
+
+        Args:
+            other: Histograma con la misma precisión
+
+        Returns:
+            Este histograma
+
+        Raises:
+            ValueError: Si las precisiones no coinciden
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative_accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def _clone(self) -> "LatencyHistogram":
+        """Devuelve una copia independiente del histograma."""
+        return self.model_copy(update={"buckets": dict(self.buckets)})
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Promedio exacto de los valores, o None si no hay valores."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estima un cuantil.
+
+        Args:
+            q: Cuantil entre 0 y 1 (0.5 es la mediana, 0.95 el p95)
+
+        Returns:
+            El valor estimado, con error relativo <= relative_accuracy, o
+            None si no hay valores
+
+        Raises:
+            ValueError: Si q no está entre 0 y 1
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        gamma = math.exp(_log_gamma(self.relative_accuracy))
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * gamma**index / (gamma + 1)
+                # Los extremos se conocen exactamente
+                return min(max(estimate, self.min or 0.0), self.max or estimate)
+        return self.max
+
+
+class ChatStats(BaseModel):
+    """Estadísticas de un chat."""
+
+    inbound: int = 0
+    outbound: int = 0
+    response_times: LatencyHistogram = Field(default_factory=LatencyHistogram)
+
+    @property
+    def total(self) -> int:
+        """Cantidad de mensajes del chat."""
+        return self.inbound + self.outbound
+
+    def merge(self, other: "ChatStats") -> "ChatStats":
+        """Suma las estadísticas de otro chat (o del mismo chat en otro proceso)."""
+        self.inbound += other.inbound
+        self.outbound += other.outbound
+        self.response_times.merge(other.response_times)
+        return self
+
+
+class ConversationStats(BaseModel):
+    """
+    Estadísticas de conversaciones acumuladas por ConversationAggregator.
+
+    Se guardan y se recuperan con ``model_dump_json()`` y
+    ``model_validate_json()``. Las latencias de primera respuesta están en
+    segundos. Los chats se agrupan por sesión (``by_chat[session_id][chat_id]``),
+    porque el mismo chat en dos sesiones es otra conversación.
+    """
+
+    total: int = 0
+    inbound: int = 0
+    outbound: int = 0
+    by_chat: Dict[str, Dict[str, ChatStats]] = Field(default_factory=dict)
+    by_type: Dict[str, int] = Field(default_factory=dict)
+    by_hour: Dict[int, int] = Field(default_factory=dict)  # Inicio de la hora (ms, UTC)
+    response_times: LatencyHistogram = Field(default_factory=LatencyHistogram)
+    # Primer mensaje recibido sin responder de cada chat (ms), por sesión, para
+    # continuar en una ejecución posterior con mensajes en orden cronológico
+    pending: Dict[str, Dict[str, int]] = Field(default_factory=dict)
+
+    @property
+    def outbound_ratio(self) -> Optional[float]:
+        """Fracción de mensajes enviados por la sesión, o None si no hay mensajes."""
+        return self.outbound / self.total if self.total else None
+
+    @property
+    def hour_of_day(self) -> List[int]:
+        """Cantidad de mensajes por hora del día (UTC), de 0 a 23."""
+        hours = [0] * 24
+        for start, count in self.by_hour.items():
+            hours[(start // _HOUR_MS) % 24] += count
+        return hours
+
+    def merge(self, other: "ConversationStats") -> "ConversationStats":
+        """
+        Combina las estadísticas de otro proceso o de otro rango de mensajes.
+
+        Para que las latencias sean exactas, cada chat tiene que procesarse
+        entero en uno solo de los procesos (por ejemplo, repartiendo los
+        chats entre procesos). Para continuar una ejecución anterior con
+        mensajes nuevos, conviene pasar sus estadísticas a
+        ConversationAggregator en lugar de combinarlas.
+
+        Args:
+            other: Estadísticas a sumar
+
+        Returns:
+            Estadísticas nuevas con la suma de ambas
+        """
+        merged = self.model_copy(deep=True)
+        merged.total += other.total
+        merged.inbound += other.inbound
+        merged.outbound += other.outbound
+        for session_id, chats in other.by_chat.items():
+            merged_chats = merged.by_chat.setdefault(session_id, {})
+            for chat_id, chat in chats.items():
+                if chat_id in merged_chats:
+                    merged_chats[chat_id].merge(chat)
+                else:
+                    merged_chats[chat_id] = chat.model_copy(deep=True)
+        for kind, count in other.by_type.items():
+            merged.by_type[kind] = merged.by_type.get(kind, 0) + count
+        for hour, count in other.by_hour.items():
+            merged.by_hour[hour] = merged.by_hour.get(hour, 0) + count
+        merged.response_times.merge(other.response_times)
+        for session_id, pending in other.pending.items():
+            merged_pending = merged.pending.setdefault(session_id, {})
+            for chat_id, since in pending.items():
+                merged_pending[chat_id] = min(since, merged_pending.get(chat_id, since))
+        return merged
+
+
+class ConversationAggregator:
+    """
+    Acumula estadísticas de conversaciones recorriendo los mensajes una vez.
+
+    Cada chat se identifica por ``(session_id, chat_id)``, así que un flujo
+    con varias sesiones (por ejemplo ``iter_timeline_async()``) no mezcla
+    sus cantidades ni sus respuestas. La latencia de primera respuesta de
+    un chat es el tiempo entre el primer mensaje recibido sin responder y
+    el primer mensaje enviado después en esa sesión. Para calcularla, los
+    mensajes de cada chat tienen que llegar en orden: cronológico
+    (``order="asc"``, como los entrega MessageSync) o del más reciente al
+    más antiguo (``order="desc"``, como ``iter_cursor()``). Los mensajes de
+    distintos chats pueden mezclarse.
+
+    Example:
+        >>> aggregator = ConversationAggregator(order="desc")
+        >>> aggregator.update(client.messages.iter_cursor("64abc123..."))
+        >>> stats = aggregator.result()
+        >>> stats.response_times.quantile(0.9), stats.outbound_ratio
+        (312.4, 0.41)
+    """
+
+    def __init__(
+        self,
+        stats: Optional[ConversationStats] = None,
+        order: Literal["asc", "desc"] = "asc",
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        """
+        Crea el acumulador.
+
+        Args:
+            stats: Estadísticas de una ejecución anterior a continuar (opcional;
+                sólo con order="asc")
+            order: Orden de los mensajes de cada chat
+            relative_accuracy: Precisión de los histogramas de latencia
+                (se ignora si se pasa stats)
+
+        Raises:
+            ValueError: Si el orden no es válido o se continúa en orden descendente
+        """
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid order: {order!r}")
+        if stats is not None and stats.pending and order == "desc":
+            raise ValueError("Pending responses can only be continued with order='asc'")
+        self.order = order
+        # Las cantidades se acumulan en estructuras simples y se convierten
+        # en modelos recién en result()
+        self._total = self._inbound = self._outbound = 0
+        self._chats: Dict[ChatKey, List[int]] = {}  # chat -> [recibidos, enviados]
+        self._by_type: Dict[str, int] = {}
+        self._by_hour: Dict[int, int] = {}
+        self._response_times = LatencyHistogram(relative_accuracy=relative_accuracy)
+        self._chat_response_times: Dict[ChatKey, LatencyHistogram] = {}
+        self._pending: Dict[ChatKey, int] = {}
+        if stats is not None:
+            self._total, self._inbound, self._outbound = stats.total, stats.inbound, stats.outbound
+            for session_id, chats in stats.by_chat.items():
+                for chat_id, chat in chats.items():
+                    key = (session_id, chat_id)
+                    self._chats[key] = [chat.inbound, chat.outbound]
+                    if chat.response_times.count:
+                        self._chat_response_times[key] = chat.response_times._clone()
+            self._by_type = dict(stats.by_type)
+            self._by_hour = dict(stats.by_hour)
+            self._response_times = stats.response_times._clone()
+            for session_id, pending in stats.pending.items():
+                for chat_id, since in pending.items():
+                    self._pending[(session_id, chat_id)] = since
+        # Con order="desc": primera respuesta vista (la más antigua hasta
+        # ahora) y primer mensaje recibido del tramo sin responder
+        self._answers: Dict[ChatKey, int] = {}
+        self._unanswered: Dict[ChatKey, int] = {}
+
+    def add(self, message: MessageLike) -> None:
+        """
+        Agrega un mensaje.
+
+        Args:
+            message: Message o MessageRecord
+        """
+        from_me = message.from_me
+        chat_id = (message.session_id, message.to if from_me else message.from_)
+        timestamp = message.timestamp
+        if not isinstance(timestamp, int):
+            timestamp = timestamp_to_ms(timestamp)
+
+        self._total += 1
+        counts = self._chats.get(chat_id)
+        if counts is None:
+            counts = self._chats[chat_id] = [0, 0]
+        if from_me:
+            self._outbound += 1
+            counts[1] += 1
+        else:
+            self._inbound += 1
+            counts[0] += 1
+        by_type = self._by_type
+        by_type[message.type] = by_type.get(message.type, 0) + 1
+        hour = timestamp - timestamp % _HOUR_MS
+        self._by_hour[hour] = self._by_hour.get(hour, 0) + 1
+
+        if self.order == "asc":
+            pending = self._pending
+            if not from_me:
+                if chat_id not in pending:
+                    pending[chat_id] = timestamp
+            elif chat_id in pending:
+                self._record(chat_id, timestamp - pending.pop(chat_id))
+        elif not from_me:
+            if chat_id in self._answers:
+                self._unanswered[chat_id] = timestamp
+        else:
+            if chat_id in self._unanswered:
+                # Terminó un tramo de mensajes recibidos: la respuesta es la
+                # más antigua de las enviadas después del tramo
+                self._record(chat_id, self._answers[chat_id] - self._unanswered.pop(chat_id))
+            self._answers[chat_id] = timestamp
+
+    def _record(self, chat_id: ChatKey, latency_ms: int) -> None:
+        """Registra una latencia de primera respuesta."""
+        seconds = latency_ms / 1000
+        histogram = self._chat_response_times.get(chat_id)
+        if histogram is None:
+            histogram = self._chat_response_times[chat_id] = LatencyHistogram(
+                relative_accuracy=self._response_times.relative_accuracy
+            )
+        histogram.record(seconds)
+        self._response_times.record(seconds)
+
+    def update(self, messages: Iterable[MessageLike]) -> None:
+        """
+        Agrega varios mensajes; se puede usar como sink de MessageSync.
+
+        Args:
+            messages: Mensajes en el orden indicado al crear el acumulador
+        """
+        add = self.add
+        for message in messages:
+            add(message)
+
+    def result(self) -> ConversationStats:
+        """
+        Devuelve las estadísticas acumuladas hasta el momento.
+
+        Con order="desc", los tramos sin responder más antiguos que se
+        vieron se cierran con la respuesta ya vista, tomando como inicio el
+        mensaje recibido más antiguo que llegó a recorrerse.
+        """
+        accuracy = self._response_times.relative_accuracy
+        response_times = self._response_times._clone()
+        chat_response_times = {
+            chat_id: histogram._clone() for chat_id, histogram in self._chat_response_times.items()
+        }
+        for chat_id, since in self._unanswered.items():
+            seconds = (self._answers[chat_id] - since) / 1000
+            histogram = chat_response_times.get(chat_id)
+            if histogram is None:
+                histogram = chat_response_times[chat_id] = LatencyHistogram(
+                    relative_accuracy=accuracy
+                )
+            histogram.record(seconds)
+            response_times.record(seconds)
+        by_chat: Dict[str, Dict[str, ChatStats]] = {}
+        for key, (inbound, outbound) in self._chats.items():
+            by_chat.setdefault(key[0], {})[key[1]] = ChatStats(
+                inbound=inbound,
+                outbound=outbound,
+                response_times=chat_response_times.get(key)
+                or LatencyHistogram(relative_accuracy=accuracy),
+            )
+        pending: Dict[str, Dict[str, int]] = {}
+        for key, since in self._pending.items():
+            pending.setdefault(key[0], {})[key[1]] = since
+        return ConversationStats(
+            total=self._total,
+            inbound=self._inbound,
+            outbound=self._outbound,
+            by_chat=by_chat,
+            by_type=dict(self._by_type),
+            by_hour=dict(self._by_hour),
+            response_times=response_times,
+            pending=pending,
+        )
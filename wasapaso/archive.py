@@ -0,0 +1,506 @@
+"""Archivo local de mensajes en SQLite, con búsqueda de texto completo."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+
+from wasapaso.models.message import Message, MessageList
+from wasapaso.models.records import timestamp_to_ms
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    message_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    chat_id TEXT NOT NULL,
+    from_me INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    body TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_by_chat ON messages (chat_id, session_id, timestamp, id);
+CREATE INDEX IF NOT EXISTS messages_by_from_me ON messages (session_id, from_me, timestamp, id);
+CREATE INDEX IF NOT EXISTS messages_by_session ON messages (session_id, timestamp, id);
+CREATE INDEX IF NOT EXISTS messages_by_message_id ON messages (message_id);
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    ids TEXT NOT NULL,
+    pagination TEXT NOT NULL
+);
+"""
+
+# Índice invertido sobre messages.body, mantenido por triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    body, content='messages', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, body) VALUES (new.rowid, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, body) VALUES ('delete', old.rowid, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF body ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, body) VALUES ('delete', old.rowid, old.body);
+    INSERT INTO messages_fts (rowid, body) VALUES (new.rowid, new.body);
+END;
+"""
+
+# Los mensajes existentes se actualizan en el lugar (conservan su rowid en el índice)
+_UPSERT = """
+INSERT INTO messages (id, message_id, session_id, chat_id, from_me, timestamp, body, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    message_id = excluded.message_id,
+    session_id = excluded.session_id,
+    chat_id = excluded.chat_id,
+    from_me = excluded.from_me,
+    timestamp = excluded.timestamp,
+    body = excluded.body,
+    data = excluded.data
+"""
+
+_Row = Tuple[str, str, str, str, int, int, Optional[str], str]
+
+# Parámetros por consulta en las búsquedas por lista de ids (SQLite admite 999)
+_IDS_PER_QUERY = 500
+
+SearchMode = Literal["words", "prefix", "phrase", "raw"]
+
+
+def fts_query(text: str, mode: SearchMode = "words") -> str:
+    """
+    Convierte un texto de búsqueda en una expresión MATCH de FTS5.
+
+    Args:
+        text: Texto de búsqueda
+        mode: ``words`` (todas las palabras, en cualquier orden), ``prefix``
+            (todas las palabras como prefijos, para autocompletar), ``phrase``
+            (las palabras juntas y en orden) o ``raw`` (expresión FTS5 tal cual)
+
+    Returns:
+        La expresión para ``messages_fts MATCH ?``
+
+    Raises:
+        ValueError: Si el modo no es válido o el texto no tiene palabras
+
+    Example:
+        >>> fts_query("factura venc", "prefix")
+        '"factura"* "venc"*'
+    """
+    if mode == "raw":
+        return text
+    words = text.split()
+    if not words:
+        raise ValueError("Search text must contain at least one word")
+    quoted = ['"' + word.replace('"', '""') + '"' for word in words]
+    if mode == "words":
+        return " ".join(quoted)
+    if mode == "prefix":
+        return " ".join(word + "*" for word in quoted)
+    if mode == "phrase":
+        return '"' + " ".join(words).replace('"', '""') + '"'
+    raise ValueError(f"Invalid search mode: {mode!r}")
+
+
+def chat_of(message: Message) -> str:
+    """
+    Devuelve el chat de un mensaje: el destinatario si lo envió la sesión,
+    el remitente si lo recibió.
+    """
+    return message.to if message.from_me else message.from_
+
+
+class MessageArchive:
+    """
+    Archivo local de mensajes respaldado por SQLite.
+
+    Guarda los mensajes descargados con índices por sesión, chat,
+    ``from_me`` y timestamp, así que las consultas locales con
+    :meth:`query` responden en milisegundos sin pasar por la API. Pasado
+    al cliente (``WasapasoClient(archive=...)``), ``messages.get()`` sirve
+    los mensajes ya archivados y ``messages.delete()`` los quita del
+    archivo. Con ``page_ttl``, ``messages.list()`` repite además las
+    páginas pedidas hace menos de ``page_ttl`` segundos (los mensajes
+    nuevos no aparecen en ellas hasta que expiran).
+
+    Con ``full_text`` mantiene además un índice invertido (SQLite FTS5)
+    sobre el texto de los mensajes, actualizado por triggers en la misma
+    transacción que cada inserción, que :meth:`search` consulta por
+    palabras, prefijos o frases.
+
+    Las inserciones se agrupan en transacciones de ``batch_size`` filas.
+    Es seguro usarlo desde varios hilos.
+
+    Example:
+        >>> archive = MessageArchive("messages.db", page_ttl=60)
+        >>> client = WasapasoClient(api_key="wsk_...", archive=archive)
+        >>> client.messages.list("64abc123...", limit=100)  # API
+        >>> client.messages.list("64abc123...", limit=100)  # archivo local
+        >>> archive.query("64abc123...", chat_id="5491100000000@c.us", from_me=False)
+        >>> archive.search("factura venc", mode="prefix", chat_id="5491100000000@c.us")
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+        page_ttl: Optional[float] = None,
+        batch_size: int = 1000,
+        full_text: bool = True,
+    ) -> None:
+        """
+        Abre (o crea) el archivo.
+
+        Args:
+            path: Ruta de la base SQLite (por defecto, en memoria)
+            page_ttl: Segundos durante los que una página de list() se sirve
+                desde el archivo; None (por defecto) para no servir páginas
+                y servir sólo get()
+            batch_size: Filas por transacción en las inserciones masivas
+            full_text: Mantener el índice de texto completo para search()
+
+        Raises:
+            RuntimeError: Si se pide full_text y SQLite no incluye FTS5
+        """
+        self.path = os.fspath(path)
+        self.page_ttl = page_ttl
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.full_text = full_text
+        if full_text:
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+            except sqlite3.OperationalError as e:
+                raise RuntimeError(f"SQLite full-text search (FTS5) unavailable: {e}") from e
+
+    def close(self) -> None:
+        """Cierra la base de datos."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "MessageArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()
+        return int(count)
+
+    @staticmethod
+    def _row(message: Message) -> _Row:
+        """Fila de la tabla messages para un mensaje."""
+        return (
+            message.id,
+            message.message_id,
+            message.session_id,
+            chat_of(message),
+            int(message.from_me),
+            timestamp_to_ms(message.timestamp),
+            message.body,
+            message.model_dump_json(by_alias=True),
+        )
+
+    def add(self, messages: Iterable[Message]) -> int:
+        """
+        Guarda mensajes (los existentes se reemplazan).
+
+        Args:
+            messages: Mensajes a guardar
+
+        Returns:
+            Cantidad de mensajes guardados
+        """
+        rows = map(self._row, messages)
+        total = 0
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return total
+            with self._lock, self._conn:
+                self._conn.executemany(_UPSERT, batch)
+            total += len(batch)
+
+    def get(self, message_id: str) -> Optional[Message]:
+        """
+        Busca un mensaje archivado por su ``id`` o su ``message_id``.
+
+        Args:
+            message_id: ID del mensaje
+
+        Returns:
+            El mensaje, o None si no está archivado
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM messages WHERE id = ? UNION ALL "
+                "SELECT data FROM messages WHERE message_id = ? LIMIT 1",
+                (message_id, message_id),
+            ).fetchone()
+        return Message.model_validate_json(row[0]) if row else None
+
+    def remove(self, message_id: str) -> bool:
+        """
+        Quita un mensaje del archivo y las páginas de list() que lo incluyen.
+
+        Args:
+            message_id: ``id`` o ``message_id`` del mensaje
+
+        Returns:
+            True si el mensaje estaba archivado
+        """
+        with self._lock, self._conn:
+            ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT id FROM messages WHERE id = ? OR message_id = ?",
+                    (message_id, message_id),
+                )
+            ]
+            for current in ids:
+                self._conn.execute("DELETE FROM messages WHERE id = ?", (current,))
+                self._conn.execute(
+                    "DELETE FROM pages WHERE instr(ids, ?) > 0", (json.dumps(current),)
+                )
+        return bool(ids)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, Message]:
+        """
+        Busca varios mensajes archivados por su ``id`` o su ``message_id``.
+
+        Args:
+            ids: IDs de los mensajes
+
+        Returns:
+            Los mensajes encontrados, por el ID con el que se pidieron
+        """
+        ids = list(dict.fromkeys(ids))
+        found: Dict[str, Message] = {}
+        for start in range(0, len(ids), _IDS_PER_QUERY):
+            chunk = ids[start : start + _IDS_PER_QUERY]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, message_id, data FROM messages WHERE id IN ({placeholders}) "
+                    "UNION ALL SELECT id, message_id, data FROM messages "
+                    f"WHERE message_id IN ({placeholders})",
+                    chunk + chunk,
+                ).fetchall()
+            wanted = set(chunk)
+            for message_id, alias, data in rows:
+                for key in (message_id, alias):
+                    if key in wanted and key not in found:
+                        found[key] = Message.model_validate_json(data)
+        return found
+
+    def query(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = 50,
+        offset: int = 0,
+    ) -> List[Message]:
+        """
+        Consulta los mensajes archivados, del más reciente al más antiguo.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            since: Sólo mensajes con timestamp >= since (milisegundos desde epoch)
+            until: Sólo mensajes con timestamp < until (milisegundos desde epoch)
+            limit: Cantidad máxima de resultados (None para todos)
+            offset: Resultados a saltear
+
+        Returns:
+            Los mensajes que cumplen los filtros
+        """
+        sql = ["SELECT data FROM messages WHERE session_id = ?"]
+        args: List[Any] = [session_id]
+        if chat_id is not None:
+            sql.append("AND chat_id = ?")
+            args.append(chat_id)
+        if from_me is not None:
+            sql.append("AND from_me = ?")
+            args.append(int(from_me))
+        if since is not None:
+            sql.append("AND timestamp >= ?")
+            args.append(since)
+        if until is not None:
+            sql.append("AND timestamp < ?")
+            args.append(until)
+        sql.append("ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?")
+        args.extend((-1 if limit is None else limit, offset))
+        with self._lock:
+            rows = self._conn.execute(" ".join(sql), args).fetchall()
+        return [Message.model_validate_json(row[0]) for row in rows]
+
+    def scan(self, after: int = 0) -> Iterator[Tuple[int, Message]]:
+        """
+        Recorre los mensajes en el orden en que se archivaron.
+
+        Cada mensaje viene con su posición (rowid); guardando la última se
+        puede retomar el recorrido más tarde y leer sólo los mensajes
+        archivados desde entonces. Un mensaje que se vuelve a guardar
+        conserva su posición. Lee de a ``batch_size`` filas.
+
+        Args:
+            after: Posición del último mensaje ya leído (0 para empezar)
+
+        Yields:
+            Tuplas (posición, mensaje)
+        """
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, data FROM messages WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (after, self.batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for after, data in rows:
+                yield after, Message.model_validate_json(data)
+
+    def search(
+        self,
+        text: str,
+        session_id: Optional[str] = None,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        mode: SearchMode = "words",
+        order: Literal["rank", "recent"] = "rank",
+        limit: Optional[int] = 50,
+        offset: int = 0,
+    ) -> List[Message]:
+        """
+        Busca mensajes archivados por su texto.
+
+        La búsqueda no distingue mayúsculas ni acentos ("cancion" encuentra
+        "Canción"). El costo crece con la cantidad de coincidencias, así que
+        los términos muy frecuentes conviene combinarlos con otros o con un
+        chat.
+
+        Args:
+            text: Texto de búsqueda (ver fts_query() para los modos)
+            session_id: ID de la sesión (opcional)
+            chat_id: ID del chat (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            mode: ``words``, ``prefix``, ``phrase`` o ``raw``
+            order: ``rank`` (relevancia BM25) o ``recent`` (más recientes primero)
+            limit: Cantidad máxima de resultados (None para todos)
+            offset: Resultados a saltear
+
+        Returns:
+            Los mensajes que coinciden
+
+        Raises:
+            RuntimeError: Si el archivo se abrió sin full_text
+            ValueError: Si el texto o el modo no son válidos
+        """
+        if not self.full_text:
+            raise RuntimeError("Full-text search is disabled for this archive")
+        if chat_id is not None:
+            # Un chat tiene pocos mensajes: recorrerlos y comprobar cada uno en el
+            # índice es más barato que leer todas las coincidencias del término
+            sql = ["SELECT m.data FROM messages AS m CROSS JOIN messages_fts AS f"]
+        else:
+            sql = ["SELECT m.data FROM messages_fts AS f JOIN messages AS m"]
+        sql.append("ON m.rowid = f.rowid WHERE messages_fts MATCH ?")
+        args: List[Any] = [fts_query(text, mode)]
+        if session_id is not None:
+            sql.append("AND m.session_id = ?")
+            args.append(session_id)
+        if chat_id is not None:
+            sql.append("AND m.chat_id = ?")
+            args.append(chat_id)
+        if from_me is not None:
+            sql.append("AND m.from_me = ?")
+            args.append(int(from_me))
+        if order == "rank":
+            sql.append("ORDER BY f.rank")
+        elif order == "recent":
+            sql.append("ORDER BY m.timestamp DESC, m.id DESC")
+        else:
+            raise ValueError(f"Invalid search order: {order!r}")
+        sql.append("LIMIT ? OFFSET ?")
+        args.extend((-1 if limit is None else limit, offset))
+        try:
+            with self._lock:
+                rows = self._conn.execute(" ".join(sql), args).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {args[0]!r}: {e}") from e
+        return [Message.model_validate_json(row[0]) for row in rows]
+
+    @staticmethod
+    def _page_key(params: Dict[str, Any]) -> str:
+        """Clave de una página de list() a partir de sus parámetros."""
+        return json.dumps(params, sort_keys=True, default=str)
+
+    def get_page(self, params: Dict[str, Any]) -> Optional[MessageList]:
+        """
+        Devuelve una página de list() archivada hace menos de ``page_ttl`` segundos.
+
+        Args:
+            params: Parámetros de la petición de la página
+
+        Returns:
+            La página, o None si no está archivada o expiró
+        """
+        if self.page_ttl is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, ids, pagination FROM pages WHERE key = ?",
+                (self._page_key(params),),
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.page_ttl:
+                return None
+            ids = json.loads(row[1])
+            placeholders = ", ".join("?" * len(ids))
+            found = dict(
+                self._conn.execute(
+                    f"SELECT id, data FROM messages WHERE id IN ({placeholders})", ids
+                ).fetchall()
+            )
+        if len(found) != len(ids):
+            return None
+        data = [Message.model_validate_json(found[message_id]) for message_id in ids]
+        return MessageList(data=data, pagination=json.loads(row[2]))
+
+    def add_page(self, params: Dict[str, Any], page: MessageList) -> None:
+        """
+        Archiva los mensajes de una página de list() y, con ``page_ttl``, la página.
+
+        Args:
+            params: Parámetros de la petición de la página
+            page: Página recibida de la API
+        """
+        with self._lock:
+            self.add(page.data)
+            if self.page_ttl is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                    (
+                        self._page_key(params),
+                        time.time(),
+                        json.dumps([message.id for message in page.data]),
+                        json.dumps(page.pagination, default=str),
+                    ),
+                )
@@ -0,0 +1,316 @@
+"""Envíos masivos con cuerpos pre-serializados."""
+
+import itertools
+import json
+import re
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from wasapaso._utils import dump_json
+from wasapaso.exceptions import (
+    DuplicateMessageError,
+    FrequencyCapExceededError,
+    SuppressedRecipientError,
+    TemplateError,
+)
+from wasapaso.models.message import TextMessage
+from wasapaso.templates import MessageTemplate
+
+ColumnBatch = Mapping[str, Sequence[Any]]
+
+# Destinatarios que pueden escribirse en JSON sin escapar
+_PLAIN_RECIPIENT = re.compile(r"[0-9A-Za-z@.+_-]*\Z")
+
+
+def encode_json_string(value: str) -> bytes:
+    """
+    Serializa un string como literal JSON en UTF-8.
+
+    Args:
+        value: String a serializar
+
+    Returns:
+        El literal JSON, con comillas
+    """
+    if _PLAIN_RECIPIENT.match(value):
+        return b'"' + value.encode("ascii") + b'"'
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+class PreparedTextMessage:
+    """
+    Mensaje de texto validado y serializado una única vez para un envío masivo.
+
+    El cuerpo se valida con :class:`TextMessage` y se serializa con un
+    destinatario de marcador; luego cada envío sólo concatena el prefijo,
+    el destinatario codificado y el sufijo, sin trabajo de pydantic por
+    mensaje. Con :meth:`for_template` el texto también queda como hueco y
+    se inserta por destinatario.
+
+    Example:
+        >>> prepared = PreparedTextMessage("64abc123...", "Hola a todos!")
+        >>> prepared.render("1234567890")
+        b'{"sessionId":"64abc123...","to":"1234567890","message":"Hola a todos!","type":"text"}'
+    """
+
+    path = "messages/text"
+
+    def __init__(
+        self, session_id: str, message: Optional[str], reply_to: Optional[str] = None
+    ) -> None:
+        """
+        Valida y serializa el cuerpo del mensaje.
+
+        Args:
+            session_id: ID de la sesión
+            message: Texto del mensaje, o None para insertarlo en cada render()
+            reply_to: ID del mensaje al que se responde (opcional)
+        """
+        token = uuid.uuid4().hex
+        markers = {"to": f"wasapaso-to-{token}"}
+        if message is None:
+            message = markers["message"] = f"wasapaso-message-{token}"
+
+        msg = TextMessage(sessionId=session_id, to=markers["to"], message=message, replyTo=reply_to)
+        body = dump_json(msg.model_dump(by_alias=True, exclude_none=True))
+
+        # Divide el cuerpo en segmentos fijos y huecos, en orden de aparición
+        positions = sorted(
+            (body.index(encode_json_string(marker)), slot) for slot, marker in markers.items()
+        )
+        segments: List[bytes] = []
+        slots: List[str] = []
+        cursor = 0
+        for position, slot in positions:
+            segments.append(body[cursor:position])
+            slots.append(slot)
+            cursor = position + len(encode_json_string(markers[slot]))
+        segments.append(body[cursor:])
+
+        self.session_id = session_id
+        self.message = None if "message" in markers else message
+        self._segments = segments
+        self._slots = slots
+
+    @classmethod
+    def for_template(cls, session_id: str, reply_to: Optional[str] = None) -> "PreparedTextMessage":
+        """
+        Prepara un cuerpo cuyo texto cambia por destinatario.
+
+        Args:
+            session_id: ID de la sesión
+            reply_to: ID del mensaje al que se responde (opcional)
+
+        Returns:
+            Cuerpo preparado con huecos para el destinatario y el texto
+        """
+        return cls(session_id, None, reply_to)
+
+    def render(self, to: str, message: Optional[str] = None) -> bytes:
+        """
+        Construye el cuerpo JSON para un destinatario.
+
+        Args:
+            to: Número de teléfono del destinatario
+            message: Texto del mensaje (sólo para cuerpos creados con for_template())
+
+        Returns:
+            Cuerpo JSON listo para enviar
+        """
+        segments = self._segments
+        if len(segments) == 2:
+            return segments[0] + encode_json_string(to) + segments[1]
+
+        if message is None:
+            raise ValueError("message is required for template bodies")
+        values = {"to": to, "message": message}
+        parts = [segments[0]]
+        for slot, segment in zip(self._slots, segments[1:]):
+            parts.append(encode_json_string(values[slot]))
+            parts.append(segment)
+        return b"".join(parts)
+
+
+class BroadcastResult(BaseModel):
+    """
+    Resultado de un envío masivo.
+
+    Guarda contadores y, como muestra, los primeros ``max_samples`` pares
+    (destinatario, valor) de cada tipo, así que la memoria no crece con la
+    cantidad de destinatarios. Un destinatario repetido aparece en la
+    muestra tantas veces como se registró.
+    """
+
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    skipped_reasons: Dict[str, int] = Field(default_factory=dict)
+    max_samples: int = 100
+    message_ids: List[Tuple[str, str]] = Field(default_factory=list)
+    errors: List[Tuple[str, str]] = Field(default_factory=list)
+    skipped_recipients: List[Tuple[str, str]] = Field(default_factory=list)
+
+    def _sample(self, samples: List[Tuple[str, str]], to: str, value: str) -> None:
+        """Agrega un par a una muestra si todavía tiene lugar."""
+        if len(samples) < self.max_samples:
+            samples.append((to, value))
+
+    def add_response(self, to: str, response: Dict[str, Any]) -> None:
+        """
+        Registra la respuesta del envío a un destinatario.
+
+        Args:
+            to: Destinatario
+            response: Respuesta de la API (o local, si el envío se suprimió)
+        """
+        if response.get("suppressed"):
+            self.add_skipped(to, "duplicate")
+            return
+        self.sent += 1
+        data = response.get("data")
+        if isinstance(data, dict) and data.get("messageId"):
+            self._sample(self.message_ids, to, data["messageId"])
+
+    def add_error(self, to: str, error: Exception) -> None:
+        """
+        Registra un envío que no se realizó.
+
+        Los bloqueos locales (lista de supresión, duplicados, límite de
+        frecuencia) se cuentan como omitidos; el resto como fallidos.
+
+        Args:
+            to: Destinatario
+            error: Excepción producida por el envío
+        """
+        if isinstance(error, SuppressedRecipientError):
+            self.add_skipped(to, "suppressed")
+        elif isinstance(error, DuplicateMessageError):
+            self.add_skipped(to, "duplicate")
+        elif isinstance(error, FrequencyCapExceededError):
+            self.add_skipped(to, "frequency_cap")
+        else:
+            self.failed += 1
+            self._sample(self.errors, to, str(error))
+
+    def add_batch_error(self, batch: str, error: Exception, rows: int) -> None:
+        """
+        Registra un lote que no se envió.
+
+        Args:
+            batch: Identificador del lote
+            error: Excepción que impidió enviarlo
+            rows: Cantidad de filas del lote, que se cuentan como fallidas
+        """
+        self.failed += rows
+        self._sample(self.errors, batch, str(error))
+
+    def add_skipped(self, to: str, reason: str) -> None:
+        """
+        Registra un destinatario omitido.
+
+        Args:
+            to: Destinatario
+            reason: Motivo de la omisión (duplicate, suppressed, frequency_cap)
+        """
+        self.skipped += 1
+        self.skipped_reasons[reason] = self.skipped_reasons.get(reason, 0) + 1
+        self._sample(self.skipped_recipients, to, reason)
+
+
+def _check_schema(template: MessageTemplate, columns: Iterable[str], recipient_field: str) -> None:
+    """Comprueba que las columnas tengan los destinatarios y los placeholders."""
+    columns = list(columns)
+    if recipient_field not in columns:
+        raise TemplateError(f"Recipient column '{recipient_field}' missing from records")
+    template.validate(columns)
+
+
+def _batch_size(batch: ColumnBatch, recipient_field: str) -> int:
+    """Cantidad de filas de un lote, aunque no tenga la columna de destinatarios."""
+    if recipient_field in batch:
+        return len(batch[recipient_field])
+    return max((len(column) for column in batch.values()), default=0)
+
+
+def iter_template_bodies(
+    prepared: PreparedTextMessage,
+    template: MessageTemplate,
+    batches: Union[ColumnBatch, Iterable[ColumnBatch]],
+    recipient_field: str,
+    result: BroadcastResult,
+    columns: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Renderiza lotes columnares y genera los cuerpos por destinatario.
+
+    La plantilla se valida contra el esquema de los registros al llamar a
+    esta función, antes del primer envío: contra ``columns`` si se indica,
+    o contra las columnas del primer lote. Un lote posterior que no cumple
+    el esquema no corta el envío: sus filas se registran en ``result`` como
+    fallidas, con el identificador ``lote <n>`` (igual si sus columnas tienen
+    largos distintos). Los destinatarios se convierten a
+    texto (p. ej. números enteros de una columna NumPy). Los errores de
+    renderizado y los destinatarios vacíos se registran en ``result`` por
+    destinatario; los vacíos, con el identificador ``#<fila>`` (posición
+    en el total de lotes).
+
+    Args:
+        prepared: Cuerpo preparado con for_template()
+        template: Plantilla compilada
+        batches: Un lote columnar o un iterable de lotes
+        recipient_field: Columna con los números de los destinatarios
+        result: Resultado donde registrar los errores de renderizado
+        columns: Esquema de los registros (opcional; por defecto, el del primer lote)
+
+    Returns:
+        Iterador de pares (destinatario, cuerpo JSON)
+
+    Raises:
+        TemplateError: Si el esquema no tiene las columnas requeridas
+    """
+    pending = iter([batches] if isinstance(batches, Mapping) else batches)
+    first: Optional[ColumnBatch] = None
+    if columns is None:
+        first = next(pending, None)
+        if first is None:
+            return iter(())
+        columns = first.keys()
+    _check_schema(template, columns, recipient_field)
+    if first is not None:
+        pending = itertools.chain([first], pending)
+    return _render_batches(prepared, template, pending, recipient_field, result)
+
+
+def _render_batches(
+    prepared: PreparedTextMessage,
+    template: MessageTemplate,
+    batches: Iterator[ColumnBatch],
+    recipient_field: str,
+    result: BroadcastResult,
+) -> Iterator[Tuple[str, bytes]]:
+    """Genera los cuerpos de lotes cuyo esquema ya se validó (ver iter_template_bodies())."""
+    row = 0
+    for number, batch in enumerate(batches):
+        try:
+            _check_schema(template, batch.keys(), recipient_field)
+            recipients = batch[recipient_field]
+            rendered = template.render_columns(batch, size=len(recipients))
+        except TemplateError as e:
+            size = _batch_size(batch, recipient_field)
+            result.add_batch_error(f"lote {number}", e, size)
+            row += size
+            continue
+        for index, (value, text) in enumerate(zip(recipients, rendered.texts)):
+            to = "" if value is None else str(value)
+            if not to.strip():
+                result.add_error(
+                    f"#{row + index}",
+                    TemplateError(f"{recipient_field}: missing recipient"),
+                )
+            elif text is None:
+                result.add_error(to, TemplateError(rendered.errors[index]))
+            else:
+                yield to, prepared.render(to, text)
+        row += len(recipients)
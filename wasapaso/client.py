@@ -1,10 +1,16 @@
 """Cliente principal del SDK de Wasapaso."""
 
-from typing import Optional
+import copy
+import os
+from typing import Optional, Union
 
 from wasapaso._http_client import HTTPClient
+from wasapaso.archive import MessageArchive
+from wasapaso.guards import DuplicateGuard, FrequencyCap
+from wasapaso.inbox import Inbox
 from wasapaso.resources.messages import MessagesResource
 from wasapaso.resources.sessions import SessionsResource
+from wasapaso.suppression import SuppressionList
 
 
 class WasapasoClient:
@@ -47,6 +53,11 @@ class WasapasoClient:
         api_key: str,
         base_url: str = "https://api.wasapaso.com",
         timeout: float = 30.0,
+        suppression_list: Optional[Union[str, "os.PathLike[str]", SuppressionList]] = None,
+        duplicate_guard: Optional[DuplicateGuard] = None,
+        frequency_cap: Optional[FrequencyCap] = None,
+        archive: Optional[Union[str, "os.PathLike[str]", MessageArchive]] = None,
+        inbox: Optional[Inbox] = None,
     ) -> None:
         """
         Inicializa el cliente de Wasapaso.
@@ -55,6 +66,17 @@ class WasapasoClient:
             api_key: Tu API key de Wasapaso (comienza con 'wsk_')
             base_url: URL base de la API (opcional, usa el default en producción)
             timeout: Timeout por defecto para las peticiones en segundos
+            suppression_list: Lista de supresión (o ruta a su archivo). Los envíos
+                a números suprimidos se bloquean localmente con SuppressedRecipientError
+            duplicate_guard: Protección que suprime envíos idénticos repetidos dentro
+                de una ventana de tiempo con DuplicateMessageError (opcional)
+            frequency_cap: Límite de mensajes por destinatario en una ventana
+                deslizante, compartido por todas las sesiones (opcional)
+            archive: Archivo local de mensajes (o ruta a su base SQLite) del que
+                messages.get() sirve las lecturas repetidas, y también
+                messages.list() si el archivo tiene page_ttl (opcional)
+            inbox: Bandeja de entrada cuyos contadores de no leídos actualiza
+                messages.mark_as_read() (opcional)
 
         Raises:
             ValueError: Si la API key está vacía o es inválida
@@ -71,9 +93,57 @@ class WasapasoClient:
         # Cliente HTTP
         self._http_client = HTTPClient(api_key=api_key, base_url=base_url, timeout=timeout)
 
+        # Lista de supresión (opt-out)
+        if suppression_list is not None and not isinstance(suppression_list, SuppressionList):
+            suppression_list = SuppressionList(suppression_list)
+        self.suppression_list = suppression_list
+
+        # Archivo local de mensajes
+        if archive is not None and not isinstance(archive, MessageArchive):
+            archive = MessageArchive(archive)
+        self.archive = archive
+
+        # Bandeja de entrada materializada
+        self.inbox = inbox
+
+        # Vista raw (ver with_raw_response), creada bajo demanda
+        self._raw = False
+        self._raw_view: Optional[WasapasoClient] = None
+
         # Recursos de la API
         self.sessions = SessionsResource(self._http_client)
-        self.messages = MessagesResource(self._http_client)
+        self.messages = MessagesResource(
+            self._http_client,
+            suppression_list=suppression_list,
+            duplicate_guard=duplicate_guard,
+            frequency_cap=frequency_cap,
+            archive=archive,
+            inbox=inbox,
+        )
+
+    @property
+    def with_raw_response(self) -> "WasapasoClient":
+        """
+        Vista del cliente que devuelve las respuestas sin decodificar.
+
+        Los métodos de sus recursos (y health_check()/get_status()) devuelven
+        una :class:`~wasapaso.raw.RawResponse` con el status, los headers y el
+        body tal como llegaron, en lugar de diccionarios o modelos. Los errores
+        se siguen lanzando como excepciones. ``messages.send()`` acepta además
+        el cuerpo ya serializado como bytes.
+
+        Example:
+            >>> raw = client.with_raw_response.messages.get("msg_xyz789")
+            >>> raw.status_code, raw.headers["content-type"], raw.content
+        """
+        if self._raw_view is None:
+            view = copy.copy(self)
+            view._raw = True
+            view._raw_view = view
+            view.sessions = self.sessions._as_raw()
+            view.messages = self.messages._as_raw()
+            self._raw_view = view
+        return self._raw_view
 
     @property
     def api_key(self) -> str:
@@ -94,10 +164,16 @@ class WasapasoClient:
             >>> status = client.health_check()
             >>> print(status["message"])
         """
+        if self._raw:
+            return self._http_client.request_raw("GET", "health")  # type: ignore[return-value]
         return self._http_client.get("health")
 
     async def health_check_async(self) -> dict:
         """Versión asíncrona de health_check()."""
+        if self._raw:
+            return await self._http_client.request_raw_async(  # type: ignore[return-value]
+                "GET", "health"
+            )
         return await self._http_client.get_async("health")
 
     def get_status(self) -> dict:
@@ -112,10 +188,16 @@ class WasapasoClient:
             >>> print(info["apiKey"]["name"])
             >>> print(info["apiKey"]["permissions"])
         """
+        if self._raw:
+            return self._http_client.request_raw("GET", "status")  # type: ignore[return-value]
         return self._http_client.get("status")
 
     async def get_status_async(self) -> dict:
         """Versión asíncrona de get_status()."""
+        if self._raw:
+            return await self._http_client.request_raw_async(  # type: ignore[return-value]
+                "GET", "status"
+            )
         return await self._http_client.get_async("status")
 
     def __repr__(self) -> str:
@@ -0,0 +1,227 @@
+"""De-duplicación en streaming de destinatarios para envíos masivos."""
+
+import hashlib
+import math
+import sys
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, TypeVar
+
+from pydantic import BaseModel
+
+from wasapaso._utils import normalize_number
+
+T = TypeVar("T")
+
+_LN2 = math.log(2)
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom dimensionado a partir de la cardinalidad esperada.
+
+    Usa un único digest BLAKE2b de 128 bits por clave y deriva las
+    posiciones con doble hashing, por lo que el coste por inserción es
+    un hash más ``num_hashes`` operaciones sobre el arreglo de bits.
+
+    Example:
+        >>> bloom = BloomFilter(capacity=10_000_000, error_rate=0.001)
+        >>> bloom.add("1234567890")
+        False
+        >>> "1234567890" in bloom
+        True
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Inicializa el filtro.
+
+        Args:
+            capacity: Cantidad esperada de elementos distintos
+            error_rate: Probabilidad de falso positivo al alcanzar la capacidad
+
+        Raises:
+            ValueError: Si la capacidad o la tasa de error no son válidas
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (_LN2**2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * _LN2))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    @property
+    def size_in_bytes(self) -> int:
+        """Memoria ocupada por el arreglo de bits."""
+        return len(self._bits)
+
+    def _positions(self, key: str) -> List[int]:
+        """Calcula las posiciones de bits de una clave."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> bool:
+        """
+        Añade una clave al filtro.
+
+        Args:
+            key: Clave a insertar
+
+        Returns:
+            True si la clave (probablemente) ya estaba en el filtro
+        """
+        bits = self._bits
+        present = True
+        for pos in self._positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self._count += 1
+        return present
+
+    def __contains__(self, key: object) -> bool:
+        """Indica si la clave (probablemente) está en el filtro."""
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        """Cantidad aproximada de claves distintas insertadas."""
+        return self._count
+
+
+class DedupStats(BaseModel):
+    """Resumen de una pasada de de-duplicación."""
+
+    seen: int
+    unique: int
+    duplicates: int
+    exact: bool
+    memory_bytes: int
+    duplicate_samples: List[str]
+
+
+class RecipientDeduplicator:
+    """
+    Etapa de de-duplicación de destinatarios para envíos masivos y campañas.
+
+    Por defecto usa un :class:`BloomFilter` dimensionado para
+    ``expected_recipients`` (unos 18 MB para 10M destinatarios con una tasa
+    de falsos positivos de 0.1%). Un falso positivo descarta un destinatario
+    único, nunca envía un duplicado. Con ``exact=True`` se usa un ``set``
+    de números normalizados, sin falsos positivos pero con un consumo de
+    memoria proporcional a la cantidad de destinatarios.
+
+    Example:
+        >>> dedup = RecipientDeduplicator(expected_recipients=2_000_000)
+        >>> for number in dedup.filter(numbers_from_crm):
+        ...     client.messages.send_text(session_id, number, "Hola!")
+        >>> print(dedup.stats.duplicates)
+    """
+
+    def __init__(
+        self,
+        expected_recipients: int = 1_000_000,
+        error_rate: float = 0.001,
+        exact: bool = False,
+        normalize: bool = True,
+        on_duplicate: Optional[Callable[[str], Any]] = None,
+        max_samples: int = 100,
+    ) -> None:
+        """
+        Inicializa la etapa de de-duplicación.
+
+        Args:
+            expected_recipients: Cardinalidad esperada, usada para dimensionar el filtro
+            error_rate: Tasa de falsos positivos del filtro de Bloom
+            exact: Si es True, usa un conjunto exacto en lugar del filtro de Bloom
+            normalize: Si es True, normaliza los números antes de compararlos
+            on_duplicate: Callback invocado con cada número duplicado
+            max_samples: Cantidad máxima de duplicados conservados como muestra
+        """
+        self.exact = exact
+        self.normalize = normalize
+        self.on_duplicate = on_duplicate
+        self.max_samples = max_samples
+
+        self._bloom: Optional[BloomFilter] = None
+        self._exact: Optional[Set[str]] = None
+        if exact:
+            self._exact = set()
+        else:
+            self._bloom = BloomFilter(expected_recipients, error_rate)
+
+        self._seen = 0
+        self._duplicates = 0
+        self._samples: List[str] = []
+
+    def is_duplicate(self, number: str) -> bool:
+        """
+        Registra un número e indica si ya había sido visto.
+
+        Args:
+            number: Número de teléfono o ID de WhatsApp
+
+        Returns:
+            True si el número es un duplicado
+        """
+        key = normalize_number(number) if self.normalize else number
+        self._seen += 1
+
+        if self._exact is not None:
+            duplicate = key in self._exact
+            if not duplicate:
+                self._exact.add(key)
+        else:
+            assert self._bloom is not None
+            duplicate = self._bloom.add(key)
+
+        if duplicate:
+            self._duplicates += 1
+            if len(self._samples) < self.max_samples:
+                self._samples.append(number)
+            if self.on_duplicate is not None:
+                self.on_duplicate(number)
+        return duplicate
+
+    def filter(self, items: Iterable[T], key: Optional[Callable[[T], str]] = None) -> Iterator[T]:
+        """
+        Filtra en streaming los elementos con destinatario repetido.
+
+        Args:
+            items: Números o registros de campaña
+            key: Función que extrae el número de cada registro (opcional)
+
+        Yields:
+            Los elementos cuyo destinatario aparece por primera vez
+        """
+        for item in items:
+            number = key(item) if key is not None else item
+            if not self.is_duplicate(number):  # type: ignore[arg-type]
+                yield item
+
+    @property
+    def stats(self) -> DedupStats:
+        """Estadísticas acumuladas de la de-duplicación."""
+        if self._bloom is not None:
+            memory = self._bloom.size_in_bytes
+        else:
+            assert self._exact is not None
+            memory = sys.getsizeof(self._exact) + sum(sys.getsizeof(k) for k in self._exact)
+        return DedupStats(
+            seen=self._seen,
+            unique=self._seen - self._duplicates,
+            duplicates=self._duplicates,
+            exact=self.exact,
+            memory_bytes=memory,
+            duplicate_samples=list(self._samples),
+        )
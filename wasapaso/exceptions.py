@@ -144,6 +144,76 @@ class TimeoutError(WasapasoError):
         super().__init__(message, status_code, response_data)
 
 
+class SuppressedRecipientError(WasapasoError):
+    """El destinatario está en la lista de supresión y el envío se bloqueó localmente."""
+
+    def __init__(
+        self,
+        message: str = "Recipient is in the suppression list.",
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Inicializa un error de destinatario suprimido."""
+        super().__init__(message, status_code, response_data)
+
+
+class DuplicateMessageError(WasapasoError):
+    """El envío es idéntico a otro reciente y se suprimió localmente."""
+
+    def __init__(
+        self,
+        message: str = "Duplicate message suppressed.",
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Inicializa un error de mensaje duplicado."""
+        super().__init__(message, status_code, response_data)
+
+
+class FrequencyCapExceededError(RateLimitError):
+    """El destinatario alcanzó el límite local de mensajes por ventana de tiempo."""
+
+    def __init__(
+        self,
+        message: str = "Per-recipient frequency cap exceeded.",
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Inicializa un error de límite de frecuencia por destinatario."""
+        super().__init__(message, status_code, response_data)  # type: ignore[arg-type]
+
+    @property
+    def retry_after(self) -> float:
+        """Segundos que faltan para que el destinatario vuelva a estar por debajo del límite."""
+        return float(self.response_data.get("retryAfter", 0.0))
+
+
+class TemplateError(WasapasoError):
+    """Error al compilar o renderizar una plantilla de mensaje."""
+
+    def __init__(
+        self,
+        message: str = "Invalid message template.",
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Inicializa un error de plantilla."""
+        super().__init__(message, status_code, response_data)
+
+
+class ResponseTooLargeError(WasapasoError):
+    """La respuesta superó el tamaño máximo permitido y se abortó su lectura."""
+
+    def __init__(
+        self,
+        message: str = "Response exceeded the maximum allowed size.",
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Inicializa un error de respuesta demasiado grande."""
+        super().__init__(message, status_code, response_data)
+
+
 def handle_error_response(status_code: int, response_data: Dict[str, Any]) -> WasapasoError:
     """
     Convierte una respuesta de error HTTP en la excepción apropiada.
@@ -0,0 +1,255 @@
+"""
+Exportación de mensajes en streaming a Parquet o NDJSON comprimido.
+
+Los mensajes se consumen de un iterador (por ejemplo
+``messages.iter_all()``) y se escriben en lotes de ``batch_size``, así
+que la memoria usada no depende del tamaño del historial. Las columnas
+se derivan de los campos del modelo :class:`~wasapaso.models.Message`
+(con sus alias de la API como nombres). Parquet requiere ``pyarrow``
+(``pip install "wasapaso[arrow]"``); NDJSON sólo usa la biblioteca estándar.
+"""
+
+import gzip
+import os
+from datetime import datetime
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from wasapaso.models.message import Message
+
+if TYPE_CHECKING:
+    import pyarrow
+
+ExportFormat = Literal["parquet", "ndjson"]
+
+_PathLike = Union[str, "os.PathLike[str]"]
+
+
+class Column(NamedTuple):
+    """Columna de la exportación derivada de un campo del modelo."""
+
+    name: str  # Nombre en la API (alias del campo)
+    attribute: str  # Atributo del modelo
+    type: type
+    nullable: bool
+
+
+def message_columns() -> List[Column]:
+    """
+    Devuelve las columnas de un mensaje, en el orden de los campos del modelo.
+
+    Los campos ``Optional[X]`` (o con valor por defecto ``None``) son
+    columnas nulables de tipo ``X``.
+
+    Returns:
+        Las columnas de :class:`~wasapaso.models.Message`
+    """
+    columns = []
+    for attribute, field in Message.model_fields.items():
+        annotation: Any = field.annotation
+        nullable = not field.is_required()
+        if get_origin(annotation) is Union:
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            nullable = nullable or len(args) < len(get_args(annotation))
+            annotation = args[0] if len(args) == 1 else str
+        if not isinstance(annotation, type):
+            annotation = str
+        columns.append(Column(field.alias or attribute, attribute, annotation, nullable))
+    return columns
+
+
+def _require_pyarrow() -> Any:
+    """Importa pyarrow o explica cómo instalarlo."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow. Install it with: pip install 'wasapaso[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(pa: Any, column: Column) -> Any:
+    """Tipo de Arrow de una columna."""
+    if issubclass(column.type, bool):
+        return pa.bool_()
+    if issubclass(column.type, int):
+        return pa.int64()
+    if issubclass(column.type, float):
+        return pa.float64()
+    if issubclass(column.type, datetime):
+        return pa.timestamp("ms", tz="UTC")
+    return pa.string()
+
+
+def message_schema() -> "pyarrow.Schema":
+    """
+    Devuelve el esquema de Arrow de un mensaje.
+
+    Returns:
+        Esquema con una columna por campo de :class:`~wasapaso.models.Message`
+
+    Raises:
+        ImportError: Si pyarrow no está instalado
+    """
+    pa = _require_pyarrow()
+    return pa.schema(
+        [pa.field(c.name, _arrow_type(pa, c), nullable=c.nullable) for c in message_columns()]
+    )
+
+
+def iter_batches(messages: Iterable[Message], batch_size: int) -> Iterator[List[Message]]:
+    """
+    Agrupa un iterador de mensajes en lotes.
+
+    Args:
+        messages: Mensajes
+        batch_size: Tamaño máximo de cada lote
+
+    Yields:
+        Listas de hasta batch_size mensajes
+    """
+    iterator = iter(messages)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def record_batch(messages: List[Message], schema: Optional["pyarrow.Schema"] = None) -> Any:
+    """
+    Convierte un lote de mensajes en un ``pyarrow.RecordBatch``.
+
+    Args:
+        messages: Lote de mensajes
+        schema: Esquema (por defecto, message_schema())
+
+    Returns:
+        El lote en formato columnar
+
+    Raises:
+        ImportError: Si pyarrow no está instalado
+    """
+    pa = _require_pyarrow()
+    schema = schema if schema is not None else message_schema()
+    arrays = [
+        pa.array([getattr(message, column.attribute) for message in messages], type=field.type)
+        for column, field in zip(message_columns(), schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_parquet(
+    messages: Iterable[Message],
+    path: _PathLike,
+    batch_size: int = 10_000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Escribe mensajes en un archivo Parquet, un row group por lote.
+
+    Args:
+        messages: Mensajes a exportar (se consumen de a batch_size)
+        path: Ruta del archivo
+        batch_size: Filas por lote
+        compression: Compresión de Parquet (zstd, snappy, gzip, none)
+
+    Returns:
+        Cantidad de filas escritas
+
+    Raises:
+        ImportError: Si pyarrow no está instalado
+    """
+    pa = _require_pyarrow()
+    schema = message_schema()
+    rows = 0
+    with pa.parquet.ParquetWriter(os.fspath(path), schema, compression=compression) as writer:
+        for batch in iter_batches(messages, batch_size):
+            writer.write_batch(record_batch(batch, schema))
+            rows += len(batch)
+    return rows
+
+
+def export_ndjson(
+    messages: Iterable[Message],
+    path: _PathLike,
+    compress: Optional[bool] = None,
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Escribe mensajes como JSON delimitado por líneas, opcionalmente con gzip.
+
+    Cada línea es el mensaje con los nombres de campo de la API
+    (``model_dump_json(by_alias=True)``).
+
+    Args:
+        messages: Mensajes a exportar (se consumen de a batch_size)
+        path: Ruta del archivo
+        compress: Comprimir con gzip (por defecto, si la ruta termina en .gz)
+        batch_size: Filas por escritura
+
+    Returns:
+        Cantidad de filas escritas
+    """
+    path = os.fspath(path)
+    if compress is None:
+        compress = path.endswith(".gz")
+    f = gzip.open(path, "wb", compresslevel=6) if compress else open(path, "wb")
+    rows = 0
+    with f:
+        for batch in iter_batches(messages, batch_size):
+            f.write(b"".join(m.model_dump_json(by_alias=True).encode() + b"\n" for m in batch))
+            rows += len(batch)
+    return rows
+
+
+def export_messages(
+    messages: Iterable[Message],
+    path: _PathLike,
+    format: Optional[ExportFormat] = None,
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Exporta mensajes en el formato indicado o deducido de la extensión.
+
+    Args:
+        messages: Mensajes a exportar
+        path: Ruta del archivo (``.parquet``, ``.ndjson``, ``.jsonl``,
+            con ``.gz`` para comprimir el NDJSON)
+        format: ``parquet`` o ``ndjson`` (opcional si la extensión lo indica)
+        batch_size: Filas por lote
+
+    Returns:
+        Cantidad de filas escritas
+
+    Raises:
+        ValueError: Si no se puede deducir el formato
+        ImportError: Si se pide Parquet y pyarrow no está instalado
+    """
+    if format is None:
+        name = os.fspath(path).lower()
+        if name.endswith(".parquet"):
+            format = "parquet"
+        elif name.endswith((".ndjson", ".jsonl", ".ndjson.gz", ".jsonl.gz")):
+            format = "ndjson"
+        else:
+            raise ValueError(f"Cannot infer export format from {os.fspath(path)!r}")
+    if format == "parquet":
+        return export_parquet(messages, path, batch_size)
+    if format == "ndjson":
+        return export_ndjson(messages, path, batch_size=batch_size)
+    raise ValueError(f"Invalid export format: {format!r}")
@@ -0,0 +1,449 @@
+"""
+Mensajes en columnas de NumPy para análisis.
+
+:class:`MessageFrame` guarda cada campo de los mensajes en un array:
+``timestamp`` como ``int64`` (milisegundos desde epoch, UTC), ``from_me``
+como ``bool`` y los strings muy repetidos (``session_id``, ``from_``,
+``to``, ``type``) codificados como diccionario: un array ``int32`` de
+códigos más la lista de valores distintos. Las columnas se construyen
+directamente desde las páginas decodificadas de la API, sin crear un
+modelo por mensaje, y los filtros por chat, tipo y rango de fechas son
+operaciones vectorizadas.
+
+Requiere ``numpy`` (``pip install "wasapaso[analytics]"``); la conversión
+a pandas requiere además ``pandas`` y a Arrow, ``pyarrow``.
+"""
+
+from array import array
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "MessageFrame requires numpy. Install it with: pip install 'wasapaso[analytics]'"
+    ) from e
+
+from wasapaso.models.message import Message
+from wasapaso.models.records import MessageRecord, timestamp_to_ms
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+    from numpy.typing import NDArray
+
+# Columnas codificadas como diccionario (códigos int32 + valores distintos)
+DICTIONARY_COLUMNS = ("session_id", "from_", "to", "type")
+
+# Columnas de strings sin codificar
+_OBJECT_COLUMNS = ("id", "message_id", "body", "reply_to")
+
+COLUMNS = (
+    "id",
+    "session_id",
+    "message_id",
+    "from_",
+    "to",
+    "body",
+    "type",
+    "timestamp",
+    "from_me",
+    "reply_to",
+)
+
+_Moment = Union[int, datetime]
+
+
+class _Dictionary:
+    """Codificación incremental de una columna de strings repetidos."""
+
+    __slots__ = ("index", "values", "codes")
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+        self.codes = array("i")
+
+    def append(self, value: str) -> None:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class FrameBuilder:
+    """
+    Acumula mensajes en columnas a medida que llegan las páginas.
+
+    Las columnas numéricas se guardan en arrays compactos de la biblioteca
+    estándar, que :meth:`build` expone a NumPy sin copiarlos.
+
+    Example:
+        >>> builder = FrameBuilder()
+        >>> for page in pages:
+        ...     builder.extend(page["data"])
+        >>> frame = builder.build()
+    """
+
+    def __init__(self) -> None:
+        """Crea un constructor vacío."""
+        self._objects: Dict[str, List[Optional[str]]] = {name: [] for name in _OBJECT_COLUMNS}
+        self._dictionaries = {name: _Dictionary() for name in DICTIONARY_COLUMNS}
+        self._timestamp = array("q")
+        self._from_me = bytearray()
+
+    def __len__(self) -> int:
+        """Cantidad de mensajes acumulados."""
+        return len(self._timestamp)
+
+    def extend(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Agrega mensajes decodificados de la API (campo ``data`` de una página).
+
+        Args:
+            items: Mensajes con los nombres de campo de la API
+        """
+        ids, message_ids, bodies, replies = (self._objects[name] for name in _OBJECT_COLUMNS)
+        session, sender, recipient, kind = (self._dictionaries[name] for name in DICTIONARY_COLUMNS)
+        timestamps = self._timestamp
+        from_me = self._from_me
+        for item in items:
+            ids.append(item["id"])
+            session.append(item["sessionId"])
+            message_ids.append(item["messageId"])
+            sender.append(item["from"])
+            recipient.append(item["to"])
+            bodies.append(item.get("body"))
+            kind.append(item["type"])
+            timestamps.append(timestamp_to_ms(item["timestamp"]))
+            from_me.append(bool(item["fromMe"]))
+            replies.append(item.get("replyTo"))
+
+    def extend_records(self, records: Iterable[Union[MessageRecord, Message]]) -> None:
+        """
+        Agrega registros livianos o modelos de mensajes.
+
+        Args:
+            records: MessageRecord (de ``list(lite=True)``) o Message
+        """
+        ids, message_ids, bodies, replies = (self._objects[name] for name in _OBJECT_COLUMNS)
+        session, sender, recipient, kind = (self._dictionaries[name] for name in DICTIONARY_COLUMNS)
+        for record in records:
+            ids.append(record.id)
+            session.append(record.session_id)
+            message_ids.append(record.message_id)
+            sender.append(record.from_)
+            recipient.append(record.to)
+            bodies.append(record.body)
+            kind.append(record.type)
+            self._timestamp.append(timestamp_to_ms(record.timestamp))
+            self._from_me.append(bool(record.from_me))
+            replies.append(record.reply_to)
+
+    def build(self) -> "MessageFrame":
+        """
+        Devuelve el frame con los mensajes acumulados.
+
+        El constructor no debe seguir usándose después: el frame comparte
+        la memoria de sus columnas numéricas.
+        """
+        columns: Dict[str, NDArray[Any]] = {}
+        for name in _OBJECT_COLUMNS:
+            values = np.empty(len(self), dtype=object)
+            values[:] = self._objects[name]
+            columns[name] = values
+        categories: Dict[str, NDArray[Any]] = {}
+        for name in DICTIONARY_COLUMNS:
+            dictionary = self._dictionaries[name]
+            columns[name] = np.frombuffer(dictionary.codes, dtype=np.int32)
+            categories[name] = np.array(dictionary.values, dtype=object)
+        columns["timestamp"] = np.frombuffer(self._timestamp, dtype=np.int64)
+        columns["from_me"] = np.frombuffer(self._from_me, dtype=np.bool_)
+        return MessageFrame(columns, categories)
+
+
+class MessageFrame:
+    """
+    Mensajes en columnas de NumPy, con filtros vectorizados.
+
+    Las columnas ``session_id``, ``from_``, ``to`` y ``type`` guardan
+    códigos ``int32``; :meth:`column` las devuelve decodificadas y
+    :meth:`categories` devuelve los valores distintos. Filtrar devuelve un
+    frame nuevo que comparte los diccionarios del original.
+
+    Example:
+        >>> frame = client.messages.fetch_frame("64abc123...")
+        >>> recent = frame.filter(chat_id="5491100000000@c.us", since=datetime(2024, 1, 1))
+        >>> recent.value_counts("type")
+        {'text': 120, 'image': 8}
+        >>> df = frame.to_pandas()
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, "NDArray[Any]"],
+        categories: Mapping[str, "NDArray[Any]"],
+    ) -> None:
+        """
+        Crea el frame a partir de sus columnas (ver FrameBuilder).
+
+        Args:
+            columns: Un array por columna de COLUMNS, todos del mismo largo
+            categories: Valores distintos de cada columna de DICTIONARY_COLUMNS
+
+        Raises:
+            ValueError: Si faltan columnas o los largos no coinciden
+        """
+        missing = [name for name in COLUMNS if name not in columns]
+        if missing or any(name not in categories for name in DICTIONARY_COLUMNS):
+            raise ValueError(f"Missing frame columns: {missing or list(DICTIONARY_COLUMNS)}")
+        lengths = {len(columns[name]) for name in COLUMNS}
+        if len(lengths) > 1:
+            raise ValueError("Frame columns must have the same length")
+        self._columns = dict(columns)
+        self._categories = dict(categories)
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Iterable[Mapping[str, Any]]]) -> "MessageFrame":
+        """
+        Construye el frame desde páginas decodificadas de la API.
+
+        Args:
+            pages: Mensajes de cada página, tal como llegan en ``data``
+
+        Returns:
+            El frame con los mensajes de todas las páginas, en orden
+        """
+        builder = FrameBuilder()
+        for page in pages:
+            builder.extend(page)
+        return builder.build()
+
+    @classmethod
+    def from_records(cls, records: Iterable[Union[MessageRecord, Message]]) -> "MessageFrame":
+        """
+        Construye el frame desde registros livianos o modelos de mensajes.
+
+        Args:
+            records: MessageRecord o Message
+
+        Returns:
+            El frame con los mensajes, en orden
+        """
+        builder = FrameBuilder()
+        builder.extend_records(records)
+        return builder.build()
+
+    def __len__(self) -> int:
+        """Cantidad de mensajes."""
+        return len(self._columns["timestamp"])
+
+    def __iter__(self) -> Iterator[MessageRecord]:
+        """Recorre los mensajes como registros livianos."""
+        decoded = [self.column(name).tolist() for name in COLUMNS]
+        for row in zip(*decoded):
+            yield MessageRecord(*row)
+
+    def column(self, name: str) -> "NDArray[Any]":
+        """
+        Devuelve una columna, con los valores decodificados.
+
+        Args:
+            name: Nombre de la columna (ver COLUMNS)
+
+        Returns:
+            Los valores de la columna (sin copiar, salvo las codificadas)
+
+        Raises:
+            KeyError: Si la columna no existe
+        """
+        values = self._columns[name]
+        if name in self._categories:
+            decoded: NDArray[Any] = self._categories[name][values]
+            return decoded
+        return values
+
+    def codes(self, name: str) -> "NDArray[np.int32]":
+        """Códigos de una columna codificada como diccionario."""
+        if name not in self._categories:
+            raise KeyError(f"{name!r} is not a dictionary-encoded column")
+        return self._columns[name]
+
+    def categories(self, name: str) -> "NDArray[Any]":
+        """Valores distintos de una columna codificada como diccionario."""
+        return self._categories[name]
+
+    def _code_mask(self, name: str, values: Union[str, Sequence[str]]) -> "NDArray[np.bool_]":
+        """Filas cuya columna codificada tiene alguno de los valores."""
+        wanted = [values] if isinstance(values, str) else list(values)
+        index = {value: code for code, value in enumerate(self._categories[name].tolist())}
+        codes = [index[value] for value in wanted if value in index]
+        column = self._columns[name]
+        if len(codes) == 1:
+            matches: NDArray[np.bool_] = column == codes[0]
+            return matches
+        return np.isin(column, codes)
+
+    def mask(
+        self,
+        chat_id: Optional[str] = None,
+        type: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[_Moment] = None,
+        until: Optional[_Moment] = None,
+        from_me: Optional[bool] = None,
+        session_id: Optional[str] = None,
+    ) -> "NDArray[np.bool_]":
+        """
+        Calcula qué mensajes cumplen todos los filtros indicados.
+
+        Args:
+            chat_id: Chat del mensaje: el destinatario si lo envió la sesión,
+                el remitente si lo recibió
+            type: Tipo o tipos de mensaje
+            since: Sólo mensajes con timestamp >= since (datetime o milisegundos)
+            until: Sólo mensajes con timestamp < until (datetime o milisegundos)
+            from_me: Sólo enviados (True) o recibidos (False)
+            session_id: ID de la sesión
+
+        Returns:
+            Array booleano con una posición por mensaje
+        """
+        result = np.ones(len(self), dtype=np.bool_)
+        from_me_column = self._columns["from_me"]
+        if chat_id is not None:
+            result &= np.where(
+                from_me_column,
+                self._code_mask("to", chat_id),
+                self._code_mask("from_", chat_id),
+            )
+        if type is not None:
+            result &= self._code_mask("type", type)
+        if session_id is not None:
+            result &= self._code_mask("session_id", session_id)
+        if from_me is not None:
+            result &= from_me_column if from_me else ~from_me_column
+        timestamps = self._columns["timestamp"]
+        if since is not None:
+            result &= timestamps >= timestamp_to_ms(since)
+        if until is not None:
+            result &= timestamps < timestamp_to_ms(until)
+        return result
+
+    def take(self, rows: "NDArray[Any]") -> "MessageFrame":
+        """
+        Devuelve las filas indicadas por posición o por máscara booleana.
+
+        Args:
+            rows: Array de posiciones o máscara booleana
+
+        Returns:
+            Un frame nuevo con los mismos diccionarios
+        """
+        return MessageFrame(
+            {name: values[rows] for name, values in self._columns.items()}, self._categories
+        )
+
+    def filter(
+        self,
+        chat_id: Optional[str] = None,
+        type: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[_Moment] = None,
+        until: Optional[_Moment] = None,
+        from_me: Optional[bool] = None,
+        session_id: Optional[str] = None,
+    ) -> "MessageFrame":
+        """Devuelve los mensajes que cumplen los filtros (ver mask())."""
+        return self.take(self.mask(chat_id, type, since, until, from_me, session_id))
+
+    def value_counts(self, name: str) -> Dict[str, int]:
+        """
+        Cuenta los mensajes por valor de una columna codificada.
+
+        Args:
+            name: Columna de DICTIONARY_COLUMNS
+
+        Returns:
+            Cantidad de mensajes por valor, sin los valores ausentes
+        """
+        categories = self._categories[name]
+        counts = np.bincount(self.codes(name), minlength=len(categories))
+        return {value: int(count) for value, count in zip(categories.tolist(), counts) if count}
+
+    def to_pandas(self, tz: Optional[str] = None) -> "pandas.DataFrame":
+        """
+        Convierte el frame en un DataFrame de pandas.
+
+        Las columnas de strings, ``timestamp`` y ``from_me`` se pasan sin
+        copiar: ``timestamp`` queda como ``datetime64[ms]`` en UTC sin zona
+        horaria, salvo que se pida una con ``tz`` (lo que requiere una
+        copia). Las columnas codificadas se convierten en ``Categorical``
+        reutilizando sus códigos, sin volver a comparar los strings.
+
+        Args:
+            tz: Zona horaria de ``timestamp`` (por ejemplo ``"UTC"``), opcional
+
+        Raises:
+            ImportError: Si pandas no está instalado
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "to_pandas() requires pandas. Install it with: pip install 'wasapaso[analytics]'"
+            ) from e
+        data: Dict[str, Any] = {}
+        for name in COLUMNS:
+            values = self._columns[name]
+            if name in self._categories:
+                dtype = pd.CategoricalDtype(self._categories[name])
+                data[name] = pd.Categorical.from_codes(values, dtype=dtype)
+            elif name == "timestamp":
+                data[name] = values.view("datetime64[ms]")
+            elif name == "from_me":
+                data[name] = values
+            else:
+                data[name] = pd.Series(values, dtype=object, copy=False)
+        df = pd.DataFrame(data, copy=False)
+        if tz is not None:
+            df["timestamp"] = df["timestamp"].dt.tz_localize("UTC").dt.tz_convert(tz)
+        return df
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Convierte el frame en una tabla de Arrow con las mismas columnas.
+
+        Las columnas codificadas quedan como ``DictionaryArray`` y las
+        numéricas se pasan sin copiar.
+
+        Raises:
+            ImportError: Si pyarrow no está instalado
+        """
+        from wasapaso.export import _require_pyarrow
+
+        pa = _require_pyarrow()
+        arrays = []
+        for name in COLUMNS:
+            values = self._columns[name]
+            if name in self._categories:
+                dictionary = pa.array(self._categories[name], type=pa.string())
+                arrays.append(pa.DictionaryArray.from_arrays(values, dictionary))
+            elif name == "timestamp":
+                arrays.append(pa.array(values, type=pa.timestamp("ms", tz="UTC")))
+            elif name == "from_me":
+                arrays.append(pa.array(values, type=pa.bool_()))
+            else:
+                arrays.append(pa.array(values, type=pa.string()))
+        return pa.Table.from_arrays(arrays, names=list(COLUMNS))
@@ -0,0 +1,515 @@
+"""Protecciones locales aplicadas antes de enviar mensajes."""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from wasapaso._utils import hash_number
+from wasapaso.exceptions import DuplicateMessageError, FrequencyCapExceededError
+
+
+class DuplicateGuardStats(BaseModel):
+    """Contadores de un :class:`DuplicateGuard`."""
+
+    checked: int
+    suppressed: int
+    overflowed: int
+    tracked: int
+
+
+class DuplicateGuard:
+    """
+    Suprime envíos idénticos repetidos dentro de una ventana de tiempo.
+
+    Cada envío se identifica con un hash de 64 bits del endpoint y del
+    payload completo (sesión, destinatario, contenido). Los hashes se
+    guardan, con la hora del envío, en ``buckets`` intervalos rotativos que
+    cubren la ventana; cada intervalo admite como máximo
+    ``max_entries_per_bucket`` hashes, de modo que la memoria se mantiene
+    acotada aunque la tasa de envíos sea muy alta. Cuando un intervalo se
+    llena, los envíos siguientes de ese intervalo no se registran (se
+    cuentan en ``overflowed``) y nunca se bloquean por error. Un envío
+    idéntico se suprime si ocurre menos de ``window`` segundos después del
+    registrado: la hora sólo se compara en el intervalo más viejo, que es
+    el único que cae en parte fuera de la ventana.
+
+    Un envío suprimido lanza DuplicateMessageError; con
+    ``raise_on_duplicate=False`` devuelve en cambio una respuesta local con
+    ``"suppressed": True`` y sin ``messageId``.
+
+    Example:
+        >>> guard = DuplicateGuard(window=2.0)
+        >>> client = WasapasoClient(api_key="wsk_...", duplicate_guard=guard)
+        >>> client.messages.send_text("64abc123", "1234567890", "Hola")
+        >>> client.messages.send_text("64abc123", "1234567890", "Hola")
+        Traceback (most recent call last):
+        DuplicateMessageError: Duplicate message suppressed.
+    """
+
+    def __init__(
+        self,
+        window: float = 1.0,
+        buckets: int = 4,
+        max_entries_per_bucket: int = 100_000,
+        raise_on_duplicate: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Inicializa la protección.
+
+        Args:
+            window: Ventana en segundos durante la que se suprimen los envíos idénticos
+            buckets: Cantidad de intervalos en que se divide la ventana
+            max_entries_per_bucket: Máximo de hashes guardados por intervalo
+            raise_on_duplicate: Si es True (por defecto), lanza DuplicateMessageError;
+                si es False, devuelve una respuesta local sin ``messageId``
+            clock: Función que devuelve el tiempo actual en segundos
+
+        Raises:
+            ValueError: Si algún parámetro no es válido
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+
+        self.window = window
+        self.buckets = buckets
+        self.max_entries_per_bucket = max_entries_per_bucket
+        self.raise_on_duplicate = raise_on_duplicate
+        self._clock = clock
+        self._width = window / buckets
+        # Un intervalo extra para cubrir siempre la ventana completa; hash -> hora
+        self._sets: List[Dict[int, float]] = [{} for _ in range(buckets + 1)]
+        self._epochs: List[int] = [-1] * (buckets + 1)
+        self._lock = threading.Lock()
+
+        self._checked = 0
+        self._suppressed = 0
+        self._overflowed = 0
+
+    @staticmethod
+    def fingerprint(path: str, payload: Dict[str, Any]) -> int:
+        """
+        Calcula el hash de un envío.
+
+        Args:
+            path: Endpoint del envío
+            payload: Cuerpo JSON del envío
+
+        Returns:
+            Hash de 64 bits del envío
+        """
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return DuplicateGuard.fingerprint_bytes(path, body.encode("utf-8"))
+
+    @staticmethod
+    def fingerprint_bytes(path: str, body: bytes) -> int:
+        """
+        Calcula el hash de un envío cuyo cuerpo ya está serializado.
+
+        Args:
+            path: Endpoint del envío
+            body: Cuerpo JSON serializado
+
+        Returns:
+            Hash de 64 bits del envío
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(path.encode("utf-8"))
+        digest.update(body)
+        return int.from_bytes(digest.digest(), "little")
+
+    def check(self, key: int) -> bool:
+        """
+        Registra un envío e indica si es un duplicado dentro de la ventana.
+
+        Args:
+            key: Hash del envío (ver :meth:`fingerprint`)
+
+        Returns:
+            True si el envío debe suprimirse
+        """
+        now = self._clock()
+        epoch = int(now // self._width)
+        oldest = epoch - self.buckets
+        slots = self.buckets + 1
+        with self._lock:
+            self._checked += 1
+            for i in range(slots):
+                if self._epochs[i] < oldest:
+                    continue
+                sent_at = self._sets[i].get(key)
+                if sent_at is not None and (
+                    self._epochs[i] > oldest or now - sent_at < self.window
+                ):
+                    self._suppressed += 1
+                    return True
+
+            slot = epoch % slots
+            if self._epochs[slot] != epoch:
+                self._epochs[slot] = epoch
+                self._sets[slot].clear()
+            if len(self._sets[slot]) < self.max_entries_per_bucket:
+                self._sets[slot][key] = now
+            else:
+                self._overflowed += 1
+            return False
+
+    def discard(self, key: int) -> None:
+        """
+        Olvida un envío, por ejemplo porque la petición falló y puede reintentarse.
+
+        Args:
+            key: Hash del envío
+        """
+        with self._lock:
+            for entries in self._sets:
+                entries.pop(key, None)
+
+    def suppressed_response(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Construye el resultado de un envío suprimido.
+
+        Args:
+            payload: Cuerpo JSON del envío suprimido
+
+        Returns:
+            Respuesta local que indica que el envío no se realizó
+
+        Raises:
+            DuplicateMessageError: Si ``raise_on_duplicate`` es True (por defecto)
+        """
+        if self.raise_on_duplicate:
+            raise DuplicateMessageError(response_data={"to": payload.get("to")})
+        return {
+            "success": False,
+            "suppressed": True,
+            "message": "Duplicate message suppressed",
+            "data": {"sessionId": payload.get("sessionId"), "to": payload.get("to")},
+        }
+
+    @property
+    def stats(self) -> DuplicateGuardStats:
+        """Contadores acumulados de la protección."""
+        with self._lock:
+            return DuplicateGuardStats(
+                checked=self._checked,
+                suppressed=self._suppressed,
+                overflowed=self._overflowed,
+                tracked=sum(len(entries) for entries in self._sets),
+            )
+
+
+class FrequencyCap:
+    """
+    Límite de mensajes por destinatario en una ventana deslizante.
+
+    Por defecto los contadores son aproximados: la ventana se divide en
+    ``buckets`` intervalos y cada intervalo tiene un count-min sketch de
+    ``depth`` filas por ``width`` contadores de 16 bits. Si no se indica
+    ``width``, se calcula como el doble de ``expected_recipients`` (los
+    destinatarios distintos esperados por ventana), así que la memoria es
+    ``(buckets + 1) * depth * width * 2`` bytes, unos 1.1 MB con los valores
+    por defecto, y no crece con los destinatarios reales. El error siempre
+    sobreestima: un destinatario puede frenarse un poco antes de tiempo,
+    pero nunca supera el límite.
+
+    Con ``exact=True`` se guarda, por destinatario, un buffer circular con
+    las horas de sus últimos ``limit`` envíos. Es exacto pero la memoria
+    crece con la cantidad de destinatarios activos en la ventana.
+
+    Un envío que falla puede devolver su cupo con :meth:`release` (el
+    recurso de mensajes lo hace cuando la petición no se completa).
+
+    Cuando se alcanza el límite, ``mode="reject"`` lanza
+    FrequencyCapExceededError y ``mode="delay"`` espera hasta que haya cupo
+    (como máximo ``max_delay`` segundos).
+
+    Example:
+        >>> cap = FrequencyCap(limit=3, window=3600)
+        >>> client = WasapasoClient(api_key="wsk_...", frequency_cap=cap)
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float = 3600.0,
+        buckets: int = 6,
+        exact: bool = False,
+        expected_recipients: int = 10_000,
+        width: Optional[int] = None,
+        depth: int = 4,
+        mode: str = "reject",
+        max_delay: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Inicializa el límite de frecuencia.
+
+        Args:
+            limit: Cantidad máxima de mensajes por destinatario dentro de la ventana
+            window: Duración de la ventana en segundos
+            buckets: Cantidad de intervalos en que se divide la ventana (modo aproximado)
+            exact: Si es True, usa buffers circulares exactos por destinatario
+            expected_recipients: Destinatarios distintos esperados por ventana,
+                usado para dimensionar el sketch (modo aproximado)
+            width: Contadores por fila del sketch (modo aproximado); por
+                defecto, el doble de ``expected_recipients``
+            depth: Filas del sketch (modo aproximado)
+            mode: "reject" para rechazar o "delay" para esperar cupo
+            max_delay: Espera máxima en modo "delay"; si se supera, se rechaza
+            clock: Función que devuelve el tiempo actual en segundos
+
+        Raises:
+            ValueError: Si algún parámetro no es válido
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        if expected_recipients < 1:
+            raise ValueError("expected_recipients must be at least 1")
+        if width is None:
+            width = 2 * expected_recipients
+        if width < 1:
+            raise ValueError("width must be at least 1")
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        if mode not in ("reject", "delay"):
+            raise ValueError("mode must be 'reject' or 'delay'")
+        if not exact and limit > 0xFFFF:
+            raise ValueError("limit must be at most 65535 in approximate mode")
+
+        self.limit = limit
+        self.window = window
+        self.buckets = buckets
+        self.exact = exact
+        self.width = width
+        self.depth = depth
+        self.mode = mode
+        self.max_delay = max_delay
+        self._clock = clock
+        self._width_seconds = window / buckets
+        self._lock = threading.Lock()
+
+        slots = buckets + 1
+        self._epochs: List[int] = [-1] * slots
+        self._sketches: List[List[array[int]]] = []
+        self._history: Dict[int, Deque[float]] = {}
+        self._next_sweep = 0.0
+        if not exact:
+            self._sketches = [
+                [array("H", bytes(2 * width)) for _ in range(depth)] for _ in range(slots)
+            ]
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memoria ocupada por los contadores en modo aproximado."""
+        return sum(row.itemsize * len(row) for rows in self._sketches for row in rows)
+
+    def _indexes(self, key: int) -> List[int]:
+        """Posiciones de un destinatario en cada fila del sketch."""
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def _reserve_sketch(self, key: int, now: float) -> float:
+        """Registra un envío en el sketch o devuelve la espera necesaria."""
+        epoch = int(now // self._width_seconds)
+        slots = self.buckets + 1
+        indexes = self._indexes(key)
+
+        # Estimaciones por intervalo vigente, del más viejo al más nuevo
+        estimates = []
+        for offset in range(self.buckets, -1, -1):
+            bucket_epoch = epoch - offset
+            slot = bucket_epoch % slots
+            if self._epochs[slot] != bucket_epoch:
+                continue
+            rows = self._sketches[slot]
+            estimates.append((bucket_epoch, min(rows[i][j] for i, j in enumerate(indexes))))
+
+        total = sum(count for _, count in estimates)
+        if total >= self.limit:
+            for bucket_epoch, count in estimates:
+                total -= count
+                if total < self.limit:
+                    expires = (bucket_epoch + self.buckets + 1) * self._width_seconds
+                    return max(expires - now, 0.0)
+            return 0.0  # pragma: no cover
+
+        slot = epoch % slots
+        rows = self._sketches[slot]
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            for row in rows:
+                row[:] = array("H", bytes(2 * self.width))
+        # Suben todos los contadores del destinatario (no sólo los mínimos),
+        # así release() puede deshacer el envío sin subestimar a otros
+        for i, j in enumerate(indexes):
+            if rows[i][j] < 0xFFFF:
+                rows[i][j] += 1
+        return 0.0
+
+    def _reserve_exact(self, key: int, now: float) -> float:
+        """Registra un envío en el buffer circular o devuelve la espera necesaria."""
+        if now >= self._next_sweep:
+            cutoff = now - self.window
+            stale = [k for k, times in self._history.items() if times[-1] <= cutoff]
+            for k in stale:
+                del self._history[k]
+            self._next_sweep = now + self.window
+
+        times = self._history.get(key)
+        if times is None:
+            times = self._history[key] = deque(maxlen=self.limit)
+        if len(times) == self.limit and times[0] > now - self.window:
+            return times[0] + self.window - now
+        times.append(now)
+        return 0.0
+
+    def _reserve(self, recipient: str) -> Tuple[float, float]:
+        """Intenta registrar un envío; devuelve la espera necesaria y el momento del intento."""
+        key = hash_number(recipient)
+        with self._lock:
+            now = self._clock()
+            if self.exact:
+                return self._reserve_exact(key, now), now
+            return self._reserve_sketch(key, now), now
+
+    def reserve(self, recipient: str) -> float:
+        """
+        Intenta registrar un envío a un destinatario.
+
+        Args:
+            recipient: Número de teléfono o ID de WhatsApp
+
+        Returns:
+            0.0 si el envío quedó registrado, o los segundos que faltan para
+            que haya cupo (en ese caso no se registra nada)
+        """
+        return self._reserve(recipient)[0]
+
+    def release(self, recipient: str, at: Optional[float] = None) -> bool:
+        """
+        Devuelve el cupo de un envío registrado que no llegó a hacerse.
+
+        Args:
+            recipient: Número de teléfono o ID de WhatsApp
+            at: Momento en que se registró el envío, tal como lo devuelve
+                acquire() (por defecto, el envío más reciente en modo exacto
+                y el intervalo actual en modo aproximado)
+
+        Returns:
+            True si había un envío registrado que liberar
+        """
+        key = hash_number(recipient)
+        with self._lock:
+            if self.exact:
+                times = self._history.get(key)
+                if not times:
+                    return False
+                if at is None:
+                    times.pop()
+                elif at in times:
+                    times.remove(at)
+                else:
+                    return False
+                if not times:
+                    del self._history[key]
+                return True
+
+            epoch = int((self._clock() if at is None else at) // self._width_seconds)
+            slot = epoch % (self.buckets + 1)
+            if self._epochs[slot] != epoch:
+                return False
+            rows = self._sketches[slot]
+            cells = list(enumerate(self._indexes(key)))
+            if any(rows[i][j] == 0 for i, j in cells):
+                return False
+            for i, j in cells:
+                rows[i][j] -= 1
+            return True
+
+    def count(self, recipient: str) -> int:
+        """
+        Cantidad (estimada en modo aproximado) de envíos vigentes a un destinatario.
+
+        Args:
+            recipient: Número de teléfono o ID de WhatsApp
+
+        Returns:
+            Envíos registrados dentro de la ventana
+        """
+        key = hash_number(recipient)
+        with self._lock:
+            now = self._clock()
+            if self.exact:
+                times = self._history.get(key, ())
+                return sum(1 for t in times if t > now - self.window)
+            epoch = int(now // self._width_seconds)
+            slots = self.buckets + 1
+            indexes = self._indexes(key)
+            total = 0
+            for offset in range(self.buckets + 1):
+                slot = (epoch - offset) % slots
+                if self._epochs[slot] == epoch - offset:
+                    rows = self._sketches[slot]
+                    total += min(rows[i][j] for i, j in enumerate(indexes))
+            return total
+
+    def _rejection(self, recipient: str, delay: float) -> FrequencyCapExceededError:
+        """Construye el error para un envío que supera el límite."""
+        return FrequencyCapExceededError(
+            response_data={"to": recipient, "limit": self.limit, "retryAfter": delay}
+        )
+
+    def acquire(self, recipient: str) -> float:
+        """
+        Registra un envío, esperando cupo en modo "delay".
+
+        Args:
+            recipient: Número de teléfono o ID de WhatsApp
+
+        Returns:
+            El momento en que quedó registrado el envío (para release())
+
+        Raises:
+            FrequencyCapExceededError: Si el destinatario está por encima del límite
+                (en modo "delay", si la espera supera ``max_delay``)
+        """
+        waited = 0.0
+        while True:
+            delay, now = self._reserve(recipient)
+            if delay <= 0:
+                return now
+            if self.mode == "reject" or (
+                self.max_delay is not None and waited + delay > self.max_delay
+            ):
+                raise self._rejection(recipient, delay)
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, recipient: str) -> float:
+        """Versión asíncrona de acquire()."""
+        waited = 0.0
+        while True:
+            delay, now = self._reserve(recipient)
+            if delay <= 0:
+                return now
+            if self.mode == "reject" or (
+                self.max_delay is not None and waited + delay > self.max_delay
+            ):
+                raise self._rejection(recipient, delay)
+            await asyncio.sleep(delay)
+            waited += delay
@@ -0,0 +1,289 @@
+"""Bandeja de entrada materializada: último mensaje y no leídos por chat."""
+
+import heapq
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from wasapaso.archive import chat_of
+from wasapaso.models.message import Message
+from wasapaso.pagination import Descending, MessageCursor
+
+# (session_id, chat_id)
+ChatKey = Tuple[str, str]
+
+# (-timestamp, id invertido, session_id, chat_id) del último mensaje de un chat: las
+# comparaciones quedan entre enteros y el id sólo se compara si el timestamp empata
+_HeapEntry = Tuple[int, Descending, str, str]
+
+# Eventos de webhook que traen un mensaje
+_MESSAGE_EVENTS = frozenset({"message", "message.any"})
+
+# Entradas viejas toleradas en el heap, además de una por chat, antes de compactarlo
+_HEAP_SLACK = 64
+
+
+class InboxEntry(NamedTuple):
+    """Un chat de la bandeja: su último mensaje y cuántos recibidos faltan leer."""
+
+    session_id: str
+    chat_id: str
+    last_message: Message
+    unread: int
+
+
+def _heap_entry(cursor: MessageCursor, key: ChatKey) -> _HeapEntry:
+    """Entrada del heap de máximos para el último mensaje de un chat."""
+    return (-cursor.timestamp, Descending(cursor.id), key[0], key[1])
+
+
+class _Chat:
+    """Estado de un chat en la bandeja."""
+
+    __slots__ = ("latest", "cursor", "read", "unread")
+
+    def __init__(self, latest: Message, cursor: MessageCursor) -> None:
+        self.latest = latest
+        self.cursor = cursor
+        # Cursor hasta el que el chat está leído
+        self.read: Optional[MessageCursor] = None
+        # Mensajes recibidos sin leer: id -> (cursor, message_id)
+        self.unread: Dict[str, Tuple[MessageCursor, str]] = {}
+
+
+class Inbox:
+    """
+    Bandeja de entrada mantenida en memoria a partir de los mensajes que llegan.
+
+    Guarda, por ``(session_id, chat_id)``, el último mensaje y la cantidad
+    de mensajes recibidos sin leer, y ordena los chats por el cursor
+    ``(timestamp, id)`` de su último mensaje con un heap de máximos con
+    invalidación perezosa: cada mensaje más reciente agrega una entrada en
+    O(log n) y la anterior del chat queda vieja. ``list(limit=k)`` saca
+    del heap las primeras k entradas vigentes (descartando para siempre
+    las viejas que encuentra) y las vuelve a insertar, en O(k log n)
+    amortizado; el heap se reconstruye en O(n) cuando las entradas viejas
+    superan a los chats. Sin ``limit`` se ordenan todos los chats. Se alimenta
+    con los resultados de :class:`~wasapaso.sync.MessageSync` (``add``
+    sirve como sink) y con los eventos de webhook (:meth:`apply_event`);
+    listar la bandeja nunca consulta la API.
+
+    Un mensaje recibido cuenta como no leído hasta que se marca como leído
+    (con :meth:`mark_read`, o con ``messages.mark_as_read()`` si el cliente
+    tiene la bandeja) o hasta que la sesión envía un mensaje posterior en
+    ese chat. Recibir el mismo mensaje varias veces no altera los
+    contadores. Es seguro usarla desde varios hilos.
+
+    Example:
+        >>> inbox = Inbox()
+        >>> client = WasapasoClient(api_key="wsk_...", inbox=inbox)
+        >>> MessageSync(client, store).sync_many("64abc123...", chat_ids, sink=inbox.add)
+        >>> for entry in inbox.list(limit=20):
+        ...     print(entry.chat_id, entry.unread, entry.last_message.body)
+    """
+
+    def __init__(self) -> None:
+        """Crea una bandeja vacía."""
+        self._lock = threading.Lock()
+        self._chats: Dict[ChatKey, _Chat] = {}
+        # Heap de máximos por cursor del último mensaje; puede tener entradas viejas
+        self._heap: List[_HeapEntry] = []
+        # id y message_id de cada mensaje no leído -> (chat, id)
+        self._unread_ids: Dict[str, Tuple[ChatKey, str]] = {}
+        self._unread_total = 0
+
+    def __len__(self) -> int:
+        """Cantidad de chats en la bandeja."""
+        return len(self._chats)
+
+    @property
+    def unread(self) -> int:
+        """Cantidad total de mensajes sin leer."""
+        return self._unread_total
+
+    def add(self, messages: Iterable[Message]) -> None:
+        """
+        Incorpora mensajes, en cualquier orden.
+
+        Args:
+            messages: Mensajes de una o varias sesiones y chats
+        """
+        with self._lock:
+            for message in messages:
+                self._record(message)
+
+    def apply_event(self, event: Dict[str, Any]) -> bool:
+        """
+        Incorpora el mensaje de un evento de webhook.
+
+        Args:
+            event: Cuerpo del evento, con ``event`` y el mensaje en ``data``
+                (o ``payload``)
+
+        Returns:
+            True si el evento traía un mensaje, False si se ignoró
+
+        Raises:
+            pydantic.ValidationError: Si el mensaje del evento no es válido
+
+        Example:
+            >>> inbox.apply_event(request.json())
+            True
+        """
+        if event.get("event") not in _MESSAGE_EVENTS:
+            return False
+        data = event.get("data", event.get("payload"))
+        self.add([Message.model_validate(data)])
+        return True
+
+    def _record(self, message: Message) -> None:
+        """Actualiza el chat del mensaje (con el lock tomado)."""
+        key = (message.session_id, chat_of(message))
+        cursor = MessageCursor.of(message)
+        chat = self._chats.get(key)
+        if chat is None:
+            chat = self._chats[key] = _Chat(message, cursor)
+            self._push(cursor, key)
+        elif chat.cursor < cursor:
+            chat.latest, chat.cursor = message, cursor
+            self._push(cursor, key)
+        elif chat.cursor == cursor:
+            chat.latest = message
+
+        if message.from_me:
+            self._mark(chat, cursor)
+        elif (chat.read is None or chat.read < cursor) and message.id not in chat.unread:
+            chat.unread[message.id] = (cursor, message.message_id)
+            self._unread_ids[message.id] = self._unread_ids[message.message_id] = (key, message.id)
+            self._unread_total += 1
+
+    def _push(self, cursor: MessageCursor, key: ChatKey) -> None:
+        """Agrega la entrada vigente de un chat al heap (con el lock tomado)."""
+        heapq.heappush(self._heap, _heap_entry(cursor, key))
+        if len(self._heap) > 2 * len(self._chats) + _HEAP_SLACK:
+            self._heap = [_heap_entry(chat.cursor, key) for key, chat in self._chats.items()]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, entry: _HeapEntry) -> bool:
+        """Si la entrada del heap corresponde al último mensaje de su chat."""
+        chat = self._chats.get(entry[2:])
+        return chat is not None and chat.cursor == (-entry[0], entry[1].key)
+
+    def _mark(self, chat: _Chat, cursor: MessageCursor) -> None:
+        """Marca como leído el chat hasta el cursor (con el lock tomado)."""
+        if chat.read is not None and not chat.read < cursor:
+            return
+        chat.read = cursor
+        for message_id, (unread, alias) in list(chat.unread.items()):
+            if not cursor < unread:
+                del chat.unread[message_id]
+                self._unread_ids.pop(message_id, None)
+                self._unread_ids.pop(alias, None)
+                self._unread_total -= 1
+
+    def mark_read(self, message_id: str) -> bool:
+        """
+        Marca como leído un mensaje y todos los anteriores de su chat.
+
+        Args:
+            message_id: ``id`` o ``message_id`` del mensaje
+
+        Returns:
+            True si el mensaje estaba sin leer, False si no
+        """
+        with self._lock:
+            target = self._unread_ids.get(message_id)
+            if target is None:
+                return False
+            chat = self._chats[target[0]]
+            self._mark(chat, chat.unread[target[1]][0])
+            return True
+
+    def mark_chat_read(self, session_id: str, chat_id: str) -> int:
+        """
+        Marca como leído un chat completo.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat
+
+        Returns:
+            Cantidad de mensajes que estaban sin leer
+        """
+        with self._lock:
+            chat = self._chats.get((session_id, chat_id))
+            if chat is None:
+                return 0
+            count = len(chat.unread)
+            self._mark(chat, chat.cursor)
+            return count
+
+    def get(self, session_id: str, chat_id: str) -> Optional[InboxEntry]:
+        """
+        Devuelve un chat de la bandeja.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat
+
+        Returns:
+            El chat, o None si no tiene mensajes
+        """
+        with self._lock:
+            chat = self._chats.get((session_id, chat_id))
+            if chat is None:
+                return None
+            return InboxEntry(session_id, chat_id, chat.latest, len(chat.unread))
+
+    def list(
+        self,
+        session_id: Optional[str] = None,
+        unread_only: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[InboxEntry]:
+        """
+        Lista los chats del más reciente al más antiguo, sin consultar la API.
+
+        Con ``limit`` sólo se recorren las primeras entradas del heap (y las
+        que no cumplen los filtros); sin ``limit`` se ordenan todos los chats.
+
+        Args:
+            session_id: Sólo los chats de esta sesión (opcional)
+            unread_only: Sólo los chats con mensajes sin leer
+            limit: Cantidad máxima de chats (opcional)
+
+        Returns:
+            Los chats, ordenados por su último mensaje
+        """
+        entries: List[InboxEntry] = []
+        if limit is not None and limit <= 0:
+            return entries
+        with self._lock:
+            if limit is None:
+                ranked = sorted(self._chats, key=lambda key: self._chats[key].cursor, reverse=True)
+                for key in ranked:
+                    self._collect(entries, key, session_id, unread_only)
+                return entries
+            current: List[_HeapEntry] = []
+            while self._heap and len(entries) < limit:
+                entry = heapq.heappop(self._heap)
+                if self._is_current(entry):
+                    current.append(entry)
+                    self._collect(entries, entry[2:], session_id, unread_only)
+            for entry in current:
+                heapq.heappush(self._heap, entry)
+        return entries
+
+    def _collect(
+        self,
+        entries: List[InboxEntry],
+        key: ChatKey,
+        session_id: Optional[str],
+        unread_only: bool,
+    ) -> None:
+        """Agrega un chat al listado si cumple los filtros (con el lock tomado)."""
+        if session_id is not None and key[0] != session_id:
+            return
+        chat = self._chats[key]
+        if unread_only and not chat.unread:
+            return
+        entries.append(InboxEntry(key[0], key[1], chat.latest, len(chat.unread)))
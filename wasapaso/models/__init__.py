@@ -18,7 +18,10 @@ from wasapaso.models.message import (
     PollMessage,
     ButtonsMessage,
     MessageList,
+    MessageHistory,
 )
+from wasapaso.models.lazy import LazyList, LazyMessageList, LazySessionList
+from wasapaso.models.records import MessageRecord, MessageRecordList
 from wasapaso.models.api_key import ApiKeyInfo, Permissions, RateLimit, Usage
 
 __all__ = [
@@ -37,6 +40,12 @@ __all__ = [
     "PollMessage",
     "ButtonsMessage",
     "MessageList",
+    "MessageHistory",
+    "LazyList",
+    "LazyMessageList",
+    "LazySessionList",
+    "MessageRecord",
+    "MessageRecordList",
     "ApiKeyInfo",
     "Permissions",
     "RateLimit",
@@ -0,0 +1,132 @@
+"""Listas paginadas que validan cada elemento al accederlo por primera vez."""
+
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from pydantic import BaseModel
+
+from wasapaso.models.message import Message, MessageList
+from wasapaso.models.session import Session, SessionList
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LazyList(Sequence[T]):
+    """
+    Secuencia de modelos que se validan bajo demanda.
+
+    Guarda los diccionarios decodificados de la respuesta y valida cada
+    elemento la primera vez que se accede a él; el modelo queda cacheado y
+    el diccionario original se libera. Soporta ``len``, índices (también
+    negativos), slicing e iteración, como la lista de un ``MessageList``.
+    """
+
+    __slots__ = ("_model", "_items", "_cache")
+
+    def __init__(self, model: Type[T], items: List[Any]) -> None:
+        """
+        Crea la secuencia.
+
+        Args:
+            model: Modelo pydantic de cada elemento
+            items: Elementos sin validar
+        """
+        self._model = model
+        self._items: List[Any] = list(items)
+        self._cache: List[Optional[T]] = [None] * len(self._items)
+
+    def _get(self, index: int) -> T:
+        """Devuelve el elemento validado, validándolo si es necesario."""
+        item = self._cache[index]
+        if item is None:
+            raw = self._items[index]
+            item = raw if isinstance(raw, self._model) else self._model.model_validate(raw)
+            self._cache[index] = item
+            self._items[index] = None
+        return item
+
+    @property
+    def validated(self) -> int:
+        """Cantidad de elementos ya validados."""
+        return len(self._cache) - self._cache.count(None)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._cache)))]
+        size = len(self._cache)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("list index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._cache)):
+            yield self._get(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyList({self._model.__name__}, size={len(self)}, validated={self.validated})"
+
+
+class _LazyPage(Generic[T]):
+    """Página con ``data`` perezosa y ``pagination``, como los modelos ``*List``."""
+
+    _model: Type[T]
+
+    def __init__(self, response: Dict[str, Any]) -> None:
+        """
+        Crea la página a partir de la respuesta decodificada.
+
+        Args:
+            response: Respuesta de la API con ``data`` y ``pagination``
+        """
+        self.data: LazyList[T] = LazyList(self._model, response["data"])
+        self.pagination: Dict[str, Any] = response["pagination"]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(data={self.data!r}, pagination={self.pagination!r})"
+
+
+class LazyMessageList(_LazyPage[Message]):
+    """Lista paginada de mensajes validados bajo demanda."""
+
+    _model = Message
+
+    def to_model(self) -> MessageList:
+        """Valida todos los mensajes y devuelve un ``MessageList``."""
+        return MessageList(data=list(self.data), pagination=self.pagination)
+
+
+class LazySessionList(_LazyPage[Session]):
+    """Lista paginada de sesiones validadas bajo demanda."""
+
+    _model = Session
+
+    def to_model(self) -> SessionList:
+        """Valida todas las sesiones y devuelve un ``SessionList``."""
+        return SessionList(data=list(self.data), pagination=self.pagination)
@@ -33,6 +33,7 @@ class Message(BaseModel):
     type: str
     timestamp: datetime
     from_me: bool = Field(alias="fromMe")
+    reply_to: Optional[str] = Field(None, alias="replyTo")  # Mensaje al que responde
 
     class Config:
         populate_by_name = True
@@ -45,6 +46,21 @@ class MessageList(BaseModel):
     pagination: Dict[str, Any]
 
 
+class MessageHistory(BaseModel):
+    """Historial completo de mensajes descargado en paralelo."""
+
+    data: List[Message]
+    total: Optional[int] = None  # Total informado por la API en la primera página
+    pages: int = 0
+    duplicates: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        """Páginas descargadas por segundo."""
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
 class MessageSend(BaseModel):
     """Datos base para enviar un mensaje."""
 
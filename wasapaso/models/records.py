@@ -0,0 +1,126 @@
+"""Registros livianos de mensajes para listados grandes."""
+
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Los timestamps numéricos menores a este valor se interpretan en segundos
+_SECONDS_THRESHOLD = 100_000_000_000
+
+
+@lru_cache(maxsize=65_536)
+def _minute_ms(prefix: str) -> int:
+    """Milisegundos desde epoch de un prefijo ``YYYY-MM-DDTHH:MM`` en UTC."""
+    delta = datetime.strptime(prefix, "%Y-%m-%dT%H:%M").replace(tzinfo=timezone.utc) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1000
+
+
+class MessageRecord(NamedTuple):
+    """
+    Mensaje en formato liviano.
+
+    Tiene los mismos campos que :class:`~wasapaso.models.message.Message`,
+    pero sin validación de pydantic: ``timestamp`` es un entero con los
+    milisegundos desde epoch (UTC) y los strings repetidos (``session_id``,
+    ``from_``, ``to``, ``type``) están internados, así que las filas de una
+    misma conversación comparten la misma instancia de cada string.
+    """
+
+    id: str
+    session_id: str
+    message_id: str
+    from_: str
+    to: str
+    body: Optional[str]
+    type: str
+    timestamp: int
+    from_me: bool
+    reply_to: Optional[str] = None
+
+
+class MessageRecordList(NamedTuple):
+    """Lista paginada de mensajes en formato liviano."""
+
+    data: List[MessageRecord]
+    pagination: Dict[str, Any]
+
+
+def timestamp_to_ms(value: Union[str, int, float, datetime]) -> int:
+    """
+    Convierte un timestamp de la API a milisegundos desde epoch.
+
+    Args:
+        value: Fecha ISO 8601, datetime o número (segundos o milisegundos)
+
+    Returns:
+        Milisegundos desde epoch (UTC)
+    """
+    if isinstance(value, (int, float)):
+        if abs(value) < _SECONDS_THRESHOLD:
+            return int(value * 1000)
+        return int(value)
+    if isinstance(value, str):
+        # Formato habitual de la API (2024-01-01T12:30:45.123Z): el minuto se
+        # cachea y los segundos con milisegundos se leen de una sola vez
+        if len(value) == 24 and value[10] == "T" and value[19] == "." and value[23] == "Z":
+            try:
+                return _minute_ms(value[:16]) + int(value[17:19] + value[20:23])
+            except ValueError:
+                pass
+        if value.endswith(("Z", "z")):
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def message_records(items: Iterable[Dict[str, Any]]) -> List[MessageRecord]:
+    """
+    Convierte mensajes decodificados de la API en registros livianos.
+
+    Args:
+        items: Mensajes tal como llegan en el campo ``data`` de la respuesta
+
+    Returns:
+        Lista de registros
+    """
+    intern = sys.intern
+    new = MessageRecord.__new__
+    cls = MessageRecord
+    records: List[MessageRecord] = []
+    append = records.append
+    for item in items:
+        append(
+            new(
+                cls,
+                item["id"],
+                intern(item["sessionId"]),
+                item["messageId"],
+                intern(item["from"]),
+                intern(item["to"]),
+                item.get("body"),
+                intern(item["type"]),
+                timestamp_to_ms(item["timestamp"]),
+                bool(item["fromMe"]),
+                item.get("replyTo"),
+            )
+        )
+    return records
+
+
+def message_record_list(response: Dict[str, Any]) -> MessageRecordList:
+    """
+    Construye una lista liviana a partir de la respuesta de ``messages.list``.
+
+    Args:
+        response: Respuesta decodificada de la API
+
+    Returns:
+        Lista paginada de registros
+    """
+    return MessageRecordList(message_records(response["data"]), response["pagination"])
@@ -0,0 +1,446 @@
+"""Paginación automática: prefetch, tamaño adaptativo, descarga paralela, cursores y merge."""
+
+import asyncio
+import calendar
+import heapq
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from wasapaso.models.message import Message
+
+T = TypeVar("T")
+
+# Límite de resultados por página que acepta la API
+MAX_PAGE_SIZE = 100
+
+# (offset, limit) -> (elementos de la página, tamaño del body en bytes)
+PageFetch = Callable[[int, int], Tuple[Sequence[T], int]]
+AsyncPageFetch = Callable[[int, int], Awaitable[Tuple[Sequence[T], int]]]
+
+# Resultado de una petición cronometrada: elementos, bytes, segundos y limit pedido
+_Timed = Tuple[Sequence[T], int, float, int]
+
+
+class PageSizer:
+    """
+    Ajusta el tamaño de página según la latencia y el tamaño de las respuestas.
+
+    Después de cada página completa duplica el tamaño si la petición tardó
+    menos de la mitad de ``target_latency`` y el body pesó menos de la mitad
+    de ``max_page_bytes``, y lo reduce a la mitad si superó alguno de los
+    dos. El tamaño siempre queda entre ``minimum`` y ``maximum``.
+
+    Example:
+        >>> sizer = PageSizer(initial=50)
+        >>> sizer.observe(limit=50, count=50, elapsed=0.1, size=40_000)
+        >>> sizer.size
+        100
+    """
+
+    def __init__(
+        self,
+        initial: int = 50,
+        minimum: int = 10,
+        maximum: int = MAX_PAGE_SIZE,
+        target_latency: float = 1.0,
+        max_page_bytes: int = 2 * 1024 * 1024,
+    ) -> None:
+        """
+        Crea el ajustador.
+
+        Args:
+            initial: Tamaño de la primera página
+            minimum: Tamaño mínimo de página
+            maximum: Tamaño máximo de página (límite del servidor)
+            target_latency: Latencia objetivo por página, en segundos
+            max_page_bytes: Tamaño objetivo máximo del body de una página
+
+        Raises:
+            ValueError: Si los límites no son coherentes
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError("page size limits must satisfy 1 <= minimum <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        self._size = min(max(initial, minimum), maximum)
+
+    @property
+    def size(self) -> int:
+        """Tamaño de página actual."""
+        return self._size
+
+    def observe(self, limit: int, count: int, elapsed: float, size: int) -> None:
+        """
+        Registra una página recibida y ajusta el tamaño.
+
+        Las páginas incompletas (la última) no hacen crecer el tamaño.
+
+        Args:
+            limit: Tamaño pedido
+            count: Elementos recibidos
+            elapsed: Duración de la petición en segundos
+            size: Tamaño del body en bytes
+        """
+        if elapsed > self.target_latency or size > self.max_page_bytes:
+            self._size = max(self.minimum, self._size // 2)
+        elif (
+            count >= limit and elapsed < self.target_latency / 2 and size < self.max_page_bytes / 2
+        ):
+            self._size = min(self.maximum, self._size * 2)
+
+    def next_limit(self, offset: int, aligned: bool = False) -> int:
+        """
+        Devuelve el tamaño de la próxima página.
+
+        Args:
+            offset: Posición de la próxima página
+            aligned: Si la API pagina por número de página, el tamaño debe
+                dividir al offset para que la página caiga en ese offset
+
+        Returns:
+            Tamaño de página a pedir
+        """
+        limit = self._size
+        if aligned:
+            while offset % limit:
+                limit -= 1
+        return limit
+
+
+def _timed(fetch: PageFetch[T], offset: int, limit: int) -> _Timed[T]:
+    """Pide una página midiendo su duración."""
+    start = time.perf_counter()
+    items, size = fetch(offset, limit)
+    return items, size, time.perf_counter() - start, limit
+
+
+async def _timed_async(fetch: AsyncPageFetch[T], offset: int, limit: int) -> _Timed[T]:
+    """Versión asíncrona de _timed()."""
+    start = time.perf_counter()
+    items, size = await fetch(offset, limit)
+    return items, size, time.perf_counter() - start, limit
+
+
+def iter_pages(
+    fetch: PageFetch[T],
+    sizer: PageSizer,
+    prefetch: bool = True,
+    aligned: bool = False,
+) -> Iterator[Sequence[T]]:
+    """
+    Recorre todas las páginas de un listado.
+
+    Con ``prefetch`` la página siguiente se pide en un hilo mientras se
+    procesa la actual. Como mucho hay dos páginas en memoria: la entregada
+    y la que se está descargando. El recorrido termina con la primera
+    página incompleta.
+
+    Args:
+        fetch: Función que pide una página dados offset y limit
+        sizer: Ajustador del tamaño de página
+        prefetch: Pedir la página siguiente mientras se procesa la actual
+        aligned: La API pagina por número de página (ver PageSizer.next_limit)
+
+    Yields:
+        Los elementos de cada página, en orden
+    """
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: Optional[Future[_Timed[T]]] = None
+    if prefetch:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wasapaso-prefetch")
+    offset = 0
+    try:
+        result = _timed(fetch, offset, sizer.next_limit(offset, aligned))
+        while True:
+            items, size, elapsed, limit = result
+            sizer.observe(limit, len(items), elapsed, size)
+            offset += len(items)
+            done = len(items) < limit
+            next_limit = sizer.next_limit(offset, aligned)
+            if not done and executor is not None:
+                pending = executor.submit(_timed, fetch, offset, next_limit)
+            if items:
+                yield items
+            if done:
+                return
+            if pending is not None:
+                result, pending = pending.result(), None
+            else:
+                result = _timed(fetch, offset, next_limit)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: AsyncPageFetch[T],
+    sizer: PageSizer,
+    prefetch: bool = True,
+    aligned: bool = False,
+) -> AsyncGenerator[Sequence[T], None]:
+    """Versión asíncrona de iter_pages(); el prefetch usa una tarea de asyncio."""
+    pending: Optional[asyncio.Future[_Timed[T]]] = None
+    offset = 0
+    try:
+        result = await _timed_async(fetch, offset, sizer.next_limit(offset, aligned))
+        while True:
+            items, size, elapsed, limit = result
+            sizer.observe(limit, len(items), elapsed, size)
+            offset += len(items)
+            done = len(items) < limit
+            next_limit = sizer.next_limit(offset, aligned)
+            if not done and prefetch:
+                pending = asyncio.ensure_future(_timed_async(fetch, offset, next_limit))
+            if items:
+                yield items
+            if done:
+                return
+            if pending is not None:
+                result, pending = await pending, None
+            else:
+                result = await _timed_async(fetch, offset, next_limit)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_items(pages: Iterator[Sequence[T]]) -> Iterator[T]:
+    """Aplana un iterador de páginas."""
+    for page in pages:
+        yield from page
+
+
+async def aiter_items(pages: AsyncGenerator[Sequence[T], None]) -> AsyncIterator[T]:
+    """Versión asíncrona de iter_items(); cierra las páginas al terminar."""
+    try:
+        async for page in pages:
+            for item in page:
+                yield item
+    finally:
+        await pages.aclose()
+
+
+class Descending:
+    """
+    Clave con el orden invertido, para usar heapq de mayor a menor.
+
+    Example:
+        >>> heapq.heappush(heap, (Descending(message.timestamp), message.id))
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __lt__(self, other: "Descending") -> bool:
+        return bool(other.key < self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and bool(self.key == other.key)
+
+
+async def _next_page(pages: AsyncIterator[Sequence[T]]) -> Optional[Sequence[T]]:
+    """Pide la próxima página no vacía de una fuente, o None si terminó."""
+    async for page in pages:
+        if page:
+            return page
+    return None
+
+
+async def amerge_pages(
+    sources: Sequence[AsyncIterator[Sequence[T]]],
+    key: Callable[[T], Any],
+    reverse: bool = False,
+) -> AsyncGenerator[T, None]:
+    """
+    Une varias fuentes paginadas, cada una ya ordenada, en un único recorrido ordenado.
+
+    Es un merge de k vías con un heap que tiene el próximo elemento de cada
+    fuente. En cuanto se empieza a recorrer una página se pide la siguiente
+    de esa misma fuente, así que las fuentes se descargan en paralelo y de
+    cada una sólo hay en memoria la página en curso y la pedida por
+    adelantado. Los empates entre fuentes se resuelven por el orden de
+    ``sources``.
+
+    Args:
+        sources: Iteradores asíncronos de páginas, ordenadas según key
+        key: Función que devuelve la clave de orden de un elemento
+        reverse: Las fuentes están ordenadas de mayor a menor
+
+    Yields:
+        Los elementos de todas las fuentes, en orden
+    """
+    sources = list(sources)
+    pages: List[Sequence[T]] = [()] * len(sources)
+    positions = [0] * len(sources)
+    pending: List[Optional[asyncio.Future[Optional[Sequence[T]]]]] = [None] * len(sources)
+    heap: List[Tuple[Any, int]] = []
+
+    def sort_key(item: T) -> Any:
+        return Descending(key(item)) if reverse else key(item)
+
+    def prefetch(index: int) -> None:
+        pending[index] = asyncio.ensure_future(_next_page(sources[index]))
+
+    async def advance(index: int) -> None:
+        """Pasa a la página pedida por adelantado y pide la siguiente."""
+        task = pending[index]
+        pending[index] = None
+        page = await task if task is not None else None
+        if page is None:
+            return
+        pages[index], positions[index] = page, 0
+        prefetch(index)
+        heapq.heappush(heap, (sort_key(page[0]), index))
+
+    try:
+        for index in range(len(sources)):
+            prefetch(index)
+        for index in range(len(sources)):
+            await advance(index)
+        while heap:
+            index = heap[0][1]
+            page = pages[index]
+            position = positions[index]
+            yield page[position]
+            position += 1
+            positions[index] = position
+            if position < len(page):
+                heapq.heapreplace(heap, (sort_key(page[position]), index))
+            else:
+                heapq.heappop(heap)
+                pages[index] = ()
+                await advance(index)
+    finally:
+        tasks = [task for task in pending if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for source in sources:
+            close = getattr(source, "aclose", None)
+            if close is not None:
+                await close()
+
+
+def partition(total: int, page_size: int, start: int = 0) -> List[int]:
+    """
+    Divide el rango de offsets ``[start, total)`` en páginas.
+
+    Args:
+        total: Cantidad total de elementos
+        page_size: Tamaño de cada página
+        start: Primer offset
+
+    Returns:
+        Offset de cada página, en orden
+    """
+    return list(range(start, total, page_size))
+
+
+def merge_unique(pages: Iterable[Sequence[T]], key: Callable[[T], Hashable]) -> Tuple[List[T], int]:
+    """
+    Une páginas en orden descartando los elementos repetidos.
+
+    Si llegan elementos nuevos mientras se descargan páginas por offset,
+    los existentes se desplazan y pueden aparecer en dos páginas seguidas;
+    se conserva la primera aparición.
+
+    Args:
+        pages: Páginas en orden
+        key: Función que devuelve la identidad de un elemento
+
+    Returns:
+        Los elementos únicos y la cantidad de repetidos descartados
+    """
+    seen = set()
+    items: List[T] = []
+    duplicates = 0
+    for page in pages:
+        for item in page:
+            identity = key(item)
+            if identity in seen:
+                duplicates += 1
+                continue
+            seen.add(identity)
+            items.append(item)
+    return items, duplicates
+
+
+class MessageCursor(NamedTuple):
+    """
+    Posición en un listado de mensajes, del más reciente al más antiguo.
+
+    Identifica el último mensaje entregado por ``(timestamp, id)``; la
+    página siguiente contiene los mensajes estrictamente anteriores. A
+    diferencia de un offset, no se desplaza cuando llegan mensajes nuevos,
+    y se puede guardar como texto con :meth:`encode` para retomar el
+    recorrido más tarde.
+
+    Example:
+        >>> cursor = MessageCursor(1705322096789, "65f0a1")
+        >>> cursor.encode()
+        '1705322096789:65f0a1'
+        >>> MessageCursor.decode("1705322096789:65f0a1") == cursor
+        True
+    """
+
+    timestamp: int  # Milisegundos desde epoch
+    id: str
+
+    @classmethod
+    def of(cls, message: "Message") -> "MessageCursor":
+        """Crea el cursor que apunta a un mensaje."""
+        moment = message.timestamp
+        millis = calendar.timegm(moment.utctimetuple()) * 1000 + moment.microsecond // 1000
+        return cls(millis, message.id)
+
+    @classmethod
+    def decode(cls, value: str) -> "MessageCursor":
+        """
+        Reconstruye un cursor guardado con encode().
+
+        Raises:
+            ValueError: Si el texto no es un cursor válido
+        """
+        timestamp, sep, message_id = value.partition(":")
+        if not sep or not message_id:
+            raise ValueError(f"Invalid message cursor: {value!r}")
+        return cls(int(timestamp), message_id)
+
+    def encode(self) -> str:
+        """Devuelve el cursor como texto."""
+        return f"{self.timestamp}:{self.id}"
+
+    def params(self) -> Dict[str, Any]:
+        """Parámetros de query string para pedir los mensajes anteriores al cursor."""
+        seconds, millis = divmod(self.timestamp, 1000)
+        before = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        return {"before": f"{before}.{millis:03d}Z", "beforeId": self.id}
+
+    def precedes(self, message: "Message") -> bool:
+        """Indica si el mensaje es anterior al cursor (y todavía no se entregó)."""
+        return self.of(message) < self
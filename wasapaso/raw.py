@@ -0,0 +1,47 @@
+"""Respuestas sin decodificar para el modo raw."""
+
+from typing import Any, Dict, Mapping, NamedTuple
+
+import httpx
+from pydantic_core import from_json
+
+from wasapaso._utils import dump_json
+
+
+class RawResponse(NamedTuple):
+    """
+    Respuesta de la API sin decodificar.
+
+    Es lo que devuelven los recursos de ``client.with_raw_response``: el
+    status, los headers y el body tal como llegaron, para reenviarlos sin
+    pasar por diccionarios ni modelos. Los errores (status >= 400) se siguen
+    lanzando como excepciones de Wasapaso.
+
+    Example:
+        >>> raw = client.with_raw_response.messages.list(session_id="64abc123...")
+        >>> return Response(raw.content, status=raw.status_code,
+        ...                 content_type=raw.headers.get("content-type"))
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    @classmethod
+    def from_httpx(cls, response: httpx.Response) -> "RawResponse":
+        """Crea la respuesta a partir de una respuesta de httpx."""
+        return cls(response.status_code, response.headers, response.content)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], status_code: int = 200) -> "RawResponse":
+        """Crea una respuesta generada localmente (por ejemplo, un envío suprimido)."""
+        return cls(status_code, {"content-type": "application/json"}, dump_json(data))
+
+    @property
+    def view(self) -> memoryview:
+        """Vista del body sin copiarlo."""
+        return memoryview(self.content)
+
+    def json(self) -> Any:
+        """Decodifica el body JSON."""
+        return from_json(self.content)
@@ -1,14 +1,25 @@
 """Clase base para todos los recursos de la API."""
 
-from typing import TYPE_CHECKING
+import copy
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from wasapaso._parsing import parse_data, parse_model
 
 if TYPE_CHECKING:
     from wasapaso._http_client import HTTPClient
 
+M = TypeVar("M", bound=BaseModel)
+R = TypeVar("R", bound="BaseResource")
+
 
 class BaseResource:
     """Clase base para recursos de la API."""
 
+    # En modo raw los métodos devuelven RawResponse sin decodificar
+    _raw = False
+
     def __init__(self, http_client: "HTTPClient") -> None:
         """
         Inicializa el recurso.
@@ -17,3 +28,104 @@ class BaseResource:
             http_client: Cliente HTTP para realizar peticiones
         """
         self._client = http_client
+
+    def _as_raw(self: R) -> R:
+        """Devuelve una copia del recurso en modo raw."""
+        clone = copy.copy(self)
+        clone._raw = True
+        return clone
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """
+        Realiza una petición y devuelve el diccionario decodificado.
+
+        En modo raw devuelve la RawResponse sin decodificar.
+        """
+        if self._raw:
+            return self._client.request_raw(  # type: ignore[return-value]
+                method, path, params=params, json_data=json_data, content=content
+            )
+        return self._client.request(
+            method, path, params=params, json_data=json_data, content=content
+        )
+
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Versión asíncrona de _request()."""
+        if self._raw:
+            return await self._client.request_raw_async(  # type: ignore[return-value]
+                method, path, params=params, json_data=json_data, content=content
+            )
+        return await self._client.request_async(
+            method, path, params=params, json_data=json_data, content=content
+        )
+
+    def _request_model(
+        self,
+        method: str,
+        path: str,
+        model: Type[M],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        envelope: bool = True,
+    ) -> M:
+        """
+        Realiza una petición y valida la respuesta directamente desde los bytes.
+
+        Args:
+            method: Método HTTP
+            path: Path del endpoint
+            model: Modelo de la respuesta
+            params: Parámetros de query string
+            json_data: Datos JSON para el body
+            envelope: Si el modelo está en el campo ``data`` de la respuesta
+                (False para respuestas paginadas como ``MessageList``)
+
+        Returns:
+            La instancia del modelo (en modo raw, la RawResponse sin decodificar)
+        """
+        if self._raw:
+            return self._client.request_raw(  # type: ignore[return-value]
+                method, path, params=params, json_data=json_data
+            )
+        content = self._client.request_bytes(method, path, params=params, json_data=json_data)
+        return self._parse(content, model, envelope)
+
+    async def _request_model_async(
+        self,
+        method: str,
+        path: str,
+        model: Type[M],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        envelope: bool = True,
+    ) -> M:
+        """Versión asíncrona de _request_model()."""
+        if self._raw:
+            return await self._client.request_raw_async(  # type: ignore[return-value]
+                method, path, params=params, json_data=json_data
+            )
+        content = await self._client.request_bytes_async(
+            method, path, params=params, json_data=json_data
+        )
+        return self._parse(content, model, envelope)
+
+    @staticmethod
+    def _parse(content: bytes, model: Type[M], envelope: bool = True) -> M:
+        """Valida el modelo de una respuesta desde sus bytes."""
+        if envelope:
+            return parse_data(content, model)
+        return parse_model(content, model)
@@ -1,33 +1,216 @@
 """Recurso para gestionar mensajes de WhatsApp."""
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from pydantic_core import from_json
 
+from wasapaso._payloads import location_payload, media_payload, text_payload
+from wasapaso._streaming import ArrayItemSplitter
+from wasapaso.broadcast import (
+    BroadcastResult,
+    ColumnBatch,
+    PreparedTextMessage,
+    iter_template_bodies,
+)
+from wasapaso.exceptions import SuppressedRecipientError, WasapasoError
+from wasapaso.export import ExportFormat, export_messages
 from wasapaso.models.message import (
     ButtonsMessage,
     ContactMessage,
-    LocationMessage,
-    MediaMessage,
     Message,
+    MessageHistory,
     MessageList,
     PollMessage,
-    TextMessage,
 )
+from wasapaso.models.lazy import LazyMessageList
+from wasapaso.models.records import MessageRecordList, message_record_list
+from wasapaso.pagination import (
+    MAX_PAGE_SIZE,
+    MessageCursor,
+    PageSizer,
+    aiter_items,
+    aiter_pages,
+    amerge_pages,
+    iter_items,
+    iter_pages,
+    merge_unique,
+    partition,
+)
+from wasapaso.raw import RawResponse
 from wasapaso.resources.base import BaseResource
+from wasapaso.templates import MessageTemplate
+
+if TYPE_CHECKING:
+    from wasapaso._http_client import HTTPClient
+    from wasapaso.archive import MessageArchive
+    from wasapaso.dedup import RecipientDeduplicator
+    from wasapaso.frame import MessageFrame
+    from wasapaso.guards import DuplicateGuard, FrequencyCap
+    from wasapaso.inbox import Inbox
+    from wasapaso.suppression import SuppressionList
 
 
 class MessagesResource(BaseResource):
     """Gestión de mensajes de WhatsApp."""
 
-    def send(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(
+        self,
+        http_client: "HTTPClient",
+        suppression_list: Optional["SuppressionList"] = None,
+        duplicate_guard: Optional["DuplicateGuard"] = None,
+        frequency_cap: Optional["FrequencyCap"] = None,
+        archive: Optional["MessageArchive"] = None,
+        inbox: Optional["Inbox"] = None,
+    ) -> None:
+        """
+        Inicializa el recurso.
+
+        Args:
+            http_client: Cliente HTTP para realizar peticiones
+            suppression_list: Lista de números a los que nunca se envían mensajes (opcional)
+            duplicate_guard: Protección contra envíos idénticos repetidos (opcional)
+            frequency_cap: Límite de mensajes por destinatario y ventana de tiempo (opcional)
+            archive: Archivo local donde guardar los mensajes descargados y del
+                que servir las lecturas repetidas (opcional)
+            inbox: Bandeja de entrada que se actualiza al marcar mensajes como
+                leídos (opcional)
+        """
+        super().__init__(http_client)
+        self.suppression_list = suppression_list
+        self.duplicate_guard = duplicate_guard
+        self.frequency_cap = frequency_cap
+        self.archive = archive
+        self.inbox = inbox
+
+    def _check_recipient(self, to: Any) -> None:
+        """
+        Bloquea localmente los envíos a destinatarios suprimidos.
+
+        Raises:
+            SuppressedRecipientError: Si el destinatario está en la lista de supresión
+        """
+        if self.suppression_list is not None and to in self.suppression_list:
+            raise SuppressedRecipientError(response_data={"to": to})
+
+    def _local_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Adapta una respuesta generada localmente al modo del recurso."""
+        if self._raw:
+            return RawResponse.from_data(data)  # type: ignore[return-value]
+        return data
+
+    def _body_metadata(self, content: bytes) -> Dict[str, Any]:
+        """Decodifica un cuerpo pre-serializado sólo si lo requieren las comprobaciones locales."""
+        if (
+            self.suppression_list is None
+            and self.duplicate_guard is None
+            and self.frequency_cap is None
+        ):
+            return {}
+        data = from_json(content)
+        return data if isinstance(data, dict) else {}
+
+    def _post_message(
+        self, path: str, payload: Dict[str, Any], content: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """
+        Envía un mensaje tras aplicar las comprobaciones locales.
+
+        Args:
+            path: Endpoint del envío
+            payload: Cuerpo del mensaje, o sólo sus metadatos (sessionId, to)
+                cuando se pasa ``content``
+            content: Cuerpo JSON ya serializado (opcional)
+        """
+        to = payload.get("to")
+        self._check_recipient(to)
+        guard = self.duplicate_guard
+        key = None
+        if guard is not None:
+            if content is None:
+                key = guard.fingerprint(path, payload)
+            else:
+                key = guard.fingerprint_bytes(path, content)
+            if guard.check(key):
+                return self._local_response(guard.suppressed_response(payload))
+        cap = self.frequency_cap
+        reserved: Optional[Tuple[str, float]] = None
+        try:
+            if cap is not None and to is not None:
+                reserved = str(to), cap.acquire(str(to))
+            if content is None:
+                return self._request("POST", path, json_data=payload)
+            return self._request("POST", path, content=content)
+        except Exception:
+            if guard is not None and key is not None:
+                guard.discard(key)
+            if cap is not None and reserved is not None:
+                cap.release(*reserved)
+            raise
+
+    async def _post_message_async(
+        self, path: str, payload: Dict[str, Any], content: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """Versión asíncrona de _post_message()."""
+        to = payload.get("to")
+        self._check_recipient(to)
+        guard = self.duplicate_guard
+        key = None
+        if guard is not None:
+            if content is None:
+                key = guard.fingerprint(path, payload)
+            else:
+                key = guard.fingerprint_bytes(path, content)
+            if guard.check(key):
+                return self._local_response(guard.suppressed_response(payload))
+        cap = self.frequency_cap
+        reserved: Optional[Tuple[str, float]] = None
+        try:
+            if cap is not None and to is not None:
+                reserved = str(to), await cap.acquire_async(str(to))
+            if content is None:
+                return await self._request_async("POST", path, json_data=payload)
+            return await self._request_async("POST", path, content=content)
+        except Exception:
+            if guard is not None and key is not None:
+                guard.discard(key)
+            if cap is not None and reserved is not None:
+                cap.release(*reserved)
+            raise
+
+    def send(self, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """
         Envía un mensaje genérico (usa los métodos específicos cuando sea posible).
 
         Args:
-            data: Datos del mensaje
+            data: Datos del mensaje, o su JSON ya serializado (se envía tal cual)
 
         Returns:
             Información del mensaje enviado
 
+        Raises:
+            SuppressedRecipientError: Si el destinatario está en la lista de supresión
+            DuplicateMessageError: Si el envío repite otro reciente (con duplicate_guard)
+            FrequencyCapExceededError: Si el destinatario superó el límite de frecuencia
+
         Example:
             >>> result = client.messages.send({
             ...     "sessionId": "64abc123...",
@@ -36,11 +219,17 @@ class MessagesResource(BaseResource):
             ...     "type": "text"
             ... })
         """
-        return self._client.post("messages/send", json_data=data)
+        if isinstance(data, bytes):
+            return self._post_message("messages/send", self._body_metadata(data), content=data)
+        return self._post_message("messages/send", data)
 
-    async def send_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def send_async(self, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """Versión asíncrona de send()."""
-        return await self._client.post_async("messages/send", json_data=data)
+        if isinstance(data, bytes):
+            return await self._post_message_async(
+                "messages/send", self._body_metadata(data), content=data
+            )
+        return await self._post_message_async("messages/send", data)
 
     def send_text(
         self,
@@ -61,6 +250,11 @@ class MessagesResource(BaseResource):
         Returns:
             Información del mensaje enviado
 
+        Raises:
+            SuppressedRecipientError: Si el destinatario está en la lista de supresión
+            DuplicateMessageError: Si el envío repite otro reciente (con duplicate_guard)
+            FrequencyCapExceededError: Si el destinatario superó el límite de frecuencia
+
         Example:
             >>> result = client.messages.send_text(
             ...     session_id="64abc123...",
@@ -69,14 +263,8 @@ class MessagesResource(BaseResource):
             ... )
             >>> print(result["data"]["messageId"])
         """
-        msg = TextMessage(
-            sessionId=session_id,
-            to=to,
-            message=message,
-            replyTo=reply_to,
-        )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return self._client.post("messages/text", json_data=payload)
+        payload = text_payload(session_id, to, message, reply_to)
+        return self._post_message("messages/text", payload)
 
     async def send_text_async(
         self,
@@ -86,14 +274,201 @@ class MessagesResource(BaseResource):
         reply_to: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Versión asíncrona de send_text()."""
-        msg = TextMessage(
-            sessionId=session_id,
-            to=to,
-            message=message,
-            replyTo=reply_to,
+        payload = text_payload(session_id, to, message, reply_to)
+        return await self._post_message_async("messages/text", payload)
+
+    def _broadcast(
+        self,
+        session_id: str,
+        bodies: Iterable[Tuple[str, bytes]],
+        deduplicator: Optional["RecipientDeduplicator"],
+        result: BroadcastResult,
+    ) -> BroadcastResult:
+        """Envía cuerpos pre-serializados registrando el resultado por destinatario."""
+        for to, body in bodies:
+            if deduplicator is not None and deduplicator.is_duplicate(to):
+                result.add_skipped(to, "duplicate")
+                continue
+            try:
+                response = self._post_message(
+                    PreparedTextMessage.path, {"sessionId": session_id, "to": to}, content=body
+                )
+            except WasapasoError as e:
+                result.add_error(to, e)
+            else:
+                if isinstance(response, RawResponse):
+                    response = response.json()
+                result.add_response(to, response)
+        return result
+
+    async def _broadcast_async(
+        self,
+        session_id: str,
+        bodies: Iterable[Tuple[str, bytes]],
+        deduplicator: Optional["RecipientDeduplicator"],
+        result: BroadcastResult,
+        concurrency: int,
+    ) -> BroadcastResult:
+        """Versión asíncrona de _broadcast() con envíos simultáneos acotados."""
+        pending = iter(bodies)
+
+        async def worker() -> None:
+            for to, body in pending:
+                if deduplicator is not None and deduplicator.is_duplicate(to):
+                    result.add_skipped(to, "duplicate")
+                    continue
+                try:
+                    response = await self._post_message_async(
+                        PreparedTextMessage.path, {"sessionId": session_id, "to": to}, content=body
+                    )
+                except WasapasoError as e:
+                    result.add_error(to, e)
+                else:
+                    if isinstance(response, RawResponse):
+                        response = response.json()
+                    result.add_response(to, response)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        return result
+
+    def broadcast_text(
+        self,
+        session_id: str,
+        recipients: Iterable[str],
+        message: str,
+        reply_to: Optional[str] = None,
+        deduplicator: Optional["RecipientDeduplicator"] = None,
+    ) -> BroadcastResult:
+        """
+        Envía el mismo mensaje de texto a muchos destinatarios.
+
+        El cuerpo se valida y serializa una sola vez (ver
+        :class:`~wasapaso.broadcast.PreparedTextMessage`); por cada
+        destinatario sólo se inserta el número en los bytes ya construidos.
+        Las comprobaciones locales (lista de supresión, duplicados, límite de
+        frecuencia) se aplican a cada envío igual que en send_text().
+
+        Args:
+            session_id: ID de la sesión
+            recipients: Números de teléfono de los destinatarios
+            message: Texto del mensaje
+            reply_to: ID del mensaje al que se responde (opcional)
+            deduplicator: Etapa de de-duplicación de destinatarios (opcional)
+
+        Returns:
+            Resumen con los envíos realizados, fallidos y omitidos
+
+        Example:
+            >>> result = client.messages.broadcast_text(
+            ...     session_id="64abc123...",
+            ...     recipients=["1234567890", "0987654321"],
+            ...     message="Promo de hoy!"
+            ... )
+            >>> print(result.sent, result.failed, result.skipped)
+        """
+        prepared = PreparedTextMessage(session_id, message, reply_to)
+        bodies = ((to, prepared.render(to)) for to in recipients)
+        return self._broadcast(session_id, bodies, deduplicator, BroadcastResult())
+
+    async def broadcast_text_async(
+        self,
+        session_id: str,
+        recipients: Iterable[str],
+        message: str,
+        reply_to: Optional[str] = None,
+        deduplicator: Optional["RecipientDeduplicator"] = None,
+        concurrency: int = 10,
+    ) -> BroadcastResult:
+        """
+        Versión asíncrona de broadcast_text().
+
+        Args:
+            concurrency: Cantidad máxima de envíos simultáneos
+        """
+        prepared = PreparedTextMessage(session_id, message, reply_to)
+        bodies = ((to, prepared.render(to)) for to in recipients)
+        return await self._broadcast_async(
+            session_id, bodies, deduplicator, BroadcastResult(), concurrency
         )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return await self._client.post_async("messages/text", json_data=payload)
+
+    def broadcast_template(
+        self,
+        session_id: str,
+        template: Union[str, MessageTemplate],
+        batches: Union[ColumnBatch, Iterable[ColumnBatch]],
+        recipient_field: str = "to",
+        reply_to: Optional[str] = None,
+        deduplicator: Optional["RecipientDeduplicator"] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> BroadcastResult:
+        """
+        Envía un mensaje personalizado a cada destinatario a partir de una plantilla.
+
+        La plantilla se compila una sola vez y se valida contra el esquema de
+        los registros (``columns``, o las columnas del primer lote) antes del
+        primer envío. Los textos se renderizan por lote columnar y se
+        insertan en un cuerpo pre-serializado; los errores de renderizado se
+        cuentan como fallos por destinatario (con una muestra en
+        ``result.errors``), y los lotes posteriores que no cumplen el
+        esquema, como lotes fallidos.
+
+        Args:
+            session_id: ID de la sesión
+            template: Plantilla (texto o MessageTemplate ya compilada)
+            batches: Lote columnar (diccionario de columnas) o iterable de lotes
+            recipient_field: Columna con los números de los destinatarios
+            reply_to: ID del mensaje al que se responde (opcional)
+            deduplicator: Etapa de de-duplicación de destinatarios (opcional)
+            columns: Nombres de las columnas de los registros (opcional)
+
+        Returns:
+            Resumen con los envíos realizados, fallidos y omitidos
+
+        Raises:
+            TemplateError: Si la plantilla es inválida o el esquema no tiene
+                las columnas requeridas
+
+        Example:
+            >>> result = client.messages.broadcast_template(
+            ...     session_id="64abc123...",
+            ...     template="Hola {nombre}, tu pedido {pedido} está en camino",
+            ...     batches={
+            ...         "to": ["1234567890", "0987654321"],
+            ...         "nombre": ["Ana", "Luis"],
+            ...         "pedido": [1001, 1002],
+            ...     },
+            ... )
+        """
+        if isinstance(template, str):
+            template = MessageTemplate(template)
+        prepared = PreparedTextMessage.for_template(session_id, reply_to)
+        result = BroadcastResult()
+        bodies = iter_template_bodies(prepared, template, batches, recipient_field, result, columns)
+        return self._broadcast(session_id, bodies, deduplicator, result)
+
+    async def broadcast_template_async(
+        self,
+        session_id: str,
+        template: Union[str, MessageTemplate],
+        batches: Union[ColumnBatch, Iterable[ColumnBatch]],
+        recipient_field: str = "to",
+        reply_to: Optional[str] = None,
+        deduplicator: Optional["RecipientDeduplicator"] = None,
+        columns: Optional[Iterable[str]] = None,
+        concurrency: int = 10,
+    ) -> BroadcastResult:
+        """
+        Versión asíncrona de broadcast_template().
+
+        Args:
+            concurrency: Cantidad máxima de envíos simultáneos
+        """
+        if isinstance(template, str):
+            template = MessageTemplate(template)
+        prepared = PreparedTextMessage.for_template(session_id, reply_to)
+        result = BroadcastResult()
+        bodies = iter_template_bodies(prepared, template, batches, recipient_field, result, columns)
+        return await self._broadcast_async(session_id, bodies, deduplicator, result, concurrency)
 
     def send_media(
         self,
@@ -124,6 +499,11 @@ class MessagesResource(BaseResource):
         Returns:
             Información del mensaje enviado
 
+        Raises:
+            SuppressedRecipientError: Si el destinatario está en la lista de supresión
+            DuplicateMessageError: Si el envío repite otro reciente (con duplicate_guard)
+            FrequencyCapExceededError: Si el destinatario superó el límite de frecuencia
+
         Example:
             >>> result = client.messages.send_media(
             ...     session_id="64abc123...",
@@ -133,25 +513,18 @@ class MessagesResource(BaseResource):
             ...     caption="Mira esta imagen!"
             ... )
         """
-        from wasapaso.models.message import MediaContent, MessageType
-
-        media = MediaContent(
-            url=media_url,
-            data=media_data,
+        payload = media_payload(
+            session_id,
+            to,
+            media_type,
+            media_url=media_url,
+            media_data=media_data,
             mimetype=mimetype,
-            filename=filename,
-        )
-
-        msg = MediaMessage(
-            sessionId=session_id,
-            to=to,
-            type=MessageType(media_type),
-            media=media,
             caption=caption,
-            replyTo=reply_to,
+            filename=filename,
+            reply_to=reply_to,
         )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return self._client.post("messages/media", json_data=payload)
+        return self._post_message("messages/media", payload)
 
     async def send_media_async(
         self,
@@ -166,25 +539,18 @@ class MessagesResource(BaseResource):
         reply_to: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Versión asíncrona de send_media()."""
-        from wasapaso.models.message import MediaContent, MessageType
-
-        media = MediaContent(
-            url=media_url,
-            data=media_data,
+        payload = media_payload(
+            session_id,
+            to,
+            media_type,
+            media_url=media_url,
+            media_data=media_data,
             mimetype=mimetype,
-            filename=filename,
-        )
-
-        msg = MediaMessage(
-            sessionId=session_id,
-            to=to,
-            type=MessageType(media_type),
-            media=media,
             caption=caption,
-            replyTo=reply_to,
+            filename=filename,
+            reply_to=reply_to,
         )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return await self._client.post_async("messages/media", json_data=payload)
+        return await self._post_message_async("messages/media", payload)
 
     def send_location(
         self,
@@ -209,6 +575,11 @@ class MessagesResource(BaseResource):
         Returns:
             Información del mensaje enviado
 
+        Raises:
+            SuppressedRecipientError: Si el destinatario está en la lista de supresión
+            DuplicateMessageError: Si el envío repite otro reciente (con duplicate_guard)
+            FrequencyCapExceededError: Si el destinatario superó el límite de frecuencia
+
         Example:
             >>> result = client.messages.send_location(
             ...     session_id="64abc123...",
@@ -218,18 +589,8 @@ class MessagesResource(BaseResource):
             ...     title="Nueva York"
             ... )
         """
-        from wasapaso.models.message import Location
-
-        location = Location(latitude=latitude, longitude=longitude, title=title)
-
-        msg = LocationMessage(
-            sessionId=session_id,
-            to=to,
-            location=location,
-            replyTo=reply_to,
-        )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return self._client.post("messages/send", json_data=payload)
+        payload = location_payload(session_id, to, latitude, longitude, title, reply_to)
+        return self._post_message("messages/send", payload)
 
     async def send_location_async(
         self,
@@ -241,18 +602,84 @@ class MessagesResource(BaseResource):
         reply_to: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Versión asíncrona de send_location()."""
-        from wasapaso.models.message import Location
+        payload = location_payload(session_id, to, latitude, longitude, title, reply_to)
+        return await self._post_message_async("messages/send", payload)
+
+    @staticmethod
+    def _list_params(
+        session_id: str,
+        chat_id: Optional[str],
+        limit: int,
+        offset: int,
+        from_me: Optional[bool],
+        lite: bool,
+        lazy: bool,
+    ) -> Dict[str, Any]:
+        """Arma los parámetros de list() y comprueba las opciones de resultado."""
+        if lite and lazy:
+            raise ValueError("lite and lazy are mutually exclusive")
+        params: Dict[str, Any] = {
+            "sessionId": session_id,
+            "limit": limit,
+            "offset": offset,
+        }
+        if chat_id:
+            params["chatId"] = chat_id
+        if from_me is not None:
+            params["fromMe"] = str(from_me).lower()
+        return params
 
-        location = Location(latitude=latitude, longitude=longitude, title=title)
+    @staticmethod
+    def _list_result(
+        response: Dict[str, Any], lite: bool
+    ) -> Union[MessageRecordList, LazyMessageList]:
+        """Construye el resultado de list() en modo liviano o perezoso."""
+        if lite:
+            return message_record_list(response)
+        return LazyMessageList(response)
 
-        msg = LocationMessage(
-            sessionId=session_id,
-            to=to,
-            location=location,
-            replyTo=reply_to,
-        )
-        payload = msg.model_dump(by_alias=True, exclude_none=True)
-        return await self._client.post_async("messages/send", json_data=payload)
+    def _archive_page(self, params: Dict[str, Any], result: MessageList) -> None:
+        """Guarda una página de list() en el archivo local, si hay uno."""
+        if self.archive is not None and isinstance(result, MessageList):
+            self.archive.add_page(params, result)
+
+    @overload
+    def list(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        lite: Literal[False] = ...,
+        lazy: Literal[False] = ...,
+    ) -> MessageList: ...
+
+    @overload
+    def list(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        *,
+        lite: Literal[True],
+        lazy: Literal[False] = ...,
+    ) -> MessageRecordList: ...
+
+    @overload
+    def list(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        lite: Literal[False] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyMessageList: ...
 
     def list(
         self,
@@ -261,7 +688,9 @@ class MessagesResource(BaseResource):
         limit: int = 50,
         offset: int = 0,
         from_me: Optional[bool] = None,
-    ) -> MessageList:
+        lite: bool = False,
+        lazy: bool = False,
+    ) -> Union[MessageList, MessageRecordList, LazyMessageList]:
         """
         Lista los mensajes de una sesión.
 
@@ -271,9 +700,16 @@ class MessagesResource(BaseResource):
             limit: Cantidad de resultados
             offset: Offset para paginación
             from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            lite: Devolver registros livianos (MessageRecord) en lugar de modelos
+                pydantic; recomendado para listados grandes
+            lazy: Validar cada mensaje recién al accederlo (LazyMessageList)
 
         Returns:
-            Lista paginada de mensajes
+            Lista paginada de mensajes (MessageRecordList si lite=True,
+            LazyMessageList si lazy=True)
+
+        Raises:
+            ValueError: Si se combinan lite y lazy
 
         Example:
             >>> messages = client.messages.list(
@@ -282,19 +718,57 @@ class MessagesResource(BaseResource):
             ... )
             >>> for msg in messages.data:
             ...     print(msg.body)
+            >>> lite = client.messages.list("64abc123...", limit=1000, lite=True)
+            >>> lite.data[0].timestamp  # milisegundos desde epoch
         """
-        params: Dict[str, Any] = {
-            "sessionId": session_id,
-            "limit": limit,
-            "offset": offset,
-        }
-        if chat_id:
-            params["chatId"] = chat_id
-        if from_me is not None:
-            params["fromMe"] = str(from_me).lower()
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, lite, lazy)
+        if (lite or lazy) and not self._raw:
+            return self._list_result(self._client.get("messages", params=params), lite)
+        if self.archive is not None and not self._raw:
+            cached = self.archive.get_page(params)
+            if cached is not None:
+                return cached
+        result = self._request_model("GET", "messages", MessageList, params=params, envelope=False)
+        self._archive_page(params, result)
+        return result
+
+    @overload
+    async def list_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        lite: Literal[False] = ...,
+        lazy: Literal[False] = ...,
+    ) -> MessageList: ...
 
-        response = self._client.get("messages", params=params)
-        return MessageList(**response)
+    @overload
+    async def list_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        *,
+        lite: Literal[True],
+        lazy: Literal[False] = ...,
+    ) -> MessageRecordList: ...
+
+    @overload
+    async def list_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...,
+        from_me: Optional[bool] = ...,
+        lite: Literal[False] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyMessageList: ...
 
     async def list_async(
         self,
@@ -303,20 +777,558 @@ class MessagesResource(BaseResource):
         limit: int = 50,
         offset: int = 0,
         from_me: Optional[bool] = None,
-    ) -> MessageList:
+        lite: bool = False,
+        lazy: bool = False,
+    ) -> Union[MessageList, MessageRecordList, LazyMessageList]:
         """Versión asíncrona de list()."""
-        params: Dict[str, Any] = {
-            "sessionId": session_id,
-            "limit": limit,
-            "offset": offset,
-        }
-        if chat_id:
-            params["chatId"] = chat_id
-        if from_me is not None:
-            params["fromMe"] = str(from_me).lower()
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, lite, lazy)
+        if (lite or lazy) and not self._raw:
+            response = await self._client.get_async("messages", params=params)
+            return self._list_result(response, lite)
+        if self.archive is not None and not self._raw:
+            cached = self.archive.get_page(params)
+            if cached is not None:
+                return cached
+        result = await self._request_model_async(
+            "GET", "messages", MessageList, params=params, envelope=False
+        )
+        self._archive_page(params, result)
+        return result
 
-        response = await self._client.get_async("messages", params=params)
-        return MessageList(**response)
+    def iter_messages(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        from_me: Optional[bool] = None,
+        max_response_size: Optional[int] = None,
+    ) -> Iterator[Message]:
+        """
+        Lista los mensajes de una página decodificando la respuesta por partes.
+
+        A diferencia de list(), la respuesta no se carga completa en memoria:
+        cada mensaje se valida y se entrega en cuanto llega su JSON, así que
+        el consumo de memoria no depende del tamaño de la página.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat para filtrar (opcional)
+            limit: Cantidad de resultados
+            offset: Offset para paginación
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            max_response_size: Tamaño máximo de la respuesta en bytes; si se
+                supera, la lectura se aborta (opcional)
+
+        Yields:
+            Mensajes de la página, en orden
+
+        Raises:
+            ResponseTooLargeError: Si la respuesta supera max_response_size
+            ValueError: Si la respuesta está incompleta
+
+        Example:
+            >>> for msg in client.messages.iter_messages(
+            ...     "64abc123...", limit=10000, max_response_size=50 * 2**20
+            ... ):
+            ...     print(msg.body)
+        """
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+        splitter = ArrayItemSplitter("data")
+        chunks = self._client.stream("GET", "messages", params=params, max_size=max_response_size)
+        for chunk in chunks:
+            for item in splitter.feed(chunk):
+                yield Message.model_validate_json(item)
+        splitter.metadata()
+
+    async def iter_messages_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        from_me: Optional[bool] = None,
+        max_response_size: Optional[int] = None,
+    ) -> AsyncIterator[Message]:
+        """Versión asíncrona de iter_messages()."""
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+        splitter = ArrayItemSplitter("data")
+        chunks = self._client.stream_async(
+            "GET", "messages", params=params, max_size=max_response_size
+        )
+        async for chunk in chunks:
+            for item in splitter.feed(chunk):
+                yield Message.model_validate_json(item)
+        splitter.metadata()
+
+    def iter_all(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = 50,
+        max_page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Message]:
+        """
+        Recorre todos los mensajes de una sesión, pidiendo las páginas necesarias.
+
+        La página siguiente se pide mientras se procesa la actual y el tamaño
+        de página se ajusta según la latencia y el tamaño de las respuestas
+        (ver PageSizer), sin superar max_page_size. Como mucho se mantienen
+        dos páginas en memoria.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat para filtrar (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            page_size: Tamaño de la primera página
+            max_page_size: Tamaño máximo de página
+            prefetch: Pedir la página siguiente mientras se procesa la actual
+
+        Yields:
+            Mensajes, en el orden de la API
+
+        Example:
+            >>> for msg in client.messages.iter_all("64abc123..."):
+            ...     print(msg.body)
+        """
+
+        def fetch(offset: int, limit: int) -> Tuple[List[Message], int]:
+            params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+            content = self._client.request_bytes("GET", "messages", params=params)
+            return self._parse(content, MessageList, envelope=False).data, len(content)
+
+        sizer = PageSizer(initial=page_size, maximum=max_page_size)
+        return iter_items(iter_pages(fetch, sizer, prefetch))
+
+    def aiter_all(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = 50,
+        max_page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Message]:
+        """Versión asíncrona de iter_all(); se usa con ``async for``."""
+
+        async def fetch(offset: int, limit: int) -> Tuple[List[Message], int]:
+            params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+            content = await self._client.request_bytes_async("GET", "messages", params=params)
+            return self._parse(content, MessageList, envelope=False).data, len(content)
+
+        sizer = PageSizer(initial=page_size, maximum=max_page_size)
+        return aiter_items(aiter_pages(fetch, sizer, prefetch))
+
+    def export(
+        self,
+        session_id: str,
+        path: Union[str, "os.PathLike[str]"],
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        format: Optional[ExportFormat] = None,
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Exporta todos los mensajes de una sesión a Parquet o NDJSON.
+
+        Las páginas se recorren con iter_all() y se escriben en lotes de
+        ``batch_size`` filas, así que la memoria usada no depende del
+        tamaño del historial (ver wasapaso.export).
+
+        Args:
+            session_id: ID de la sesión
+            path: Ruta del archivo (``.parquet``, ``.ndjson``, ``.ndjson.gz``...)
+            chat_id: ID del chat para filtrar (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            format: ``parquet`` o ``ndjson`` (opcional si la extensión lo indica)
+            batch_size: Filas por lote
+
+        Returns:
+            Cantidad de mensajes exportados
+
+        Raises:
+            ImportError: Si se pide Parquet y pyarrow no está instalado
+
+        Example:
+            >>> rows = client.messages.export("64abc123...", "mensajes.parquet")
+        """
+        messages = self.iter_all(session_id, chat_id, from_me, page_size=MAX_PAGE_SIZE)
+        return export_messages(messages, path, format, batch_size)
+
+    def _raw_pages(
+        self,
+        session_id: str,
+        chat_id: Optional[str],
+        from_me: Optional[bool],
+        page_size: int,
+        prefetch: bool,
+    ) -> Iterator[Sequence[Dict[str, Any]]]:
+        """Recorre las páginas de mensajes decodificadas, sin validarlas."""
+
+        def fetch(offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+            params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+            content = self._client.request_bytes("GET", "messages", params=params)
+            return from_json(content)["data"], len(content)
+
+        sizer = PageSizer(initial=page_size, maximum=page_size)
+        return iter_pages(fetch, sizer, prefetch)
+
+    def fetch_frame(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> "MessageFrame":
+        """
+        Descarga todos los mensajes de una sesión en columnas de NumPy.
+
+        Las columnas se llenan directamente con las páginas decodificadas,
+        sin crear un modelo pydantic por mensaje (ver wasapaso.frame).
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat para filtrar (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            page_size: Tamaño de cada página
+            prefetch: Pedir la página siguiente mientras se procesa la actual
+
+        Returns:
+            Los mensajes en el orden de la API
+
+        Raises:
+            ImportError: Si numpy no está instalado
+
+        Example:
+            >>> frame = client.messages.fetch_frame("64abc123...")
+            >>> df = frame.filter(type="text").to_pandas()
+        """
+        from wasapaso.frame import FrameBuilder
+
+        builder = FrameBuilder()
+        for page in self._raw_pages(session_id, chat_id, from_me, page_size, prefetch):
+            builder.extend(page)
+        return builder.build()
+
+    async def fetch_frame_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> "MessageFrame":
+        """Versión asíncrona de fetch_frame()."""
+        from wasapaso.frame import FrameBuilder
+
+        async def fetch(offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+            params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+            content = await self._client.request_bytes_async("GET", "messages", params=params)
+            return from_json(content)["data"], len(content)
+
+        builder = FrameBuilder()
+        sizer = PageSizer(initial=page_size, maximum=page_size)
+        async for page in aiter_pages(fetch, sizer, prefetch):
+            builder.extend(page)
+        return builder.build()
+
+    def _page(
+        self,
+        session_id: str,
+        chat_id: Optional[str],
+        from_me: Optional[bool],
+        offset: int,
+        limit: int,
+        cursor: Optional[MessageCursor] = None,
+    ) -> MessageList:
+        """Pide una página de mensajes (anteriores al cursor, si se indica)."""
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+        if cursor is not None:
+            params.update(cursor.params())
+        content = self._client.request_bytes("GET", "messages", params=params)
+        page = self._parse(content, MessageList, envelope=False)
+        if self.archive is not None:
+            self.archive.add(page.data)
+        return page
+
+    async def _page_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str],
+        from_me: Optional[bool],
+        offset: int,
+        limit: int,
+        cursor: Optional[MessageCursor] = None,
+    ) -> MessageList:
+        """Versión asíncrona de _page()."""
+        params = self._list_params(session_id, chat_id, limit, offset, from_me, False, False)
+        if cursor is not None:
+            params.update(cursor.params())
+        content = await self._client.request_bytes_async("GET", "messages", params=params)
+        page = self._parse(content, MessageList, envelope=False)
+        if self.archive is not None:
+            self.archive.add(page.data)
+        return page
+
+    def fetch_history(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 4,
+    ) -> MessageHistory:
+        """
+        Descarga todos los mensajes de una sesión pidiendo páginas en paralelo.
+
+        Con el total informado en la primera página divide los offsets en
+        páginas, las pide con como mucho ``concurrency`` peticiones
+        simultáneas y las une en orden. Los mensajes que se repiten entre
+        páginas (porque llegaron mensajes nuevos durante la descarga) se
+        descartan por ``id``, y si la última página sigue completa se
+        continúa hasta la primera incompleta.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat para filtrar (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            page_size: Tamaño de cada página
+            concurrency: Cantidad máxima de peticiones simultáneas
+
+        Returns:
+            Los mensajes en orden, con la cantidad de páginas, repetidos
+            descartados y duración de la descarga
+
+        Example:
+            >>> history = client.messages.fetch_history("64abc123...", concurrency=8)
+            >>> print(len(history.data), f"{history.pages_per_second:.1f} páginas/s")
+        """
+        start = time.perf_counter()
+        first = self._page(session_id, chat_id, from_me, 0, page_size)
+        total = first.pagination.get("total")
+        offsets = partition(total, page_size, page_size) if isinstance(total, int) else []
+        pages = [first.data]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                results = executor.map(
+                    lambda offset: self._page(session_id, chat_id, from_me, offset, page_size),
+                    offsets,
+                )
+                pages.extend(page.data for page in results)
+
+        offset = page_size * len(pages)
+        while len(pages[-1]) == page_size:
+            pages.append(self._page(session_id, chat_id, from_me, offset, page_size).data)
+            offset += page_size
+
+        data, duplicates = merge_unique(pages, lambda msg: msg.id)
+        return MessageHistory(
+            data=data,
+            total=total if isinstance(total, int) else None,
+            pages=len(pages),
+            duplicates=duplicates,
+            elapsed=time.perf_counter() - start,
+        )
+
+    async def fetch_history_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 4,
+    ) -> MessageHistory:
+        """Versión asíncrona de fetch_history()."""
+        start = time.perf_counter()
+        first = await self._page_async(session_id, chat_id, from_me, 0, page_size)
+        total = first.pagination.get("total")
+        offsets = partition(total, page_size, page_size) if isinstance(total, int) else []
+        pages = [first.data]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(offset: int) -> List[Message]:
+            async with semaphore:
+                page = await self._page_async(session_id, chat_id, from_me, offset, page_size)
+            return page.data
+
+        pages.extend(await asyncio.gather(*(fetch(offset) for offset in offsets)))
+
+        offset = page_size * len(pages)
+        while len(pages[-1]) == page_size:
+            pages.append(await fetch(offset))
+            offset += page_size
+
+        data, duplicates = merge_unique(pages, lambda msg: msg.id)
+        return MessageHistory(
+            data=data,
+            total=total if isinstance(total, int) else None,
+            pages=len(pages),
+            duplicates=duplicates,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def iter_cursor(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = 50,
+        cursor: Optional[Union[MessageCursor, str]] = None,
+    ) -> Iterator[Message]:
+        """
+        Recorre los mensajes del más reciente al más antiguo paginando por cursor.
+
+        Cada página pide los mensajes anteriores al último entregado según
+        ``(timestamp, id)`` (parámetros ``before`` y ``beforeId``), siempre
+        con offset 0: las páginas profundas cuestan lo mismo que la primera
+        y los mensajes nuevos no desplazan el recorrido. Si la API ignora
+        esos parámetros, se pagina por offset filtrando localmente los
+        mensajes que no son anteriores al cursor, así que tampoco se
+        entregan repetidos.
+
+        Args:
+            session_id: ID de la sesión
+            chat_id: ID del chat para filtrar (opcional)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            page_size: Tamaño de cada página
+            cursor: Posición desde la que continuar, como MessageCursor o
+                el texto de MessageCursor.encode() (opcional)
+
+        Yields:
+            Mensajes anteriores al cursor, del más reciente al más antiguo
+
+        Example:
+            >>> for msg in client.messages.iter_cursor("64abc123..."):
+            ...     process(msg)
+            ...     state["cursor"] = MessageCursor.of(msg).encode()
+        """
+        position = MessageCursor.decode(cursor) if isinstance(cursor, str) else cursor
+        server = True
+        offset = delivered = 0
+        while True:
+            page = self._page(
+                session_id, chat_id, from_me, offset, page_size, position if server else None
+            ).data
+            if server and position is not None and any(not position.precedes(m) for m in page):
+                # La API ignoró el cursor: seguir por offset filtrando localmente
+                server = False
+                offset = delivered
+                continue
+            fresh = [m for m in page if position is None or position.precedes(m)]
+            yield from fresh
+            delivered += len(fresh)
+            if fresh:
+                position = MessageCursor.of(fresh[-1])
+            if len(page) < page_size:
+                return
+            if not server:
+                offset += len(page)
+
+    async def iter_cursor_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str] = None,
+        from_me: Optional[bool] = None,
+        page_size: int = 50,
+        cursor: Optional[Union[MessageCursor, str]] = None,
+    ) -> AsyncIterator[Message]:
+        """Versión asíncrona de iter_cursor()."""
+        pages = self._cursor_pages_async(session_id, chat_id, from_me, page_size, cursor)
+        async for message in aiter_items(pages):
+            yield message
+
+    async def _cursor_pages_async(
+        self,
+        session_id: str,
+        chat_id: Optional[str],
+        from_me: Optional[bool],
+        page_size: int,
+        cursor: Optional[Union[MessageCursor, str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncGenerator[List[Message], None]:
+        """
+        Recorre por cursor las páginas de mensajes, del más reciente al más antiguo.
+
+        Ver iter_cursor(); con ``semaphore`` cada petición espera un lugar
+        libre, para acotar las peticiones simultáneas entre varios recorridos.
+        """
+        position = MessageCursor.decode(cursor) if isinstance(cursor, str) else cursor
+        server = True
+        offset = delivered = 0
+        while True:
+            request = self._page_async(
+                session_id, chat_id, from_me, offset, page_size, position if server else None
+            )
+            if semaphore is not None:
+                async with semaphore:
+                    response = await request
+            else:
+                response = await request
+            page = response.data
+            if server and position is not None and any(not position.precedes(m) for m in page):
+                server = False
+                offset = delivered
+                continue
+            fresh = [m for m in page if position is None or position.precedes(m)]
+            delivered += len(fresh)
+            if fresh:
+                position = MessageCursor.of(fresh[-1])
+                yield fresh
+            if len(page) < page_size:
+                return
+            if not server:
+                offset += len(page)
+
+    async def iter_timeline_async(
+        self,
+        sources: Iterable[Union[str, Tuple[str, Optional[str]]]],
+        from_me: Optional[bool] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> AsyncIterator[Message]:
+        """
+        Recorre los mensajes de varias sesiones y chats en una única línea de tiempo.
+
+        Cada fuente se pagina por cursor (ver iter_cursor()) y las fuentes
+        se unen con un heap por ``(timestamp, id)``, del más reciente al
+        más antiguo. De cada fuente sólo se guarda la página en curso y la
+        siguiente, que se pide por adelantado, así que la memoria crece con
+        la cantidad de fuentes y no con la cantidad de mensajes. Como mucho
+        hay ``concurrency`` peticiones simultáneas.
+
+        Args:
+            sources: IDs de sesión, o tuplas ``(session_id, chat_id)`` para
+                un chat concreto (chat_id None para toda la sesión)
+            from_me: Filtrar por mensajes enviados (True) o recibidos (False)
+            page_size: Tamaño de cada página
+            concurrency: Cantidad máxima de peticiones simultáneas
+
+        Yields:
+            Mensajes de todas las fuentes, del más reciente al más antiguo
+
+        Example:
+            >>> sources = ["64abc123...", ("64def456...", "5491100000000@c.us")]
+            >>> async for msg in client.messages.iter_timeline_async(sources):
+            ...     dashboard.push(msg)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        pages = []
+        for source in dict.fromkeys(sources):
+            session_id, chat_id = (source, None) if isinstance(source, str) else source
+            pages.append(
+                self._cursor_pages_async(
+                    session_id, chat_id, from_me, page_size, semaphore=semaphore
+                )
+            )
+        merged = amerge_pages(pages, key=MessageCursor.of, reverse=True)
+        try:
+            async for message in merged:
+                yield message
+        finally:
+            await merged.aclose()
 
     def get(self, message_id: str) -> Message:
         """
@@ -328,17 +1340,30 @@ class MessagesResource(BaseResource):
         Returns:
             Datos del mensaje
 
+        Si el cliente tiene un archivo local y el mensaje ya está archivado,
+        se devuelve sin consultar la API.
+
         Example:
             >>> message = client.messages.get("64xyz789...")
             >>> print(message.body)
         """
-        response = self._client.get(f"messages/{message_id}")
-        return Message(**response["data"])
+        if self.archive is None or self._raw:
+            return self._request_model("GET", f"messages/{message_id}", Message)
+        message = self.archive.get(message_id)
+        if message is None:
+            message = self._request_model("GET", f"messages/{message_id}", Message)
+            self.archive.add([message])
+        return message
 
     async def get_async(self, message_id: str) -> Message:
         """Versión asíncrona de get()."""
-        response = await self._client.get_async(f"messages/{message_id}")
-        return Message(**response["data"])
+        if self.archive is None or self._raw:
+            return await self._request_model_async("GET", f"messages/{message_id}", Message)
+        message = self.archive.get(message_id)
+        if message is None:
+            message = await self._request_model_async("GET", f"messages/{message_id}", Message)
+            self.archive.add([message])
+        return message
 
     def mark_as_read(self, message_id: str) -> Dict[str, Any]:
         """
@@ -350,14 +1375,23 @@ class MessagesResource(BaseResource):
         Returns:
             Respuesta de confirmación
 
+        Si el cliente tiene una bandeja de entrada, una vez confirmado se
+        marcan como leídos el mensaje y los anteriores de su chat.
+
         Example:
             >>> result = client.messages.mark_as_read("64xyz789...")
         """
-        return self._client.post(f"messages/{message_id}/read")
+        result = self._request("POST", f"messages/{message_id}/read")
+        if self.inbox is not None:
+            self.inbox.mark_read(message_id)
+        return result
 
     async def mark_as_read_async(self, message_id: str) -> Dict[str, Any]:
         """Versión asíncrona de mark_as_read()."""
-        return await self._client.post_async(f"messages/{message_id}/read")
+        result = await self._request_async("POST", f"messages/{message_id}/read")
+        if self.inbox is not None:
+            self.inbox.mark_read(message_id)
+        return result
 
     def react(self, message_id: str, reaction: str) -> Dict[str, Any]:
         """
@@ -374,12 +1408,12 @@ class MessagesResource(BaseResource):
             >>> result = client.messages.react("64xyz789...", "👍")
         """
         payload = {"reaction": reaction}
-        return self._client.post(f"messages/{message_id}/react", json_data=payload)
+        return self._request("POST", f"messages/{message_id}/react", json_data=payload)
 
     async def react_async(self, message_id: str, reaction: str) -> Dict[str, Any]:
         """Versión asíncrona de react()."""
         payload = {"reaction": reaction}
-        return await self._client.post_async(f"messages/{message_id}/react", json_data=payload)
+        return await self._request_async("POST", f"messages/{message_id}/react", json_data=payload)
 
     def delete(self, message_id: str, delete_for_everyone: bool = False) -> Dict[str, Any]:
         """
@@ -392,15 +1426,24 @@ class MessagesResource(BaseResource):
         Returns:
             Respuesta de confirmación
 
+        Si el cliente tiene un archivo local, una vez confirmado se quita el
+        mensaje del archivo y de las páginas guardadas que lo incluyen.
+
         Example:
             >>> result = client.messages.delete("64xyz789...", delete_for_everyone=True)
         """
         params = {"deleteForEveryone": str(delete_for_everyone).lower()}
-        return self._client.delete(f"messages/{message_id}", params=params)
+        result = self._request("DELETE", f"messages/{message_id}", params=params)
+        if self.archive is not None:
+            self.archive.remove(message_id)
+        return result
 
     async def delete_async(
         self, message_id: str, delete_for_everyone: bool = False
     ) -> Dict[str, Any]:
         """Versión asíncrona de delete()."""
         params = {"deleteForEveryone": str(delete_for_everyone).lower()}
-        return await self._client.delete_async(f"messages/{message_id}", params=params)
+        result = await self._request_async("DELETE", f"messages/{message_id}", params=params)
+        if self.archive is not None:
+            self.archive.remove(message_id)
+        return result
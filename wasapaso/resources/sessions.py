@@ -1,7 +1,19 @@
 """Recurso para gestionar sesiones de WhatsApp."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
+from wasapaso.models.lazy import LazySessionList
 from wasapaso.models.session import (
     PairingCode,
     QRCode,
@@ -10,6 +22,14 @@ from wasapaso.models.session import (
     SessionList,
     SessionUpdate,
 )
+from wasapaso.pagination import (
+    MAX_PAGE_SIZE,
+    PageSizer,
+    aiter_items,
+    aiter_pages,
+    iter_items,
+    iter_pages,
+)
 from wasapaso.resources.base import BaseResource
 
 
@@ -39,8 +59,7 @@ class SessionsResource(BaseResource):
         else:
             payload = data
 
-        response = self._client.post("sessions", json_data=payload)
-        return Session(**response["data"])
+        return self._request_model("POST", "sessions", Session, json_data=payload)
 
     async def create_async(self, data: Union[SessionCreate, Dict[str, Any]]) -> Session:
         """Versión asíncrona de create()."""
@@ -49,12 +68,34 @@ class SessionsResource(BaseResource):
         else:
             payload = data
 
-        response = await self._client.post_async("sessions", json_data=payload)
-        return Session(**response["data"])
+        return await self._request_model_async("POST", "sessions", Session, json_data=payload)
+
+    @overload
+    def list(
+        self,
+        page: int = ...,
+        limit: int = ...,
+        status: Optional[str] = ...,
+        lazy: Literal[False] = ...,
+    ) -> SessionList: ...
+
+    @overload
+    def list(
+        self,
+        page: int = ...,
+        limit: int = ...,
+        status: Optional[str] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazySessionList: ...
 
     def list(
-        self, page: int = 1, limit: int = 20, status: Optional[str] = None
-    ) -> SessionList:
+        self,
+        page: int = 1,
+        limit: int = 20,
+        status: Optional[str] = None,
+        lazy: bool = False,
+    ) -> Union[SessionList, LazySessionList]:
         """
         Lista todas las sesiones del usuario.
 
@@ -62,6 +103,7 @@ class SessionsResource(BaseResource):
             page: Número de página
             limit: Cantidad de resultados por página
             status: Filtrar por estado (opcional)
+            lazy: Validar cada sesión recién al accederla (LazySessionList)
 
         Returns:
             Lista paginada de sesiones
@@ -75,19 +117,109 @@ class SessionsResource(BaseResource):
         if status:
             params["status"] = status
 
-        response = self._client.get("sessions", params=params)
-        return SessionList(**response)
+        if lazy and not self._raw:
+            return LazySessionList(self._client.get("sessions", params=params))
+        return self._request_model("GET", "sessions", SessionList, params=params, envelope=False)
 
+    @overload
+    async def list_async(
+        self,
+        page: int = ...,
+        limit: int = ...,
+        status: Optional[str] = ...,
+        lazy: Literal[False] = ...,
+    ) -> SessionList: ...
+
+    @overload
     async def list_async(
-        self, page: int = 1, limit: int = 20, status: Optional[str] = None
-    ) -> SessionList:
+        self,
+        page: int = ...,
+        limit: int = ...,
+        status: Optional[str] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazySessionList: ...
+
+    async def list_async(
+        self,
+        page: int = 1,
+        limit: int = 20,
+        status: Optional[str] = None,
+        lazy: bool = False,
+    ) -> Union[SessionList, LazySessionList]:
         """Versión asíncrona de list()."""
         params = {"page": page, "limit": limit}
         if status:
             params["status"] = status
 
-        response = await self._client.get_async("sessions", params=params)
-        return SessionList(**response)
+        if lazy and not self._raw:
+            return LazySessionList(await self._client.get_async("sessions", params=params))
+        return await self._request_model_async(
+            "GET", "sessions", SessionList, params=params, envelope=False
+        )
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 20,
+        max_page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Session]:
+        """
+        Recorre todas las sesiones del usuario, pidiendo las páginas necesarias.
+
+        La página siguiente se pide mientras se procesa la actual y el tamaño
+        de página se ajusta según la latencia y el tamaño de las respuestas
+        (ver PageSizer), sin superar max_page_size.
+
+        Args:
+            status: Filtrar por estado (opcional)
+            page_size: Tamaño de la primera página
+            max_page_size: Tamaño máximo de página
+            prefetch: Pedir la página siguiente mientras se procesa la actual
+
+        Yields:
+            Sesiones, en el orden de la API
+
+        Example:
+            >>> for session in client.sessions.iter_all(status="WORKING"):
+            ...     print(session.name)
+        """
+
+        def fetch(offset: int, limit: int) -> Tuple[List[Session], int]:
+            content = self._client.request_bytes(
+                "GET", "sessions", params=self._page_params(offset, limit, status)
+            )
+            return self._parse(content, SessionList, envelope=False).data, len(content)
+
+        sizer = PageSizer(initial=page_size, maximum=max_page_size)
+        return iter_items(iter_pages(fetch, sizer, prefetch, aligned=True))
+
+    def aiter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 20,
+        max_page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Session]:
+        """Versión asíncrona de iter_all(); se usa con ``async for``."""
+
+        async def fetch(offset: int, limit: int) -> Tuple[List[Session], int]:
+            content = await self._client.request_bytes_async(
+                "GET", "sessions", params=self._page_params(offset, limit, status)
+            )
+            return self._parse(content, SessionList, envelope=False).data, len(content)
+
+        sizer = PageSizer(initial=page_size, maximum=max_page_size)
+        return aiter_items(aiter_pages(fetch, sizer, prefetch, aligned=True))
+
+    @staticmethod
+    def _page_params(offset: int, limit: int, status: Optional[str]) -> Dict[str, Any]:
+        """Convierte un offset alineado al limit en los parámetros page/limit."""
+        params: Dict[str, Any] = {"page": offset // limit + 1, "limit": limit}
+        if status:
+            params["status"] = status
+        return params
 
     def get(self, session_id: str) -> Session:
         """
@@ -103,13 +235,11 @@ class SessionsResource(BaseResource):
             >>> session = client.sessions.get("64abc123...")
             >>> print(session.status)
         """
-        response = self._client.get(f"sessions/{session_id}")
-        return Session(**response["data"])
+        return self._request_model("GET", f"sessions/{session_id}", Session)
 
     async def get_async(self, session_id: str) -> Session:
         """Versión asíncrona de get()."""
-        response = await self._client.get_async(f"sessions/{session_id}")
-        return Session(**response["data"])
+        return await self._request_model_async("GET", f"sessions/{session_id}", Session)
 
     def get_qr(self, session_id: str, format: str = "json") -> QRCode:
         """
@@ -127,14 +257,14 @@ class SessionsResource(BaseResource):
             >>> print(qr.qr)  # String base64 o datos del QR
         """
         params = {"format": format}
-        response = self._client.get(f"sessions/{session_id}/qr", params=params)
-        return QRCode(**response["data"])
+        return self._request_model("GET", f"sessions/{session_id}/qr", QRCode, params=params)
 
     async def get_qr_async(self, session_id: str, format: str = "json") -> QRCode:
         """Versión asíncrona de get_qr()."""
         params = {"format": format}
-        response = await self._client.get_async(f"sessions/{session_id}/qr", params=params)
-        return QRCode(**response["data"])
+        return await self._request_model_async(
+            "GET", f"sessions/{session_id}/qr", QRCode, params=params
+        )
 
     def request_pairing_code(self, session_id: str, phone_number: str) -> PairingCode:
         """
@@ -152,16 +282,18 @@ class SessionsResource(BaseResource):
             >>> print(code.code)
         """
         payload = {"phoneNumber": phone_number}
-        response = self._client.post(f"sessions/{session_id}/pair", json_data=payload)
-        return PairingCode(**response["data"])
+        return self._request_model(
+            "POST", f"sessions/{session_id}/pair", PairingCode, json_data=payload
+        )
 
     async def request_pairing_code_async(
         self, session_id: str, phone_number: str
     ) -> PairingCode:
         """Versión asíncrona de request_pairing_code()."""
         payload = {"phoneNumber": phone_number}
-        response = await self._client.post_async(f"sessions/{session_id}/pair", json_data=payload)
-        return PairingCode(**response["data"])
+        return await self._request_model_async(
+            "POST", f"sessions/{session_id}/pair", PairingCode, json_data=payload
+        )
 
     def start(self, session_id: str) -> Session:
         """
@@ -177,13 +309,11 @@ class SessionsResource(BaseResource):
             >>> session = client.sessions.start("64abc123...")
             >>> print(session.status)  # STARTING
         """
-        response = self._client.post(f"sessions/{session_id}/start")
-        return Session(**response["data"])
+        return self._request_model("POST", f"sessions/{session_id}/start", Session)
 
     async def start_async(self, session_id: str) -> Session:
         """Versión asíncrona de start()."""
-        response = await self._client.post_async(f"sessions/{session_id}/start")
-        return Session(**response["data"])
+        return await self._request_model_async("POST", f"sessions/{session_id}/start", Session)
 
     def stop(self, session_id: str) -> Session:
         """
@@ -199,13 +329,11 @@ class SessionsResource(BaseResource):
             >>> session = client.sessions.stop("64abc123...")
             >>> print(session.status)  # STOPPED
         """
-        response = self._client.post(f"sessions/{session_id}/stop")
-        return Session(**response["data"])
+        return self._request_model("POST", f"sessions/{session_id}/stop", Session)
 
     async def stop_async(self, session_id: str) -> Session:
         """Versión asíncrona de stop()."""
-        response = await self._client.post_async(f"sessions/{session_id}/stop")
-        return Session(**response["data"])
+        return await self._request_model_async("POST", f"sessions/{session_id}/stop", Session)
 
     def update(self, session_id: str, data: Union[SessionUpdate, Dict[str, Any]]) -> Session:
         """
@@ -229,8 +357,7 @@ class SessionsResource(BaseResource):
         else:
             payload = data
 
-        response = self._client.patch(f"sessions/{session_id}", json_data=payload)
-        return Session(**response["data"])
+        return self._request_model("PATCH", f"sessions/{session_id}", Session, json_data=payload)
 
     async def update_async(
         self, session_id: str, data: Union[SessionUpdate, Dict[str, Any]]
@@ -241,8 +368,9 @@ class SessionsResource(BaseResource):
         else:
             payload = data
 
-        response = await self._client.patch_async(f"sessions/{session_id}", json_data=payload)
-        return Session(**response["data"])
+        return await self._request_model_async(
+            "PATCH", f"sessions/{session_id}", Session, json_data=payload
+        )
 
     def delete(self, session_id: str) -> Dict[str, Any]:
         """
@@ -258,8 +386,8 @@ class SessionsResource(BaseResource):
             >>> result = client.sessions.delete("64abc123...")
             >>> print(result["message"])
         """
-        return self._client.delete(f"sessions/{session_id}")
+        return self._request("DELETE", f"sessions/{session_id}")
 
     async def delete_async(self, session_id: str) -> Dict[str, Any]:
         """Versión asíncrona de delete()."""
-        return await self._client.delete_async(f"sessions/{session_id}")
+        return await self._request_async("DELETE", f"sessions/{session_id}")
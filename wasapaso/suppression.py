@@ -0,0 +1,175 @@
+"""Lista de supresión (opt-out) respaldada por un archivo mapeado en memoria."""
+
+import mmap
+import os
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional, Tuple, Union
+
+from wasapaso._utils import hash_number
+
+MAGIC = b"WSPSUP01"
+
+_Signature = Tuple[int, int, int]
+
+# Los hashes se guardan en little-endian; en esa plataforma se leen sin copiar
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SuppressionList:
+    """
+    Lista de números que nunca deben recibir mensajes.
+
+    El archivo contiene una cabecera de 8 bytes seguida de un arreglo
+    ordenado de hashes de 64 bits sin signo en little-endian de los números
+    normalizados, así que es portable entre plataformas. El archivo se
+    mapea en memoria en modo sólo lectura, así que varios procesos que
+    abren la misma lista comparten las páginas del page cache del sistema
+    operativo, y cada consulta es una búsqueda binaria de unos pocos
+    microsegundos. En plataformas big-endian los hashes se copian a memoria
+    al cargar el archivo.
+
+    Cuando el archivo se reemplaza (por ejemplo con :meth:`build`, que
+    escribe en un archivo temporal y lo renombra), la lista se recarga de
+    forma atómica en la siguiente consulta y el mapeo anterior se cierra.
+    Si el archivo nuevo no es válido (por ejemplo, una copia que todavía no
+    terminó), se sigue usando la versión anterior y se vuelve a intentar en
+    la comprobación siguiente. El archivo debe reemplazarse, no reescribirse
+    en el lugar: truncar el archivo mapeado invalida el mapeo en uso.
+
+    Example:
+        >>> SuppressionList.build(opted_out_numbers, "suppression.bin")
+        >>> suppression = SuppressionList("suppression.bin")
+        >>> "1234567890" in suppression
+        True
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], check_interval: float = 1.0) -> None:
+        """
+        Abre una lista de supresión.
+
+        Args:
+            path: Ruta del archivo generado con :meth:`build`
+            check_interval: Segundos entre comprobaciones de cambios en el archivo
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self.path = os.fspath(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._state = self._load()
+        self._next_check = time.monotonic() + check_interval
+
+    @staticmethod
+    def build(numbers: Iterable[str], path: Union[str, "os.PathLike[str]"]) -> int:
+        """
+        Genera el archivo de una lista de supresión.
+
+        El archivo se escribe en un temporal del mismo directorio y luego se
+        renombra, por lo que los lectores nunca ven un archivo a medio escribir.
+
+        Args:
+            numbers: Números de teléfono o IDs de WhatsApp a suprimir
+            path: Ruta del archivo de destino
+
+        Returns:
+            Cantidad de entradas distintas escritas
+        """
+        path = os.fspath(path)
+        hashes = array("Q", sorted({hash_number(number) for number in numbers}))
+        if not _NATIVE_LITTLE_ENDIAN:
+            hashes.byteswap()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".suppression-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                hashes.tofile(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return len(hashes)
+
+    def _signature(self) -> _Signature:
+        """Identifica la versión actual del archivo en disco."""
+        st = os.stat(self.path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _load(self) -> Tuple[_Signature, Optional[mmap.mmap], "memoryview"]:
+        """Mapea el archivo en memoria y valida su cabecera."""
+        signature = self._signature()
+        with open(self.path, "rb") as f:
+            header = f.read(len(MAGIC))
+            if header != MAGIC:
+                raise ValueError(f"{self.path} is not a suppression list file")
+            if signature[2] == len(MAGIC):
+                return signature, None, memoryview(array("Q"))
+            if (signature[2] - len(MAGIC)) % 8:
+                raise ValueError(f"{self.path} is truncated")
+            if not _NATIVE_LITTLE_ENDIAN:
+                hashes = array("Q", f.read())
+                hashes.byteswap()
+                return signature, None, memoryview(hashes)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)[len(MAGIC) :].cast("Q")
+        return signature, mapped, view
+
+    def reload_if_changed(self) -> bool:
+        """
+        Recarga el archivo si cambió en disco.
+
+        La nueva vista reemplaza a la anterior bajo el mismo lock que usan
+        las consultas, que ven la versión vieja o la nueva, nunca un estado
+        intermedio; luego se cierra el mapeo anterior. Si el archivo nuevo
+        no se puede cargar, se conserva la versión anterior.
+
+        Returns:
+            True si la lista se recargó
+        """
+        with self._lock:
+            return self._reload_if_changed()
+
+    def _reload_if_changed(self) -> bool:
+        """Recarga el archivo si cambió en disco (con el lock tomado)."""
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            if self._signature() == self._state[0]:
+                return False
+            state = self._load()
+        except (OSError, ValueError):
+            return False
+        _, old_mapped, old_view = self._state
+        self._state = state
+        old_view.release()
+        if old_mapped is not None:
+            old_mapped.close()
+        return True
+
+    def __contains__(self, number: object) -> bool:
+        """Indica si el número está suprimido (los números no textuales se convierten con str())."""
+        if number is None:
+            return False
+        key = hash_number(str(number))
+        with self._lock:
+            if time.monotonic() >= self._next_check:
+                self._reload_if_changed()
+            view = self._state[2]
+            index = bisect_left(view, key)
+            return index < len(view) and view[index] == key
+
+    def __len__(self) -> int:
+        """Cantidad de entradas de la lista."""
+        with self._lock:
+            return len(self._state[2])
+
+    def __repr__(self) -> str:
+        """Representación de la lista."""
+        return f"SuppressionList(path={self.path!r}, entries={len(self)})"
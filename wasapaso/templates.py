@@ -0,0 +1,203 @@
+"""Plantillas compiladas para personalizar mensajes en envíos masivos."""
+
+import itertools
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from wasapaso.exceptions import TemplateError
+
+# (nombre, especificación de formato, conversión)
+_FieldKey = Tuple[str, str, Optional[str]]
+
+
+class RenderedBatch(NamedTuple):
+    """Resultado de renderizar un lote columnar."""
+
+    texts: List[Optional[str]]
+    """Texto por registro, o None si el registro tuvo un error."""
+
+    errors: Dict[int, str]
+    """Errores de renderizado por índice de registro."""
+
+
+def _convert(value: Any, conversion: Optional[str]) -> Any:
+    """Aplica la conversión ``!r``, ``!s`` o ``!a`` de un placeholder."""
+    if conversion == "r":
+        return repr(value)
+    if conversion == "a":
+        return ascii(value)
+    if conversion == "s":
+        return str(value)
+    return value
+
+
+class MessageTemplate:
+    """
+    Plantilla de mensaje compilada una única vez.
+
+    Usa la sintaxis de ``str.format`` con placeholders con nombre, que
+    pueden llevar especificación de formato y conversión:
+    ``"Hola {nombre}, tu pedido {pedido} llega el {fecha:%d/%m}"``.
+
+    La plantilla se analiza en el constructor; :meth:`validate` comprueba
+    los placeholders contra el esquema de los registros antes de empezar un
+    envío, y :meth:`render_columns` renderiza lotes columnares (un
+    diccionario de columnas) formateando cada columna de una sola pasada.
+
+    Example:
+        >>> template = MessageTemplate("Hola {nombre}, tu pedido {pedido} está listo")
+        >>> template.validate(["telefono", "nombre", "pedido"])
+        >>> batch = template.render_columns({
+        ...     "nombre": ["Ana", "Luis"],
+        ...     "pedido": [1001, 1002],
+        ... })
+        >>> batch.texts
+        ['Hola Ana, tu pedido 1001 está listo', 'Hola Luis, tu pedido 1002 está listo']
+    """
+
+    def __init__(self, source: str) -> None:
+        """
+        Compila una plantilla.
+
+        Args:
+            source: Texto de la plantilla
+
+        Raises:
+            TemplateError: Si la plantilla tiene errores de sintaxis o placeholders no soportados
+        """
+        self.source = source
+        literals: List[str] = []
+        fields: List[_FieldKey] = []
+        pending = ""
+
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise TemplateError(f"Invalid template: {e}") from e
+
+        for literal, name, spec, conversion in parsed:
+            pending += literal
+            if name is None:
+                continue
+            if not name.isidentifier():
+                raise TemplateError(f"Unsupported placeholder {{{name}}}: use simple named fields")
+            if spec and "{" in spec:
+                raise TemplateError(f"Nested placeholders are not supported in {{{name}}}")
+            literals.append(pending)
+            fields.append((name, spec or "", conversion))
+            pending = ""
+        literals.append(pending)
+
+        self._literals = literals
+        self._fields = fields
+
+    @property
+    def fields(self) -> List[str]:
+        """Nombres de los placeholders, sin repetir y en orden de aparición."""
+        return list(dict.fromkeys(name for name, _, _ in self._fields))
+
+    def validate(self, schema: Iterable[str]) -> None:
+        """
+        Comprueba que el esquema de los registros tenga todos los placeholders.
+
+        Args:
+            schema: Nombres de los campos (o columnas) de los registros
+
+        Raises:
+            TemplateError: Si faltan campos requeridos por la plantilla
+        """
+        available = set(schema)
+        missing = [name for name in self.fields if name not in available]
+        if missing:
+            raise TemplateError(
+                f"Template fields missing from records: {', '.join(missing)}",
+                response_data={"missing": missing},
+            )
+
+    def _format(self, key: _FieldKey, value: Any) -> str:
+        """Formatea un valor para un placeholder."""
+        name, spec, conversion = key
+        if value is None:
+            raise ValueError("missing value")
+        return format(_convert(value, conversion), spec)
+
+    def render(self, record: Mapping[str, Any]) -> str:
+        """
+        Renderiza la plantilla para un registro.
+
+        Args:
+            record: Valores de los placeholders
+
+        Returns:
+            El texto del mensaje
+
+        Raises:
+            TemplateError: Si falta un valor o no puede formatearse
+        """
+        parts = [self._literals[0]]
+        for key, literal in zip(self._fields, self._literals[1:]):
+            try:
+                parts.append(self._format(key, record.get(key[0])))
+            except (ValueError, TypeError) as e:
+                raise TemplateError(f"{key[0]}: {e}") from e
+            parts.append(literal)
+        return "".join(parts)
+
+    def render_columns(
+        self, columns: Mapping[str, Sequence[Any]], size: Optional[int] = None
+    ) -> RenderedBatch:
+        """
+        Renderiza un lote columnar.
+
+        Cada placeholder se formatea recorriendo su columna una única vez;
+        los textos se arman luego en paralelo sobre todas las columnas. Un
+        error en un registro no interrumpe el lote: ese registro queda en
+        None y el error se reporta en ``errors``.
+
+        Args:
+            columns: Diccionario de columnas (listas, tuplas o arreglos) del mismo largo
+            size: Cantidad de registros del lote (necesario si la plantilla no tiene placeholders)
+
+        Returns:
+            Textos renderizados y errores por índice de registro
+
+        Raises:
+            TemplateError: Si faltan columnas o tienen largos distintos
+        """
+        self.validate(columns.keys())
+        lengths = {len(columns[name]) for name in self.fields}
+        if size is not None:
+            lengths.add(size)
+        if len(lengths) > 1:
+            raise TemplateError("All template columns must have the same length")
+        size = lengths.pop() if lengths else 0
+
+        errors: Dict[int, str] = {}
+        formatted: Dict[_FieldKey, List[str]] = {}
+        for key in self._fields:
+            if key in formatted:
+                continue
+            name, spec, conversion = key
+            out: List[str] = []
+            append = out.append
+            plain = not spec and conversion is None
+            for index, value in enumerate(columns[name]):
+                if plain and value.__class__ is str:
+                    append(value)
+                    continue
+                try:
+                    append(self._format(key, value))
+                except (ValueError, TypeError) as e:
+                    errors.setdefault(index, f"{name}: {e}")
+                    append("")
+            formatted[key] = out
+
+        pieces: List[Iterable[str]] = [itertools.repeat(self._literals[0], size)]
+        for key, literal in zip(self._fields, self._literals[1:]):
+            pieces.append(formatted[key])
+            pieces.append(itertools.repeat(literal, size))
+
+        texts: List[Optional[str]] = ["".join(parts) for parts in zip(*pieces)]
+        for index in errors:
+            texts[index] = None
+        return RenderedBatch(texts, errors)
@@ -0,0 +1,360 @@
+"""Índice de hilos de respuesta entre mensajes archivados."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from wasapaso.archive import MessageArchive
+from wasapaso.exceptions import NotFoundError
+from wasapaso.models.message import Message
+from wasapaso.pagination import MessageCursor
+
+if TYPE_CHECKING:
+    from wasapaso.client import WasapasoClient
+    from wasapaso.resources.messages import MessagesResource
+
+# Por mensaje: cursor, message_id y referencia al mensaje al que responde
+_Node = Tuple[MessageCursor, str, Optional[str]]
+
+
+class ThreadIndex:
+    """
+    Índice local de los hilos de respuesta (``reply_to``) entre mensajes.
+
+    Mapea cada mensaje a aquel al que responde y a sus respuestas, así que
+    :meth:`chain` (la cadena de respuestas hasta un mensaje) y
+    :meth:`thread` (el hilo completo) se contestan sin consultar la API:
+    la estructura vive en memoria y los mensajes se leen del archivo en
+    una sola consulta. El índice se construye a partir del
+    :class:`~wasapaso.archive.MessageArchive` y se pone al día de forma
+    incremental con :meth:`refresh`, que sólo lee los mensajes archivados
+    desde la última vez. Las referencias pueden ser el ``id`` o el
+    ``message_id`` del mensaje respondido.
+
+    Un mensaje que se vuelve a guardar en el archivo conserva su posición,
+    así que :meth:`refresh` no lo relee: los cambios de un mensaje ya
+    indexado (por ejemplo su ``reply_to``) se indexan al guardarlo con
+    :meth:`add`, no con ``archive.add()``.
+
+    Los mensajes respondidos que no están archivados se piden a la API con
+    :meth:`resolve_missing`, que en cada ronda pide a la vez todos los que
+    faltan en el nivel siguiente de todos los hilos, así que hace tantas
+    rondas como niveles faltantes y no una petición tras otra por mensaje.
+
+    Example:
+        >>> index = ThreadIndex(archive, client=client)
+        >>> index.resolve_missing(["65f0a1..."])
+        >>> for message in index.chain("65f0a1..."):
+        ...     print(message.body)
+    """
+
+    def __init__(
+        self,
+        archive: MessageArchive,
+        client: Optional["WasapasoClient"] = None,
+        concurrency: int = 8,
+    ) -> None:
+        """
+        Crea el índice con los mensajes ya archivados.
+
+        Args:
+            archive: Archivo local de mensajes
+            client: Cliente con el que pedir los mensajes faltantes (opcional)
+            concurrency: Cantidad máxima de mensajes pedidos a la vez
+        """
+        self.archive = archive
+        self._messages = client.messages if client is not None else None
+        self.concurrency = concurrency
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, _Node] = {}
+        # message_id -> id
+        self._aliases: Dict[str, str] = {}
+        # Referencia (id o message_id) -> ids de sus respuestas
+        self._replies: Dict[str, List[str]] = {}
+        # Referencias que la API no encontró
+        self._unavailable: Set[str] = set()
+        # Posición del último mensaje archivado ya indexado
+        self._position = 0
+        self.refresh()
+
+    def __len__(self) -> int:
+        """Cantidad de mensajes indexados."""
+        return len(self._nodes)
+
+    def __contains__(self, message_id: object) -> bool:
+        """Si el mensaje (por ``id`` o ``message_id``) está indexado."""
+        return isinstance(message_id, str) and self._resolve(message_id) is not None
+
+    def refresh(self) -> int:
+        """
+        Indexa los mensajes archivados desde la última actualización.
+
+        Returns:
+            Cantidad de mensajes leídos del archivo
+        """
+        count = 0
+        with self._lock:
+            for position, message in self.archive.scan(self._position):
+                self._index(message)
+                self._position = position
+                count += 1
+        return count
+
+    def add(self, messages: Iterable[Message]) -> int:
+        """
+        Archiva mensajes y los indexa.
+
+        Los mensajes que ya estaban indexados se reemplazan por la versión nueva.
+
+        Args:
+            messages: Mensajes a agregar
+
+        Returns:
+            Cantidad de mensajes nuevos leídos del archivo
+        """
+        messages = list(messages)
+        self.archive.add(messages)
+        with self._lock:
+            count = self.refresh()
+            # Los que ya estaban archivados conservan su posición y refresh()
+            # no los relee
+            for message in messages:
+                self._index(message)
+        return count
+
+    def _index(self, message: Message) -> None:
+        """Agrega o reemplaza un mensaje en la estructura (con el lock tomado)."""
+        node = (MessageCursor.of(message), message.message_id, message.reply_to)
+        previous = self._nodes.get(message.id)
+        if previous == node:
+            return
+        if previous is not None:
+            if self._aliases.get(previous[1]) == message.id:
+                del self._aliases[previous[1]]
+            if previous[2]:
+                replies = self._replies[previous[2]]
+                replies.remove(message.id)
+                if not replies:
+                    del self._replies[previous[2]]
+        self._nodes[message.id] = node
+        self._aliases[message.message_id] = message.id
+        if message.reply_to:
+            self._replies.setdefault(message.reply_to, []).append(message.id)
+
+    def _resolve(self, reference: str) -> Optional[str]:
+        """ID del mensaje indexado al que apunta una referencia."""
+        return reference if reference in self._nodes else self._aliases.get(reference)
+
+    def _ancestry(self, message_id: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Sube desde un mensaje por los mensajes a los que responde.
+
+        Returns:
+            Los ids desde la raíz conocida hasta el mensaje, y la referencia
+            del primer mensaje que no está indexado (None si se llegó a la raíz)
+        """
+        chain: List[str] = []
+        seen: Set[str] = set()
+        current = self._resolve(message_id)
+        while current is not None and current not in seen:
+            chain.append(current)
+            seen.add(current)
+            reference = self._nodes[current][2]
+            if reference is None:
+                break
+            parent = self._resolve(reference)
+            if parent is None:
+                chain.reverse()
+                return chain, reference
+            current = parent
+        chain.reverse()
+        return chain, None
+
+    def parent(self, message_id: str) -> Optional[str]:
+        """
+        Devuelve el mensaje al que responde un mensaje.
+
+        Args:
+            message_id: ``id`` o ``message_id`` del mensaje
+
+        Returns:
+            El id del mensaje respondido, o None si no responde a otro o no
+            está indexado
+        """
+        with self._lock:
+            current = self._resolve(message_id)
+            reference = self._nodes[current][2] if current is not None else None
+            return self._resolve(reference) if reference is not None else None
+
+    def children(self, message_id: str) -> List[str]:
+        """
+        Devuelve las respuestas directas a un mensaje, de la más antigua a la más reciente.
+
+        Args:
+            message_id: ``id`` o ``message_id`` del mensaje
+
+        Returns:
+            Los ids de las respuestas indexadas
+        """
+        with self._lock:
+            current = self._resolve(message_id)
+            if current is None:
+                return self._sorted(self._replies.get(message_id, ()))
+            return self._sorted(self._replies_of(current))
+
+    def _replies_of(self, current: str) -> List[str]:
+        """Respuestas a un mensaje indexado, con cualquiera de sus dos ids."""
+        alias = self._nodes[current][1]
+        replies = list(self._replies.get(current, ()))
+        if alias != current:
+            replies.extend(self._replies.get(alias, ()))
+        return replies
+
+    def _sorted(self, ids: Iterable[str]) -> List[str]:
+        """Ordena ids indexados de más antiguo a más reciente."""
+        return sorted(set(ids), key=lambda current: self._nodes[current][0])
+
+    def _load(self, ids: List[str]) -> List[Message]:
+        """Lee del archivo los mensajes de una lista de ids, en ese orden."""
+        found = self.archive.get_many(ids)
+        return [found[current] for current in ids if current in found]
+
+    def chain(self, message_id: str) -> List[Message]:
+        """
+        Devuelve la cadena de respuestas que termina en un mensaje, sin consultar la API.
+
+        Args:
+            message_id: ``id`` o ``message_id`` del mensaje
+
+        Returns:
+            Los mensajes desde el más antiguo indexado de la cadena hasta el
+            pedido (vacía si el mensaje no está indexado)
+        """
+        with self._lock:
+            ids, _ = self._ancestry(message_id)
+        return self._load(ids)
+
+    def thread(self, message_id: str) -> List[Message]:
+        """
+        Devuelve el hilo completo de un mensaje, sin consultar la API.
+
+        Args:
+            message_id: ``id`` o ``message_id`` de cualquier mensaje del hilo
+
+        Returns:
+            La raíz indexada del hilo y todas sus respuestas (directas o no),
+            de la más antigua a la más reciente (vacía si el mensaje no está
+            indexado)
+        """
+        with self._lock:
+            ids, _ = self._ancestry(message_id)
+            if not ids:
+                return []
+            members = [ids[0]]
+            seen = {ids[0]}
+            for current in members:
+                for reply in self._replies_of(current):
+                    if reply not in seen:
+                        seen.add(reply)
+                        members.append(reply)
+            ordered = self._sorted(members)
+        return self._load(ordered)
+
+    def missing(self, message_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        Devuelve las referencias a mensajes respondidos que no están indexados.
+
+        Args:
+            message_ids: Mensajes cuyas cadenas revisar (None para todo el índice)
+
+        Returns:
+            Las referencias faltantes, sin las que la API ya no encontró
+        """
+        with self._lock:
+            if message_ids is None:
+                references = {
+                    reference
+                    for _, _, reference in self._nodes.values()
+                    if reference is not None and self._resolve(reference) is None
+                }
+            else:
+                references = set()
+                for message_id in message_ids:
+                    _, reference = self._ancestry(message_id)
+                    if reference is not None:
+                        references.add(reference)
+            return references - self._unavailable
+
+    def _store(self, fetched: Dict[str, Optional[Message]]) -> int:
+        """Indexa los mensajes pedidos a la API y descarta las referencias sin resolver."""
+        self.add(message for message in fetched.values() if message is not None)
+        with self._lock:
+            for reference in fetched:
+                if self._resolve(reference) is None:
+                    self._unavailable.add(reference)
+        return sum(message is not None for message in fetched.values())
+
+    def _client_messages(self) -> "MessagesResource":
+        """Recurso de mensajes del cliente; ValueError si el índice no tiene cliente."""
+        if self._messages is None:
+            raise ValueError("ThreadIndex needs a client to resolve missing messages")
+        return self._messages
+
+    def resolve_missing(self, message_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Pide a la API los mensajes respondidos que faltan en las cadenas.
+
+        Cada ronda pide a la vez, como mucho ``concurrency`` en paralelo,
+        todos los mensajes faltantes del nivel siguiente. Los mensajes que
+        la API no encuentra no se vuelven a pedir.
+
+        Args:
+            message_ids: Mensajes cuyas cadenas completar (None para todo el índice)
+
+        Returns:
+            Cantidad de mensajes obtenidos de la API
+
+        Raises:
+            ValueError: Si el índice no tiene cliente
+        """
+        messages_resource = self._client_messages()
+
+        def fetch(reference: str) -> Optional[Message]:
+            try:
+                return messages_resource.get(reference)
+            except NotFoundError:
+                return None
+
+        targets = None if message_ids is None else list(message_ids)
+        total = 0
+        with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as executor:
+            while True:
+                self.refresh()
+                references = sorted(self.missing(targets))
+                if not references:
+                    return total
+                messages = executor.map(fetch, references)
+                total += self._store(dict(zip(references, messages)))
+
+    async def resolve_missing_async(self, message_ids: Optional[Iterable[str]] = None) -> int:
+        """Versión asíncrona de resolve_missing()."""
+        messages_resource = self._client_messages()
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def fetch(reference: str) -> Optional[Message]:
+            async with semaphore:
+                try:
+                    return await messages_resource.get_async(reference)
+                except NotFoundError:
+                    return None
+
+        targets = None if message_ids is None else list(message_ids)
+        total = 0
+        while True:
+            self.refresh()
+            references = sorted(self.missing(targets))
+            if not references:
+                return total
+            messages = await asyncio.gather(*(fetch(reference) for reference in references))
+            total += self._store(dict(zip(references, messages)))
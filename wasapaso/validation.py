@@ -0,0 +1,226 @@
+"""Validación offline (dry-run) de campañas de envío masivo."""
+
+import itertools
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+from pydantic import ValidationError as PydanticValidationError
+
+from wasapaso._utils import normalize_number
+from wasapaso.models.message import MessageType
+
+_MIMETYPE = re.compile(r"[\w.+-]+/[\w.+-]+\Z")
+
+# Familia de mimetype exigida por cada tipo de media
+_MEDIA_FAMILIES = {
+    MessageType.IMAGE: "image/",
+    MessageType.VIDEO: "video/",
+    MessageType.AUDIO: "audio/",
+    MessageType.FILE: "",
+}
+
+
+class CampaignRow(BaseModel):
+    """
+    Fila de una campaña, con las mismas reglas que send_text(), send_media() y send_location().
+
+    Acepta los nombres de campo en snake_case o con el alias de la API
+    (``sessionId``, ``replyTo``...). Los strings vacíos, habituales en
+    archivos CSV, se tratan como campos ausentes.
+    """
+
+    session_id: str = Field(alias="sessionId")
+    to: str
+    type: MessageType = MessageType.TEXT
+    message: Optional[str] = None
+    media_url: Optional[str] = Field(None, alias="mediaUrl")
+    media_data: Optional[str] = Field(None, alias="mediaData")
+    mimetype: str = "image/jpeg"
+    caption: Optional[str] = None
+    filename: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    title: Optional[str] = None
+    reply_to: Optional[str] = Field(None, alias="replyTo")
+
+    class Config:
+        populate_by_name = True
+
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_empty_strings(cls, data: Any) -> Any:
+        """Descarta los campos vacíos."""
+        if isinstance(data, Mapping):
+            return {key: value for key, value in data.items() if value != ""}
+        return data
+
+    @field_validator("to")
+    @classmethod
+    def _check_recipient(cls, value: str) -> str:
+        """Comprueba que el destinatario sea un número o un ID de WhatsApp válido."""
+        normalized = normalize_number(value)
+        if "@" in normalized:
+            return value
+        if not 7 <= len(normalized) <= 15:
+            raise ValueError("recipient must have between 7 and 15 digits")
+        return value
+
+    @model_validator(mode="after")
+    def _check_type_fields(self) -> "CampaignRow":
+        """Comprueba los campos requeridos por cada tipo de mensaje."""
+        if self.type == MessageType.TEXT:
+            if not self.message:
+                raise ValueError("text messages require 'message'")
+        elif self.type in _MEDIA_FAMILIES:
+            if not self.media_url and not self.media_data:
+                raise ValueError("media messages require 'media_url' or 'media_data'")
+            if not _MIMETYPE.match(self.mimetype):
+                raise ValueError(f"invalid mimetype '{self.mimetype}'")
+            family = _MEDIA_FAMILIES[self.type]
+            if not self.mimetype.startswith(family):
+                raise ValueError(
+                    f"mimetype '{self.mimetype}' does not match media type '{self.type.value}'"
+                )
+        elif self.type == MessageType.LOCATION:
+            if self.latitude is None or self.longitude is None:
+                raise ValueError("location messages require 'latitude' and 'longitude'")
+        else:
+            raise ValueError(f"message type '{self.type.value}' is not supported in campaigns")
+        return self
+
+
+_ROWS_ADAPTER = TypeAdapter(List[CampaignRow])
+
+
+class DryRunReport(BaseModel):
+    """Reporte compacto de una validación dry-run."""
+
+    total: int
+    valid: int
+    invalid: int
+    errors: Dict[int, List[str]]
+    error_counts: Dict[str, int]
+    truncated: bool
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+def _validate_chunk(chunk: Tuple[int, List[Any]]) -> Dict[int, List[str]]:
+    """
+    Valida un bloque de filas.
+
+    Args:
+        chunk: Índice de la primera fila y filas del bloque
+
+    Returns:
+        Errores por índice global de fila
+    """
+    start, rows = chunk
+    try:
+        _ROWS_ADAPTER.validate_python(rows)
+    except PydanticValidationError as e:
+        errors: Dict[int, List[str]] = {}
+        for error in e.errors(include_url=False, include_input=False):
+            loc = error["loc"]
+            row_index = start + int(loc[0]) if loc else start
+            field = ".".join(str(part) for part in loc[1:]) or "row"
+            message = error["msg"].replace("Value error, ", "")
+            errors.setdefault(row_index, []).append(f"{field}: {message}")
+        return errors
+    return {}
+
+
+def _chunks(rows: Iterable[Any], chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    """Divide las filas en bloques numerados."""
+    iterator = iter(rows)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def dry_run(
+    rows: Iterable[Mapping[str, Any]],
+    chunk_size: int = 10_000,
+    processes: Optional[int] = None,
+    max_errors: int = 1000,
+) -> DryRunReport:
+    """
+    Valida una campaña completa sin tocar la red.
+
+    Las filas se validan por bloques con un ``TypeAdapter`` sobre listas,
+    que valida todo el bloque en una sola llamada al núcleo de pydantic.
+    Con ``processes`` mayor que 1 los bloques se reparten en un pool de
+    procesos.
+
+    Args:
+        rows: Filas de la campaña (por ejemplo, un ``csv.DictReader``)
+        chunk_size: Cantidad de filas por bloque
+        processes: Cantidad de procesos (None o 1 valida en el proceso actual)
+        max_errors: Máximo de filas con error incluidas en el reporte
+
+    Returns:
+        Reporte con los errores por fila, conteos por campo y el throughput
+
+    Example:
+        >>> import csv
+        >>> with open("campaign.csv", newline="") as f:
+        ...     report = dry_run(csv.DictReader(f), processes=4)
+        >>> print(report.invalid, report.rows_per_second)
+    """
+    started = time.perf_counter()
+    total = 0
+    invalid = 0
+    errors: Dict[int, List[str]] = {}
+    error_counts: Dict[str, int] = {}
+
+    def consume(chunk_errors: Dict[int, List[str]]) -> None:
+        nonlocal invalid
+        invalid += len(chunk_errors)
+        for row_index in sorted(chunk_errors):
+            messages = chunk_errors[row_index]
+            for message in messages:
+                field = message.split(":", 1)[0]
+                error_counts[field] = error_counts.get(field, 0) + 1
+            if len(errors) < max_errors:
+                errors[row_index] = messages
+
+    def counted(chunks: Iterator[Tuple[int, List[Any]]]) -> Iterator[Tuple[int, List[Any]]]:
+        nonlocal total
+        for chunk in chunks:
+            total += len(chunk[1])
+            yield chunk
+
+    chunks = counted(_chunks(rows, chunk_size))
+    if processes is not None and processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            # Como máximo dos bloques en vuelo por proceso, para acotar la memoria
+            in_flight: Deque[Future[Dict[int, List[str]]]] = deque()
+            for chunk in chunks:
+                in_flight.append(pool.submit(_validate_chunk, chunk))
+                if len(in_flight) >= 2 * processes:
+                    consume(in_flight.popleft().result())
+            while in_flight:
+                consume(in_flight.popleft().result())
+    else:
+        for chunk in chunks:
+            consume(_validate_chunk(chunk))
+
+    elapsed = time.perf_counter() - started
+    return DryRunReport(
+        total=total,
+        valid=total - invalid,
+        invalid=invalid,
+        errors=errors,
+        error_counts=error_counts,
+        truncated=invalid > len(errors),
+        elapsed_seconds=elapsed,
+        rows_per_second=total / elapsed if elapsed > 0 else 0.0,
+    )